@@ -1,35 +1,39 @@
+# Imported first so the cold-start report covers every other import
+import startup
+startup.begin()
+
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import bisect
 import os
-import numpy as np
-from faker import Faker
 import random
 from datetime import datetime, timedelta
 
+import charts
+import components
+import datagen
+import feed_store
+import fixtures
+import indexes
+import leaderboards
+import live_scores
+import persistence
+import profiler
+import registry
+import schema
+import scoring
+import search
+import snapshot
+import views
+from constants import (
+    sports, team_names, venues, match_formats, tournament_formats, roles, issue_types, genders,
+)
+
+startup.mark("imports")
+
 # Set page config for a wider layout and custom title/icon
 st.set_page_config(page_title="Sportsphere", layout="wide", page_icon="🏀")
 
-# --- GLOBAL CONSTANTS (Moved here for wider accessibility) ---
-sports = ['Cricket', 'Football', 'Basketball', 'Badminton', 'Tennis', 'Volleyball']
-team_names = [
-    'Mumbai Mavericks', 'Delhi Dynamos', 'Chennai Chargers', 'Bangalore Blasters',
-    'Kolkata Knights', 'Hyderabad Hawks', 'Pune Panthers', 'Ahmedabad Avengers',
-    'Royal Challengers', 'Super Giants', 'Knight Riders', 'Sunrisers'
-]
-venues = [
-    'Wankhede Stadium', 'Eden Gardens', 'Chinnaswamy Stadium', 'Arun Jaitley Stadium',
-    'MA Chidambaram Stadium', 'Ekana Cricket Stadium', 'Sardar Patel Stadium',
-    'Lords Arena', 'MCG', 'Old Trafford', 'Madison Square Garden', 'Stade de France'
-]
-match_formats = ['T20', 'ODI', 'Test', 'Friendly', 'League', 'Cup Final']
-tournament_formats = ['Knockout', 'Round-robin', 'Group Stage & Playoffs']
-languages = [('en', 'English', True), ('hi', 'Hindi', False), ('es', 'Spanish', False), ('fr', 'French', False)]
-roles = ['Player', 'Scorer', 'Organizer', 'Spectator', 'Coach', 'Umpire']
-issue_types = ['Bug', 'Feature Request', 'Payment Issue', 'Account Issue', 'Other']
-platforms = ['WhatsApp', 'Twitter', 'Facebook', 'Email', 'Instagram', 'LinkedIn']
-
-
 # --- Define Navigation Tabs ---
 tabs = [
     "🏠 Feed", "📊 Cricket Scores", "🏀 Multi-Sport Scores", "🧮 Start Scoring",
@@ -39,336 +43,182 @@ tabs = [
 ]
 
 # --- Data Generation Logic (Cached for Performance) ---
-@st.cache_data
-def generate_all_data():
-    """Generates all synthetic data for the Sportsphere application."""
-    fake = Faker()
-
-    # Set random seed for reproducibility
-    np.random.seed(42)
-    random.seed(42)
-
-    # Helper functions for random dates/timestamps
-    def random_date(start_date, end_date):
-        time_delta = end_date - start_date
-        random_days = random.randint(0, time_delta.days)
-        return start_date + timedelta(days=random_days)
-
-    def random_timestamp(start_date, end_date):
-        time_delta = end_date - start_date
-        random_seconds = random.randint(0, int(time_delta.total_seconds()))
-        return start_date + timedelta(seconds=random_seconds)
-
-    # Constants for data generation
-    # Current date is June 24, 2025. Data should be around this period.
-    start_date_data = datetime(2024, 1, 1)
-    end_date_data = datetime(2025, 12, 31) # Extend to end of current year
-
-    # --- Generate DataFrames ---
-
-    # Feed Data
-    feed_data = {
-        'timestamp': [random_timestamp(start_date_data, end_date_data) for _ in range(500)],
-        'event_type': [random.choice(['Match Result', 'Tournament Announcement', 'MVP Award', 'New Record']) for _ in range(500)],
-        'user_name': [fake.name() for _ in range(500)],
-        'team_name': [random.choice(team_names + ['N/A']) for _ in range(500)], # Allow N/A for non-team events
-        'match_id': [f'MID_{random.randint(1, 900):05d}' for _ in range(500)],
-        'message': [
-            f"{random.choice(['Won by', 'Lost by', 'Declared MVP', 'Set new record'])} {random.randint(1, 100)} {random.choice(['runs', 'wickets', 'points', 'goals', 'medals'])}"
-            for _ in range(500)
-        ]
-    }
-    feed_df = pd.DataFrame(feed_data).sort_values(by='timestamp', ascending=False) # Sort for recency
-
-    # Cricket Scores Data
-    cricket_scores_data = {
-        'match_id': [f'MID_C{i:04d}' for i in range(1, 301)],
-        'team1_name': [random.choice(team_names) for _ in range(300)],
-        'team2_name': [random.choice(team_names) for _ in range(300)],
-        'score_team1': [random.randint(50, 350) for _ in range(300)],
-        'score_team2': [random.randint(50, 350) for _ in range(300)],
-        'overs': [f"{random.randint(1, 50)}.{random.randint(0, 5)}" for _ in range(300)],
-        'wickets': [random.randint(0, 10) for _ in range(300)],
-        'status': [random.choice(['Live', 'Completed', 'Upcoming']) for _ in range(300)],
-        'current_inning': [random.choice([1, 2]) for _ in range(300)],
-        'location': [random.choice(venues) for _ in range(300)],
-        'match_date': [random_date(start_date_data, end_date_data + timedelta(days=90)) for _ in range(300)] # Extend date range for upcoming
-    }
-    cricket_scores_df = pd.DataFrame(cricket_scores_data)
-
-    # Multi-Sport Scores Data
-    multi_sport_scores_data = {
-        'sport_name': [random.choice([s for s in sports if s != 'Cricket']) for _ in range(300)],
-        'match_id': [f'MID_M{i:04d}' for i in range(1, 301)],
-        'team1': [random.choice(team_names) for _ in range(300)],
-        'team2': [random.choice(team_names) for _ in range(300)],
-        'score1': [random.randint(0, 100) for _ in range(300)],
-        'score2': [random.randint(0, 100) for _ in range(300)],
-        'time_elapsed': [f"{random.randint(0, 90)}:{random.randint(0, 59):02d}" for _ in range(300)],
-        'status': [random.choice(['Live', 'Completed', 'Upcoming']) for _ in range(300)]
-    }
-    multi_sport_scores_df = pd.DataFrame(multi_sport_scores_data)
-
-    # Start Match Data (for scoring)
-    start_match_data = {
-        'match_id': [f'MID_S{i:04d}' for i in range(1, 101)],
-        'sport_type': [random.choice(sports) for _ in range(100)],
-        'teams': [[random.choice(team_names), random.choice(team_names)] for _ in range(100)],
-        'start_time': [random_timestamp(start_date_data, end_date_data) for _ in range(100)],
-        'venue': [random.choice(venues) for _ in range(100)],
-        'umpires': [fake.name() for _ in range(100)],
-        'scorers': [fake.name() for _ in range(100)],
-        'match_format': [random.choice(match_formats) for _ in range(100)],
-        'number_of_overs': [random.choice([20, 50, None]) for _ in range(100)],
-        'status': [random.choice(['Scheduled', 'In Progress', 'Completed']) for _ in range(100)]
-    }
-    start_match_df = pd.DataFrame(start_match_data)
-
-    # Tournament Data
-    tournament_data = {
-        'tournament_id': [f'TID_{i:04d}' for i in range(1, 51)],
-        'name': [f"{fake.word().capitalize()} Cup {random.randint(2024, 2026)}" for _ in range(50)],
-        'organizer': [fake.name() for _ in range(50)],
-        'start_date': [random_date(start_date_data, end_date_data) for _ in range(50)],
-        'end_date': [random_date(start_date_data, end_date_data) + timedelta(days=random.randint(5, 30)) for _ in range(50)],
-        'teams_list': [random.sample(team_names, k=random.randint(4, 8)) for _ in range(50)],
-        'location': [random.choice(venues) for _ in range(50)],
-        'match_ids': [[f'MID_{random.randint(1,900):05d}' for _ in range(random.randint(5, 15))] for _ in range(50)],
-        'format': [random.choice(tournament_formats) for _ in range(50)]
-    }
-    tournament_df = pd.DataFrame(tournament_data)
-
-    # My Matches Data
-    my_matches_data = {
-        'user_id': [f'UID_{random.randint(1, 1000):04d}' for _ in range(1000)], # Limited user IDs for easier selection
-        'match_id': [random.choice([f'MID_C{i:04d}' for i in range(1, 301)] + [f'MID_M{i:04d}' for i in range(1, 301)]) for _ in range(1000)],
-        'role': [random.choice(roles) for _ in range(1000)],
-        'participation_status': [random.choice(['Confirmed', 'Pending', 'Declined']) for _ in range(1000)],
-        'result': [random.choice(['Won', 'Lost', 'Draw', 'Ongoing']) for _ in range(1000)],
-        'date': [random_date(start_date_data, end_date_data) for _ in range(1000)],
-        'performance_summary': [f"{random.randint(0, 100)} runs, {random.randint(0, 5)} wickets" if random.random() < 0.7 else None for _ in range(1000)]
-    }
-    my_matches_df = pd.DataFrame(my_matches_data)
-
-    # My Teams Data
-    my_teams_data = {
-        'team_id': [f'TEAM_{i:04d}' for i in range(1, 201)],
-        'team_name': [f"{random.choice(team_names)} {chr(65+i % 26)}" for i in range(200)], # Make team names unique
-        'created_by': [fake.name() for _ in range(200)],
-        'sport_type': [random.choice(sports) for _ in range(200)],
-        'players_list': [[fake.name() for _ in range(random.randint(5, 15))] for _ in range(200)],
-        'rating': [round(random.uniform(1, 5), 1) for _ in range(200)],
-        'wins': [random.randint(0, 50) for _ in range(200)],
-        'losses': [random.randint(0, 50) for _ in range(200)],
-        'logo_url': [f"https://picsum.photos/id/{100 + i}/100/100" for i in range(200)], # Placeholder images
-        'captain_id': [f'UID_{random.randint(1, 1000):04d}' for _ in range(200)]
-    }
-    my_teams_df = pd.DataFrame(my_teams_data)
-
-    # My Stats Data
-    my_stats_data = {
-        'user_id': [f'UID_{i:04d}' for i in range(1, 1001)], # Match with user IDs from My Matches/Profile
-        'matches_played': [random.randint(0, 50) for _ in range(1000)],
-        'runs_scored': [random.randint(0, 2000) for _ in range(1000)],
-        'wickets_taken': [random.randint(0, 100) for _ in range(1000)],
-        'catches': [random.randint(0, 50) for _ in range(1000)],
-        'strike_rate': [round(random.uniform(50, 200), 1) for _ in range(1000)],
-        'economy': [round(random.uniform(3, 10), 1) for _ in range(1000)],
-        'average': [round(random.uniform(10, 50), 1) for _ in range(1000)],
-        'MVP_count': [random.randint(0, 10) for _ in range(1000)]
-    }
-    my_stats_df = pd.DataFrame(my_stats_data)
-
-    # Highlights Data
-    highlights_data = {
-        'match_id': [random.choice([f'MID_C{i:04d}' for i in range(1, 301)] + [f'MID_M{i:04d}' for i in range(1, 301)]) for _ in range(200)],
-        'media_type': [random.choice(['Video', 'Image']) for _ in range(200)],
-        'timestamp': [random_timestamp(start_date_data, end_date_data) for _ in range(200)],
-        'player': [fake.name() for _ in range(200)],
-        'event_description': [f"{random.choice(['Six', 'Wicket', 'Catch', 'Goal', 'Dunk'])} by {fake.name()}" for _ in range(200)],
-        'url': [f"https://www.youtube.com/watch?v=dQw4w9WgXcQ" if random.random() > 0.5 else f"https://picsum.photos/id/{200+i}/600/400" for i in range(200)]
-    }
-    highlights_df = pd.DataFrame(highlights_data)
-
-    # Create Account Data (User Registry)
-    create_account_data = {
-        'user_id': [f'UID_{i:04d}' for i in range(1, 10001)],
-        'name': [fake.name() for _ in range(10000)],
-        'email': [fake.email() for _ in range(10000)],
-        'phone': [fake.phone_number() for _ in range(10000)],
-        'gender': [random.choice(['Male', 'Female', 'Other']) for _ in range(10000)],
-        'birthdate': [random_date(datetime(1980, 1, 1), datetime(2005, 1, 1)) for _ in range(10000)],
-        'location': [random.choice(venues) for _ in range(10000)],
-        'joined_date': [random_date(start_date_data, end_date_data) for _ in range(10000)],
-        'sports_interested_in': [random.sample(sports, k=random.randint(1, 4)) for _ in range(10000)],
-        'role': [random.choice(roles) for _ in range(10000)]
-    }
-    create_account_df = pd.DataFrame(create_account_data)
-
-    # Shop Data
-    shop_data = {
-        'product_id': [f'PROD_{i:04d}' for i in range(1, 101)],
-        'name': [f"{random.choice(['Pro', 'Elite', 'Youth', 'Classic'])} {random.choice(['Bat', 'Ball', 'Jersey', 'Shoes', 'Gloves', 'Racket'])} {fake.word().capitalize()}" for _ in range(100)],
-        'price': [round(random.uniform(10, 200), 2) for _ in range(100)],
-        'category': [random.choice(['Equipment', 'Apparel', 'Accessories', 'Footwear']) for _ in range(100)],
-        'description': [fake.sentence() for _ in range(100)],
-        'image_url': [f"https://picsum.photos/id/{300+i}/300/200" for i in range(100)], # Placeholder images
-        'inventory_count': [random.randint(0, 100) for _ in range(100)],
-        'ratings': [round(random.uniform(3, 5), 1) for _ in range(100)],
-        'sold_count': [random.randint(0, 500) for _ in range(100)]
-    }
-    shop_df = pd.DataFrame(shop_data)
-
-    # Profile Data (tied to Create Account Data)
-    # Ensure all user_ids from Create Account have a profile entry
-    profile_data = {
-        'user_id': create_account_df['user_id'].tolist(),
-        'name': create_account_df['name'].tolist(),
-        'photo_url': [f"https://picsum.photos/id/{400+i}/200/200" for i in range(len(create_account_df))], # Placeholder images
-        'teams_joined': [random.sample(team_names, k=random.randint(0, 3)) for _ in range(len(create_account_df))],
-        'matches_played_profile': [random.randint(0, 100) for _ in range(len(create_account_df))], # Separate column for profile
-        'tournaments': [random.randint(0, 15) for _ in range(len(create_account_df))],
-        'bio': [fake.sentence() for _ in range(len(create_account_df))],
-        'location': [random.choice(venues) for _ in range(len(create_account_df))],
-        'achievements': [[random.choice(['MVP', 'Top Scorer', 'Best Bowler', 'Tournament Winner', 'Fair Play Award']) for _ in range(random.randint(0, 5))] for _ in range(len(create_account_df))],
-        'level': [random.randint(1, 100) for _ in range(len(create_account_df))]
-    }
-    profile_df = pd.DataFrame(profile_data)
-
-    # Language Data
-    language_df = pd.DataFrame(languages, columns=['lang_code', 'language_name', 'is_default'])
-
-    # Share App Data
-    share_app_data = {
-        'user_id': [random.choice(create_account_df['user_id'].tolist()) for _ in range(200)],
-        'platform': [random.choice(platforms) for _ in range(200)],
-        'timestamp': [random_timestamp(start_date_data, end_date_data) for _ in range(200)],
-        'shared_to': [random.choice(['Friends', 'Group', 'Public']) for _ in range(200)]
-    }
-    share_app_df = pd.DataFrame(share_app_data)
-
-    # Help & Support Data
-    help_support_data = {
-        'ticket_id': [f'TICKET_{i:04d}' for i in range(1, 201)],
-        'user_id': [random.choice(create_account_df['user_id'].tolist()) for _ in range(200)],
-        'issue_type': [random.choice(issue_types) for _ in range(200)],
-        'description': [fake.paragraph(nb_sentences=3) for _ in range(200)],
-        'status': [random.choice(['Open', 'In Progress', 'Resolved', 'Closed']) for _ in range(200)],
-        'created_at': [random_timestamp(start_date_data, end_date_data) for _ in range(200)],
-        'resolved_at': [random_timestamp(start_date_data, end_date_data) if random.random() < 0.7 else None for _ in range(200)],
-        'agent_id': [f'AGENT_{random.randint(1, 50):04d}' for _ in range(200)]
-    }
-    help_support_df = pd.DataFrame(help_support_data)
-
-    # Contact Us Data
-    contact_us_data = {
-        'contact_id': [f'CONT_{i:04d}' for i in range(1, 201)],
-        'user_id': [random.choice(create_account_df['user_id'].tolist() + ['None']) for _ in range(200)], # Allow non-registered users
-        'name': [fake.name() for _ in range(200)],
-        'email': [fake.email() for _ in range(200)],
-        'message': [fake.paragraph(nb_sentences=4) for _ in range(200)],
-        'timestamp': [random_timestamp(start_date_data, end_date_data) for _ in range(200)],
-        'response_status': [random.choice(['Pending', 'Responded']) for _ in range(200)]
-    }
-    contact_us_df = pd.DataFrame(contact_us_data)
-
-    return {
-        "Feed": feed_df,
-        "Cricket Scores": cricket_scores_df,
-        "Multi-Sport Scores": multi_sport_scores_df, # Correct key
-        "Start Scoring": start_match_df,
-        "Start a Tournament": tournament_df,
-        "My Matches": my_matches_df,
-        "My Teams": my_teams_df,
-        "My Stats": my_stats_df,
-        "Highlights": highlights_df,
-        "Create Account": create_account_df,
-        "Shop": shop_df,
-        "Profile": profile_df,
-        "Change Language": language_df,
-        "Share App": share_app_df,
-        "Help & Support": help_support_df,
-        "Contact Us": contact_us_df
-    }
-
-# Load all datasets using the cached generation function
-data = generate_all_data()
+# Scale factor for the synthetic datasets (1.0 = 10,000 users); set SPORTSPHERE_SCALE for load testing
+DATA_SCALE = float(os.environ.get("SPORTSPHERE_SCALE", "1.0"))
+
+# Memory budget (MB) for loaded datasets plus derived indexes, shared by every session in the process
+CACHE_BUDGET_MB = float(os.environ.get("SPORTSPHERE_CACHE_MB", "1024"))
+
+# Folder holding the columnar snapshot written by generate_data.py
+SNAPSHOT_DIR = os.environ.get("SPORTSPHERE_DATA_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"))
+
+# Rows per generation chunk; the data depends on it. Defaults to the snapshot's, so a snapshot written with
+# generate_data.py --chunk-rows is used rather than regenerated
+CHUNK_ROWS = os.environ.get("SPORTSPHERE_CHUNK_ROWS")
+
+# Datasets loaded while the process starts instead of on first use ("all" or comma-separated names), so a pod
+# is warm by the time it takes traffic
+PRELOAD = os.environ.get("SPORTSPHERE_PRELOAD", "")
+
+# SQLite database holding everything submitted through the forms
+DB_PATH = os.environ.get("SPORTSPHERE_DB", os.path.join(SNAPSHOT_DIR, "sportsphere.db"))
+
+@st.cache_resource
+def get_write_store():
+    """One batched writer per process; form submissions survive restarts."""
+    os.makedirs(os.path.dirname(os.path.abspath(DB_PATH)), exist_ok=True)
+    return persistence.WriteStore(DB_PATH)
+
+@st.cache_resource
+def get_data_registry(scale=DATA_SCALE):
+    """One lazy dataset registry per process: each dataset is loaded or generated the first time a tab uses it."""
+    manifest = snapshot.read_manifest(SNAPSHOT_DIR) or {}
+    chunk_rows = int(CHUNK_ROWS or manifest.get("chunk_rows") or datagen.DEFAULT_CHUNK_ROWS)
+    data = registry.DatasetRegistry(datagen.DataGenerator(seed=42, scale=scale, chunk_rows=chunk_rows), SNAPSHOT_DIR,
+                                    get_write_store(), memory_budget=int(CACHE_BUDGET_MB * 2**20))
+    for name in (list(data) if PRELOAD == "all" else [name.strip() for name in PRELOAD.split(",") if name.strip()]):
+        data[name]
+    return data
+
+@st.cache_resource
+def get_render_metrics():
+    """Per-tab render timings across sessions (SPORTSPHERE_PROFILE=1), also served on a local metrics endpoint."""
+    profiler.install(registry.DatasetRegistry)
+    metrics = profiler.Metrics()
+    return metrics, profiler.serve(metrics)
+
+if profiler.ENABLED:
+    get_render_metrics()
+
+# Datasets are resolved on first access (data["Feed"], ...) and shared by every session in this process
+data = get_data_registry()
+startup.mark("datasets")
+
+def submit_record(dataset, record):
+    """Persists a form submission; returns its new id. The row shows up in ``data[dataset]`` once committed."""
+    return get_write_store().submit(dataset, record, existing_rows=data.generator.rows(dataset))
+
+def submit_records(dataset, records):
+    """``submit_record`` for many records at once; returns their ids in order."""
+    return get_write_store().submit_many(dataset, records, existing_rows=data.generator.rows(dataset))
+
+def show_table(name):
+    """Shows a dataset as a server-paged table, with its integer ids formatted back to ``UID_0001`` style."""
+    version = data.versions[name]  # Read first: the frame is at least this new
+    df = data[name]
+
+    def parse_value(column, text):
+        key = schema.key_spec(column, name)
+        return key.parse(text) if key is not None else None
+
+    components.paged_table(
+        df, key=f"table_{name}", format_page=lambda rows: schema.readable(name, rows),
+        parse_value=parse_value,
+        cached=lambda params, build: get_view_cache().get(f"table:{name}", version, params, build),
+    )
+
+def format_user_id(user_id):
+    return schema.format_key('user_id', user_id)
+
+def list_items(value):
+    """Items of a list-column cell; a row missing from a join has none."""
+    return list(value) if pd.api.types.is_list_like(value) else []
+
+def get_player_index():
+    """Profile + My Stats joined and indexed by user_id, rebuilt only when either dataset changes."""
+    return data.derived("player_index", ("Profile", "My Stats"), indexes.PlayerIndex)
+
+@st.cache_resource
+def get_live_feed():
+    """Seeds the match state store from the score datasets and starts ingesting live events."""
+    return live_scores.start_live_feed(data["Cricket Scores"], data["Multi-Sport Scores"])
+
+def get_feed_store():
+    """Feed events kept newest-first and partitioned by event type and team."""
+    return data.derived("feed_store", ("Feed",),
+                        lambda df: feed_store.FeedStore(df, 'timestamp', ('event_type', 'team_name')),
+                        append=feed_store.FeedStore.extend)
+
+def get_share_store():
+    return data.derived("share_store", ("Share App",), lambda df: feed_store.FeedStore(df, 'timestamp', ('platform',)),
+                        append=feed_store.FeedStore.extend)
+
+def get_contact_store():
+    return data.derived("contact_store", ("Contact Us",), lambda df: feed_store.FeedStore(df, 'timestamp'),
+                        append=feed_store.FeedStore.extend)
+
+def get_roster_index():
+    """Player name -> My Teams rows whose roster lists them."""
+    return data.derived("roster_index", ("My Teams",), lambda df: indexes.MembershipIndex(df['players_list']))
+
+def get_match_history_index():
+    """My Matches grouped by user, newest first, with per-user result counts."""
+    return data.derived("match_history_index", ("My Matches",), indexes.MatchHistoryIndex)
+
+def get_leaderboards():
+    """Per-metric leaderboards over My Stats, segmentable by Profile location, team and level."""
+    return data.derived("leaderboards", ("Profile", "My Stats"), leaderboards.LeaderboardEngine)
+
+@st.cache_resource
+def get_figure_cache():
+    return charts.FigureCache()
+
+def cached_figure(chart, sources, params, build):
+    """A figure over the ``sources`` datasets, shared by every session until one of them changes."""
+    versions = tuple(data.versions[source] for source in sources)
+    return get_figure_cache().get(chart, versions, params, build)
+
+@st.cache_resource
+def get_scoring_engine():
+    """Ball-by-ball state of every cricket match being scored in this process."""
+    return scoring.ScoringEngine()
+
+def get_view_cache():
+    """This session's filtered views, reused across reruns until the filters or the dataset change."""
+    if "view_cache" not in st.session_state:
+        st.session_state["view_cache"] = views.ViewCache()
+    return st.session_state["view_cache"]
+
+@st.cache_resource
+def get_stylesheet():
+    """static/style.css, minified once per process and injected on every run."""
+    return components.stylesheet(os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "style.css"))
+
+def get_profile_search(with_stats=False):
+    """Trigram people search over Profile (only players with My Stats if ``with_stats``)."""
+    if with_stats:
+        return data.derived("stats_profile_search", ("Profile", "My Stats"), search.build_profile_index)
+    return data.derived("profile_search", ("Profile",), search.build_profile_index)
+
+def pick_player(label, user_ids, player_index, key, with_stats=False, limit=20):
+    """A search box over name, location, teams and bio narrowing a player selectbox to the best matches.
+
+    Without a query the selectbox offers the first ``limit`` of ``user_ids`` (sorted); a typed-in id such as
+    ``UID_0042`` selects that player directly.
+    """
+    query = st.text_input("Search Players", key=f"{key}_search", placeholder="Name, location, team, bio or user id")
+    user_id = schema.parse_key('user_id', query)
+    position = bisect.bisect_left(user_ids, user_id) if user_id is not None else len(user_ids)
+    if position < len(user_ids) and user_ids[position] == user_id:
+        matches = [user_id]
+    else:
+        matches = get_profile_search(with_stats).search(query, limit=limit)
+    options = user_ids[:limit] if matches is None else matches
+    if not options:
+        st.info(f"No players match '{query}'.")
+        return None
+    names = dict(zip(options, player_index.table['name'].reindex(options).astype(object)))
+    return st.selectbox(label, options, index=0, key=key,
+                        format_func=lambda user_id: f"{names.get(user_id) or '(no profile)'} · {format_user_id(user_id)}")
+
+def get_product_index():
+    """Token index over Shop name, category and description for ranked product search."""
+    return data.derived("product_index", ("Shop",), search.build_product_index)
 
 # --- Streamlit App Layout and Custom CSS ---
 
-# Custom CSS for better styling (minimal example for a web app feel)
-st.markdown("""
-<style>
-    /* Main content area padding */
-    .st-emotion-cache-nahz7x {
-        padding-top: 2rem;
-        padding-right: 3rem;
-        padding-left: 3rem;
-        padding-bottom: 2rem;
-    }
-    /* Headings */
-    h1, h2, h3, h4 {
-        color: #FF4B4B; /* A sporty red */
-        font-family: 'Segoe UI', sans-serif;
-    }
-    /* Labels for input widgets */
-    .stSelectbox label, .stTextInput label, .stDateInput label, .stTimeInput label, .stNumberInput label, .stRadio label, .stMultiSelect label {
-        font-weight: bold;
-        color: #333333;
-    }
-    /* Buttons styling */
-    .stButton > button {
-        background-color: #FF4B4B;
-        color: white;
-        border-radius: 8px;
-        border: none;
-        padding: 0.6rem 1.2rem;
-        font-weight: bold;
-        transition: all 0.2s ease-in-out;
-    }
-    .stButton > button:hover {
-        background-color: #FF7B7B;
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-    }
-    .stButton > button:active {
-        transform: translateY(0);
-        box-shadow: none;
-    }
-    /* Sidebar styling */
-    div[data-testid="stSidebar"] {
-        background-color: #f0f2f6; /* Light grey for sidebar */
-        border-right: 1px solid #e0e0e0;
-    }
-    .st-emotion-cache-1jmve30 { /* Card-like background for containers with border=True */
-        background-color: #ffffff;
-        padding: 1rem;
-        border-radius: 0.75rem; /* More rounded corners */
-        box-shadow: 0 6px 12px 0 rgba(0,0,0,0.08); /* Stronger shadow */
-        margin-bottom: 1.5rem; /* More space between cards */
-        border: 1px solid #e0e0e0; /* Subtle border */
-    }
-    .stExpander {
-        border: 1px solid #e0e0e0;
-        border-radius: 0.75rem;
-        padding: 0.5rem 1rem;
-        margin-bottom: 1rem;
-        background-color: #f9f9f9;
-    }
-    .stExpander > div > div > p {
-        font-weight: bold;
-        color: #FF4B4B;
-    }
-    /* Metric cards styling */
-    [data-testid="stMetric"] {
-        background-color: #ffffff;
-        padding: 1rem;
-        border-radius: 0.75rem;
-        box-shadow: 0 4px 8px rgba(0,0,0,0.05);
-        border: 1px solid #eee;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS for better styling (minimal example for a web app feel), kept in static/style.css
+st.markdown(get_stylesheet(), unsafe_allow_html=True)
 
 
 # Main app title
@@ -383,39 +233,58 @@ selected_tab = st.sidebar.radio("Go to:", tabs)
 st.markdown(f"## {selected_tab}")
 
 # --- Dynamic Content for Each Tab ---
+profiler.start(selected_tab)
 
 if selected_tab == "🏠 Feed":
     st.markdown("### Recent Activity & News")
     st.write("Stay updated with the latest from your sports world!")
 
     if not data["Feed"].empty:
-        # Sort feed by timestamp for recent events
-        recent_feed = data["Feed"].sort_values(by="timestamp", ascending=False).head(20)
-
-        # Use columns for a more engaging layout
-        cols = st.columns(3)
-        for i, row in recent_feed.iterrows():
-            with cols[i % 3]: # Distribute cards across 3 columns
-                with st.container(border=True): # Use a container to create a card-like effect
-                    st.subheader(f"{row['event_type']}")
-                    st.markdown(f"**Match ID:** {row['match_id']}")
-                    st.write(f"**Team:** {row['team_name']}")
-                    st.write(f"**User:** {row['user_name']}")
-                    st.markdown(f"*{row['message']}*")
-                    st.caption(f"_{row['timestamp'].strftime('%Y-%m-%d %H:%M')}_")
+        feed = get_feed_store()
+        col_event_filter, col_team_filter = st.columns(2)
+        selected_event_type = col_event_filter.selectbox("Filter by Event", ['All'] + feed.partition_values('event_type'))
+        selected_team = col_team_filter.selectbox("Filter by Team", ['All'] + feed.partition_values('team_name'))
+        feed_filters = {column: value for column, value in
+                        (('event_type', selected_event_type), ('team_name', selected_team)) if value != 'All'}
+
+        def render_feed_card(row):
+            st.subheader(f"{row['event_type']}")
+            st.markdown(f"**Match ID:** {row['match_id']}")
+            st.write(f"**Team:** {row['team_name']}")
+            st.write(f"**User:** {row['user_name']}")
+            st.markdown(f"*{row['message']}*")
+            st.caption(f"_{row['timestamp'].strftime('%Y-%m-%d %H:%M')}_")
+
+        # Newest events first, read page by page from the time-ordered feed store (no per-rerun sort)
+        components.load_more_card_grid(lambda limit, cursor: feed.page(limit, cursor, **feed_filters),
+                                        render_feed_card, key="feed_grid", page_size=18,
+                                        reset_on=(selected_event_type, selected_team))
         st.markdown("---")
+        # Expander bodies run even when collapsed, so the chart (and plotly) waits for an explicit opt-in
+        with st.expander("Activity Trends"):
+            if st.toggle("Show chart", key="feed_trend_chart"):
+                feed_bucket = st.radio("Group by", list(charts.BUCKETS), horizontal=True, key="feed_trend_bucket")
+                st.plotly_chart(cached_figure("feed_volume", ("Feed",), (feed_bucket,),
+                                              lambda: charts.feed_volume(data["Feed"], charts.BUCKETS[feed_bucket])),
+                                use_container_width=True)
         # Optional: Show more feed items in a collapsible expander
         with st.expander("View All Feed Items (Tabular)"):
-            st.dataframe(data["Feed"], use_container_width=True)
+            show_table("Feed")
 
 elif selected_tab == "📊 Cricket Scores":
     st.markdown("### Live & Upcoming Cricket Matches")
     st.write("Get real-time updates and schedules for your favorite cricket games.")
 
-    if not data["Cricket Scores"].empty:
-        live_matches = data["Cricket Scores"][data["Cricket Scores"]['status'] == 'Live'].head(5).reset_index(drop=True)
-        upcoming_matches = data["Cricket Scores"][data["Cricket Scores"]['status'] == 'Upcoming'].sort_values(by='match_date').head(5).reset_index(drop=True)
-        completed_matches = data["Cricket Scores"][data["Cricket Scores"]['status'] == 'Completed'].sort_values(by='match_date', ascending=False).head(5).reset_index(drop=True)
+    live_feed = get_live_feed()
+
+    # Only this fragment reruns when scores change; the rest of the page stays put
+    @st.fragment(run_every=live_feed.refresh_seconds)
+    def render_cricket_matches():
+        cricket_df = live_feed.store.frame(live_scores.CRICKET)
+        updated = live_feed.updated_since_last_view(st.session_state, live_scores.CRICKET)
+        live_matches = cricket_df[cricket_df['status'] == 'Live'].head(5).reset_index(drop=True)
+        upcoming_matches = cricket_df[cricket_df['status'] == 'Upcoming'].sort_values(by='match_date').head(5).reset_index(drop=True)
+        completed_matches = cricket_df[cricket_df['status'] == 'Completed'].sort_values(by='match_date', ascending=False).head(5).reset_index(drop=True)
 
         st.subheader("🏏 Live Matches")
         if not live_matches.empty:
@@ -430,7 +299,8 @@ elif selected_tab == "📊 Cricket Scores":
                         st.markdown(f"<p style='text-align: center; font-size: small;'>Wickets: {match['wickets']}</p>", unsafe_allow_html=True)
                     with col3:
                         st.metric(label=match['team2_name'], value=match['score_team2'])
-                    st.caption(f"Live from {match['location']} | Match ID: {match['match_id']}")
+                    updated_marker = " | 🔴 Updated" if match['match_id'] in updated else ""
+                    st.caption(f"Live from {match['location']} | Match ID: {match['match_id']}{updated_marker}")
         else:
             st.info("No live matches currently.")
 
@@ -455,41 +325,56 @@ elif selected_tab == "📊 Cricket Scores":
         else:
             st.info("No recently completed matches.")
 
+    if not data["Cricket Scores"].empty:
+        render_cricket_matches()
+
         st.markdown("---")
         with st.expander("Detailed Cricket Scores (Tabular)"):
-            st.dataframe(data["Cricket Scores"], use_container_width=True)
+            show_table("Cricket Scores")
 
 
 elif selected_tab == "🏀 Multi-Sport Scores":
     st.markdown("### Scores Across All Sports")
     st.write("Stay on top of Football, Basketball, Badminton and more!")
 
-    if not data["Multi-Sport Scores"].empty: # Fixed Key: Multi-Sport Scores
+    live_feed = get_live_feed()
+
+    # Filters and scores rerun inside this fragment only, on interaction or when new score events arrive
+    @st.fragment(run_every=live_feed.refresh_seconds)
+    def render_multi_sport_matches():
+        scores_version = live_feed.store.versions[live_scores.MULTI_SPORT]  # Read first: the frame is at least this new
+        scores_df = live_feed.store.frame(live_scores.MULTI_SPORT)
+        updated = live_feed.updated_since_last_view(st.session_state, live_scores.MULTI_SPORT)
+
         col_sport_filter, col_status_filter = st.columns(2)
-        all_sports = ['All'] + sorted(data["Multi-Sport Scores"]['sport_name'].unique().tolist())
+        all_sports = ['All'] + sorted(scores_df['sport_name'].unique().tolist())
         selected_sport = col_sport_filter.selectbox("Filter by Sport", all_sports)
 
-        all_statuses = ['All'] + sorted(data["Multi-Sport Scores"]['status'].unique().tolist()) # Fixed Key: Multi-Sport Scores
+        all_statuses = ['All'] + sorted(scores_df['status'].unique().tolist())
         selected_status = col_status_filter.selectbox("Filter by Status", all_statuses)
 
-        filtered_df = data["Multi-Sport Scores"].copy()
-        if selected_sport != 'All':
-            filtered_df = filtered_df[filtered_df['sport_name'] == selected_sport]
-        if selected_status != 'All':
-            filtered_df = filtered_df[filtered_df['status'] == selected_status]
+        filters = {'sport_name': selected_sport, 'status': selected_status}
+        filtered_df = get_view_cache().get("multi_sport", scores_version, (selected_sport, selected_status),
+                                           lambda: views.filter_rows(scores_df, filters), base=scores_df)
 
         if not filtered_df.empty:
-            # Display filtered results in a more compact way
-            for i, match in filtered_df.iterrows():
-                with st.container(border=True):
-                    st.write(f"**{match['sport_name']}**: {match['team1']} {match['score1']} - {match['score2']} {match['team2']}")
-                    st.caption(f"Status: {match['status']} | Time: {match['time_elapsed']} | Match ID: {match['match_id']}")
+            def render_score_card(match):
+                st.write(f"**{match['sport_name']}**: {match['team1']} {match['score1']} - {match['score2']} {match['team2']}")
+                updated_marker = " | 🔴 Updated" if match['match_id'] in updated else ""
+                st.caption(f"Status: {match['status']} | Time: {match['time_elapsed']} | Match ID: {match['match_id']}{updated_marker}")
+
+            # Display filtered results in a more compact way, one page at a time
+            components.paginated_card_grid(filtered_df, render_score_card, key="multi_sport_grid", page_size=20,
+                                           num_columns=1, reset_on=(selected_sport, selected_status))
         else:
             st.info("No matches found for the selected filters.")
 
+    if not data["Multi-Sport Scores"].empty: # Fixed Key: Multi-Sport Scores
+        render_multi_sport_matches()
+
     st.markdown("---")
     with st.expander("View All Multi-Sport Scores (Tabular)"):
-        st.dataframe(data["Multi-Sport Scores"], use_container_width=True)
+        show_table("Multi-Sport Scores")
 
 elif selected_tab == "🧮 Start Scoring":
     st.markdown("### Start a New Match!")
@@ -529,12 +414,7 @@ elif selected_tab == "🧮 Start Scoring":
             elif not umpire1 or not scorer:
                 st.error("Umpire 1 and Scorer names are required.")
             else:
-                # In a real app, you'd get the next match ID from a database or a persistent counter
-                new_match_id = f"MID_S{len(data['Start Scoring']) + 1:04d}" # Simple increment for demo
-
-                # Create a dictionary for the new match data (for demonstration)
                 new_match_row_dict = {
-                    'match_id': new_match_id,
                     'sport_type': sport_type,
                     'teams': [team1, team2],
                     'start_time': datetime.combine(start_date_input, start_time_input),
@@ -545,19 +425,106 @@ elif selected_tab == "🧮 Start Scoring":
                     'number_of_overs': num_overs if sport_type == 'Cricket' else None,
                     'status': 'Scheduled'
                 }
+                new_match_id = submit_record("Start Scoring", new_match_row_dict)
 
                 # Display success and new match info
                 st.success(f"Match '{new_match_id}' between {team1} and {team2} created successfully!")
-                st.json(new_match_row_dict) # Show the data that would be saved
-                st.info("Note: This is a demo. Data is not permanently stored or added to the underlying DataFrame.")
-                # To actually add to the DataFrame in this demo, you'd do:
-                # new_match_df = pd.DataFrame([new_match_row_dict])
-                # data["Start Scoring"] = pd.concat([data["Start Scoring"], new_match_df], ignore_index=True)
+                st.json({'match_id': new_match_id, **new_match_row_dict}) # Show the data that was saved
 
+    st.markdown("---")
+    st.markdown("### Live Scoring")
+    engine = get_scoring_engine()
+    scoring_df = data["Start Scoring"]
+    cricket_matches = scoring_df[(scoring_df['sport_type'] == 'Cricket').to_numpy(dtype=bool, na_value=False)
+                                 & (scoring_df['status'] != 'Completed').to_numpy(dtype=bool, na_value=False)]
+    if cricket_matches.empty:
+        st.info("No cricket matches to score yet. Create one above.")
+    else:
+        live_match_id = st.selectbox("Match", cricket_matches['match_id'].astype(str).tolist(), key="live_match")
+        match_row = cricket_matches[cricket_matches['match_id'] == live_match_id].iloc[0]
+        match_teams = list_items(match_row['teams'])
+        scorer = engine.get(live_match_id)
+
+        if scorer is None or scorer.current is None or (scorer.current.complete and not scorer.complete):
+            innings_number = 1 if scorer is None or scorer.current is None else 2
+            if innings_number == 2:
+                st.info(f"Target: {scorer.innings[0].runs + 1}")
+            def start_innings(batting_team):
+                state = st.session_state
+                openers = [state[f"{field}_{live_match_id}"] for field in ("striker", "non_striker", "opening_bowler")]
+                if not all(openers):
+                    state["scoring_error"] = "Both openers and the opening bowler are required."
+                    return
+                match_scorer = scorer
+                if match_scorer is None:
+                    overs = int(match_row['number_of_overs']) if pd.notna(match_row['number_of_overs']) else 20
+                    match_scorer = engine.start(live_match_id, *match_teams, max_overs=overs)
+                match_scorer.start_innings(batting_team, *openers)
+
+            st.subheader(f"Start Innings {innings_number}")
+            if innings_number == 1:
+                batting_team = st.selectbox("Batting Team", match_teams, key=f"batting_team_{live_match_id}")
+            else:
+                batting_team = scorer.innings[0].bowling_team
+                st.write(f"Batting: {batting_team}")
+            st.text_input("Striker", key=f"striker_{live_match_id}")
+            st.text_input("Non-Striker", key=f"non_striker_{live_match_id}")
+            st.text_input("Opening Bowler", key=f"opening_bowler_{live_match_id}")
+            st.button("Start Innings", key=f"start_innings_{live_match_id}", on_click=start_innings, args=(batting_team,))
+            if "scoring_error" in st.session_state:
+                st.error(st.session_state.pop("scoring_error"))
+        else:
+            innings = scorer.current
+            st.subheader(f"{innings.batting_team} - Innings {innings.number}")
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Score", f"{innings.runs}/{innings.wickets}")
+            col2.metric("Overs", f"{innings.overs} / {innings.max_overs}")
+            col3.metric("Run Rate", f"{innings.run_rate:.2f}")
+            if innings.target is not None:
+                required = innings.required_rate
+                col4.metric("Required Rate", f"{required:.2f}" if required is not None else "-",
+                            help=f"Target {innings.target}")
+            st.write(f"Partnership: {innings.partnership_runs} ({innings.partnership_balls} balls) | "
+                     f"Extras: {innings.extras}")
+            st.dataframe(innings.batting_card(), hide_index=True)
+            st.dataframe(innings.bowling_card(), hide_index=True)
+
+            if scorer.complete:
+                st.success(scorer.result())
+            elif not innings.complete:
+                def record_ball(runs):
+                    # Runs as a button callback, so the scorecard above is already updated on the rerun
+                    state = st.session_state
+                    extra = {name: code for code, name in scoring.EXTRA_NAMES.items()}.get(
+                        state[f"extra_{live_match_id}"], scoring.NONE)
+                    wicket = state.get(f"wicket_{live_match_id}", False)
+                    try:
+                        scorer.record(runs, extra, wicket, state.get(f"next_batter_{live_match_id}") or None,
+                                      bowler=state.get(f"bowler_{live_match_id}") or None)
+                    except ValueError as e:
+                        state["scoring_error"] = str(e)
+                        return
+                    # The next ball starts from a clean slate, not this ball's extra or wicket
+                    state[f"extra_{live_match_id}"] = "None"
+                    state[f"wicket_{live_match_id}"] = False
+                    state.pop(f"next_batter_{live_match_id}", None)
+
+                if innings.over_complete:
+                    st.text_input("Bowler for the next over", key=f"bowler_{live_match_id}")
+                else:
+                    st.write(f"Bowling: {innings.bowler} | On strike: {innings.striker}")
+                st.radio("Extra", ["None", *scoring.EXTRA_NAMES.values()], horizontal=True, key=f"extra_{live_match_id}")
+                if st.checkbox("Wicket", key=f"wicket_{live_match_id}"):
+                    st.text_input("Next Batter", key=f"next_batter_{live_match_id}")
+                for column, runs in zip(st.columns(7), range(7)):
+                    column.button(str(runs), key=f"runs_{live_match_id}_{runs}", on_click=record_ball, args=(runs,))
+                if "scoring_error" in st.session_state:
+                    st.error(st.session_state.pop("scoring_error"))
+                st.button("End Innings", key=f"end_innings_{live_match_id}", on_click=scorer.end_innings)
 
     st.markdown("---")
     with st.expander("View Existing Matches (Tabular)"):
-        st.dataframe(data["Start Scoring"], use_container_width=True)
+        show_table("Start Scoring")
 
 elif selected_tab == "🏆 Start a Tournament":
     st.markdown("### Organize a New Tournament!")
@@ -571,6 +538,11 @@ elif selected_tab == "🏆 Start a Tournament":
         end_date_t = st.date_input("End Date", datetime.now().date() + timedelta(days=7))
         tournament_location = st.selectbox("Location", venues)
         tournament_format = st.selectbox("Tournament Format", tournament_formats)
+        tournament_sport = st.selectbox("Sport", sports)
+
+        st.subheader("Scheduling")
+        tournament_venues = st.multiselect("Venues (defaults to the location)", venues, default=[])
+        matches_per_venue = st.number_input("Matches per Venue per Day", min_value=1, max_value=len(fixtures.KICKOFFS), value=1)
 
         st.subheader("Participating Teams (Select at least 2)")
         selected_teams = st.multiselect("Select Teams", team_names, default=[])
@@ -585,40 +557,48 @@ elif selected_tab == "🏆 Start a Tournament":
             elif start_date_t > end_date_t:
                 st.error("End Date cannot be before Start Date.")
             else:
-                new_tournament_id = f"TID_{len(data['Start a Tournament']) + 1:04d}"
-                st.success(f"Tournament '{tournament_name}' ({new_tournament_id}) created successfully with {len(selected_teams)} teams!")
-                st.info("Note: This is a demo. Data is not permanently stored or added to the underlying DataFrame.")
-                # new_tournament_row = pd.DataFrame([{
-                #     'tournament_id': new_tournament_id, 'name': tournament_name, 'organizer': organizer_name,
-                #     'start_date': start_date_t, 'end_date': end_date_t, 'teams_list': selected_teams,
-                #     'location': tournament_location, 'match_ids': [], 'format': tournament_format
-                # }])
-                # data["Start a Tournament"] = pd.concat([data["Start a Tournament"], new_tournament_row], ignore_index=True)
+                try:
+                    scheduled = fixtures.schedule(
+                        fixtures.generate_fixtures(tournament_format, selected_teams),
+                        tournament_venues or [tournament_location], start_date_t, end_date_t, matches_per_venue)
+                except ValueError as error:
+                    st.error(f"The fixtures don't fit: {error}. Add venues, matches per day or days.")
+                else:
+                    # Fixtures become Start Scoring matches; the tournament lists their ids
+                    match_ids = submit_records("Start Scoring", fixtures.scoring_records(scheduled, tournament_sport))
+                    new_tournament_id = submit_record("Start a Tournament", {
+                        'name': tournament_name, 'organizer': organizer_name,
+                        'start_date': start_date_t, 'end_date': end_date_t, 'teams_list': selected_teams,
+                        'location': tournament_location, 'match_ids': match_ids, 'format': tournament_format
+                    })
+                    st.success(f"Tournament '{tournament_name}' ({new_tournament_id}) created successfully with {len(selected_teams)} teams "
+                               f"and {len(match_ids)} scheduled matches!")
+                    st.dataframe(scheduled.assign(match_id=match_ids)[['match_id', 'stage', 'home', 'away', 'start_time', 'venue']],
+                                 hide_index=True, use_container_width=True)
 
     st.markdown("---")
     st.subheader("Current Tournaments")
     if not data["Start a Tournament"].empty:
+        def render_tournament_card(row):
+            st.subheader(row['name'])
+            st.write(f"**Organizer:** {row['organizer']}")
+            st.write(f"**Dates:** {row['start_date'].strftime('%b %d, %Y')} - {row['end_date'].strftime('%b %d, %Y')}")
+            st.write(f"**Location:** {row['location']}")
+            st.write(f"**Format:** {row['format']}")
+            # Limit display of teams for brevity on card
+            teams_display = ', '.join(row['teams_list'][:3])
+            if len(row['teams_list']) > 3:
+                teams_display += f", and {len(row['teams_list']) - 3} more."
+            st.write(f"**Teams:** {teams_display if teams_display else 'N/A'}")
+            st.caption(f"Tournament ID: {schema.format_key('tournament_id', row['tournament_id'])}")
+
         # Display current tournaments as cards
-        cols = st.columns(3)
-        for i, row in data["Start a Tournament"].iterrows():
-            with cols[i % 3]:
-                with st.container(border=True):
-                    st.subheader(row['name'])
-                    st.write(f"**Organizer:** {row['organizer']}")
-                    st.write(f"**Dates:** {row['start_date'].strftime('%b %d, %Y')} - {row['end_date'].strftime('%b %d, %Y')}")
-                    st.write(f"**Location:** {row['location']}")
-                    st.write(f"**Format:** {row['format']}")
-                    # Limit display of teams for brevity on card
-                    teams_display = ', '.join(row['teams_list'][:3])
-                    if len(row['teams_list']) > 3:
-                        teams_display += f", and {len(row['teams_list']) - 3} more."
-                    st.write(f"**Teams:** {teams_display if teams_display else 'N/A'}")
-                    st.caption(f"Tournament ID: {row['tournament_id']}")
+        components.paginated_card_grid(data["Start a Tournament"], render_tournament_card, key="tournament_grid", page_size=9)
     else:
         st.info("No tournaments available.")
 
     with st.expander("View All Tournament Data (Tabular)"):
-        st.dataframe(data["Start a Tournament"], use_container_width=True)
+        show_table("Start a Tournament")
 
 elif selected_tab == "📋 My Matches":
     st.markdown("### Your Match History")
@@ -626,13 +606,16 @@ elif selected_tab == "📋 My Matches":
 
     if not data["My Matches"].empty:
         # Allow user to select their ID to see their matches
-        all_user_ids = sorted(data["My Matches"]['user_id'].unique().tolist())
-        selected_user = st.selectbox("Select Your User ID", all_user_ids, index=0)
+        history_index = get_match_history_index()
+        selected_user = st.selectbox("Select Your User ID", history_index.user_ids, index=0, format_func=format_user_id)
 
-        user_matches = data["My Matches"][data["My Matches"]['user_id'] == selected_user].sort_values(by='date', ascending=False).reset_index(drop=True)
+        user_matches = history_index.history(selected_user)
 
         if not user_matches.empty:
-            st.subheader(f"Matches for {selected_user}")
+            st.subheader(f"Matches for {format_user_id(selected_user)}")
+            summary = history_index.summary(selected_user)
+            for col, label in zip(st.columns(4), ['matches', 'Won', 'Lost', 'Draw']):
+                col.metric(label.capitalize(), int(summary.get(label, 0)))
             # Display matches in a more compact list/card format
             for i, match in user_matches.iterrows():
                 with st.container(border=True):
@@ -646,15 +629,22 @@ elif selected_tab == "📋 My Matches":
 
     st.markdown("---")
     with st.expander("View All My Matches Data (Tabular)"):
-        st.dataframe(data["My Matches"], use_container_width=True)
+        show_table("My Matches")
 
 elif selected_tab == "👥 My Teams":
     st.markdown("### Your Teams")
     st.write("Manage your teams and view rosters.")
 
     if not data["My Teams"].empty:
+        # Optionally narrow the teams to those with a given player on their roster
+        roster_index = get_roster_index()
+        roster_player = st.selectbox("Filter by Player", ['All'] + sorted(roster_index.items))
+        teams_df = data["My Teams"]
+        if roster_player != 'All':
+            teams_df = teams_df.iloc[roster_index.rows_containing(roster_player)]
+
         # Allow user to select a team
-        team_options = sorted(data["My Teams"]['team_name'].unique().tolist())
+        team_options = sorted(teams_df['team_name'].unique().tolist())
         selected_team_name = st.selectbox("Select a Team", team_options)
 
         team_info = data["My Teams"][data["My Teams"]['team_name'] == selected_team_name]
@@ -668,20 +658,12 @@ elif selected_tab == "👥 My Teams":
             with col_details:
                 st.write(f"**Sport Type:** {team_info['sport_type']}")
                 st.write(f"**Created By:** {team_info['created_by']}")
-                st.write(f"**Captain ID:** {team_info['captain_id']}")
+                st.write(f"**Captain ID:** {format_user_id(team_info['captain_id'])}")
                 st.write(f"**Rating:** ⭐ {team_info['rating']}")
                 st.write(f"**Wins/Losses:** {team_info['wins']} / {team_info['losses']}")
 
             st.markdown("#### Team Roster")
-            players_list = team_info['players_list']
-            # Ensure players_list is actually a list (can be string if read from CSV)
-            if isinstance(players_list, str):
-                import ast
-                try:
-                    players_list = ast.literal_eval(players_list)
-                except ValueError:
-                    players_list = [players_list] # Fallback if not a list string
-
+            players_list = list_items(team_info['players_list'])
             if players_list:
                 # Display players in a clean, multi-column format
                 num_player_cols = 3
@@ -696,32 +678,29 @@ elif selected_tab == "👥 My Teams":
 
     st.markdown("---")
     with st.expander("View All My Teams Data (Tabular)"):
-        st.dataframe(data["My Teams"], use_container_width=True)
+        show_table("My Teams")
 
 elif selected_tab == "📈 My Stats":
     st.markdown("### Your Player Statistics")
     st.write("Review your career performance and achievements.")
 
     if not data["My Stats"].empty and not data["Profile"].empty:
-        # Combine stats and profile data for a richer view
-        # Ensure 'user_id' is the common key for merging
-        merged_stats_profile = pd.merge(data["My Stats"], data["Profile"], on='user_id', how='left')
+        # Stats and profile data are joined once and indexed by user_id for a richer view
+        player_index = get_player_index()
 
-        all_player_ids = sorted(merged_stats_profile['user_id'].unique().tolist())
-        selected_player_id = st.selectbox("Select Your Player ID", all_player_ids, index=0)
+        selected_player_id = pick_player("Select Your Player", player_index.stats_ids, player_index, key="stats_player",
+                                         with_stats=True)
 
-        player_data = merged_stats_profile[merged_stats_profile['user_id'] == selected_player_id]
+        player_data = player_index.get(selected_player_id)
 
-        if not player_data.empty:
-            player_data = player_data.iloc[0] # Get the single row for the selected player
+        if player_data is not None:
             col_photo, col_basic_info = st.columns([0.2, 0.8])
             with col_photo:
                 st.image(player_data['photo_url'], width=150)
             with col_basic_info:
                 st.write(f"**Location:** {player_data['location']} | **Level:** {player_data['level']}")
                 st.markdown(f"<p><i>{player_data['bio']}</i></p>", unsafe_allow_html=True)
-                # Ensure teams_joined is handled as a list
-                teams_joined_display = ', '.join(player_data['teams_joined']) if isinstance(player_data['teams_joined'], list) and player_data['teams_joined'] else 'N/A'
+                teams_joined_display = ', '.join(list_items(player_data['teams_joined'])) or 'N/A'
                 st.write(f"**Teams Joined:** {teams_joined_display}")
 
             st.markdown("#### Key Performance Indicators")
@@ -739,27 +718,59 @@ elif selected_tab == "📈 My Stats":
             kpi8.metric("Catches", player_data['catches'])
 
             st.markdown("#### Achievements")
-            if player_data['achievements'] and len(player_data['achievements']) > 0:
-                for achievement in player_data['achievements']:
+            if list_items(player_data['achievements']):
+                for achievement in list_items(player_data['achievements']):
                     st.success(f"🏅 {achievement}")
             else:
                 st.info("No notable achievements yet!")
 
             # Simple bar chart for a few key stats
-            chart_data = pd.DataFrame({
-                'Metric': ['Matches Played', 'Runs Scored', 'Wickets Taken', 'Catches'],
-                'Value': [player_data['matches_played'], player_data['runs_scored'], player_data['wickets_taken'], player_data['catches']]
-            })
-            fig = px.bar(chart_data, x='Metric', y='Value', title=f"Performance Summary for {player_data['name']}",
-                         color='Metric', color_discrete_map={'Matches Played': 'blue', 'Runs Scored': 'green', 'Wickets Taken': 'red', 'Catches': 'purple'})
-            st.plotly_chart(fig, use_container_width=True)
+            def performance_summary():
+                import plotly.express as px
+                chart_data = pd.DataFrame({
+                    'Metric': ['Matches Played', 'Runs Scored', 'Wickets Taken', 'Catches'],
+                    'Value': [player_data['matches_played'], player_data['runs_scored'], player_data['wickets_taken'], player_data['catches']]
+                })
+                return px.bar(chart_data, x='Metric', y='Value', title=f"Performance Summary for {player_data['name']}",
+                              color='Metric', color_discrete_map={'Matches Played': 'blue', 'Runs Scored': 'green', 'Wickets Taken': 'red', 'Catches': 'purple'})
+            st.plotly_chart(cached_figure("performance_summary", ("Profile", "My Stats"), (selected_player_id,), performance_summary),
+                            use_container_width=True)
+
+        elif selected_player_id is not None:
+            st.info("Player data not found for the selected ID.")
 
+        st.markdown("#### Leaderboards")
+        engine = get_leaderboards()
+        col_metric, col_location, col_team, col_level = st.columns(4)
+        metric = col_metric.selectbox("Rank By", list(leaderboards.METRICS), format_func=leaderboards.METRICS.get)
+        location = col_location.selectbox("Location", [leaderboards.ANY] + engine.locations)
+        team = col_team.selectbox("Team", [leaderboards.ANY] + engine.teams)
+        level = col_level.selectbox("Level", [leaderboards.ANY] + list(leaderboards.LEVEL_BANDS))
+
+        board = engine.board(metric, location, team, level)
+        if len(board):
+            top = board.top(10)
+            st.dataframe(pd.DataFrame({
+                'Rank': top['rank'],
+                'Player': [format_user_id(user_id) for user_id in top['user_id']],
+                'Name': [engine.name(user_id) for user_id in top['user_id']],
+                leaderboards.METRICS[metric]: top['value'],
+            }), hide_index=True, use_container_width=True)
+            if selected_player_id in board:
+                st.caption(f"{format_user_id(selected_player_id)} is ranked #{board.rank(selected_player_id)} of {len(board)} "
+                           f"(at or above {board.percentile(selected_player_id):.0f}% of players)")
         else:
-            st.info("Player data not found for the selected ID.")
+            st.info("No players match these filters.")
+
+        st.markdown("#### Trends")
+        runs_bucket = st.radio("Group by", list(charts.BUCKETS), index=1, horizontal=True, key="runs_trend_bucket")
+        st.plotly_chart(cached_figure("runs_over_time", ("My Matches",), (runs_bucket,),
+                                      lambda: charts.runs_over_time(data["My Matches"], charts.BUCKETS[runs_bucket])),
+                        use_container_width=True)
 
     st.markdown("---")
     with st.expander("View All Player Stats (Tabular)"):
-        st.dataframe(data["My Stats"], use_container_width=True)
+        show_table("My Stats")
 
 
 elif selected_tab == "🎬 Highlights":
@@ -771,37 +782,38 @@ elif selected_tab == "🎬 Highlights":
         highlight_types = ['All'] + data["Highlights"]['media_type'].unique().tolist()
         selected_highlight_type = st.selectbox("Filter by Media Type", highlight_types)
 
-        filtered_highlights = data["Highlights"]
-        if selected_highlight_type != 'All':
-            filtered_highlights = filtered_highlights[filtered_highlights['media_type'] == selected_highlight_type]
+        highlights_version = data.versions["Highlights"]  # Read first: the frame is at least this new
+        highlights_df = data["Highlights"]
+        filtered_highlights = get_view_cache().get(
+            "highlights", highlights_version, (selected_highlight_type,),
+            lambda: views.filter_rows(highlights_df, {'media_type': selected_highlight_type}), base=highlights_df)
 
         if not filtered_highlights.empty:
-            # Display highlights in a grid (3 columns)
-            cols = st.columns(3)
-            # Limit to a reasonable number for display, e.g., top 15
-            for i, highlight in filtered_highlights.head(15).iterrows():
-                with cols[i % 3]:
-                    with st.container(border=True):
-                        st.subheader(highlight['event_description'])
-                        st.write(f"**Player:** {highlight['player']}")
-                        st.write(f"**Match ID:** {highlight['match_id']}")
-                        st.caption(f"Recorded: {highlight['timestamp'].strftime('%Y-%m-%d %H:%M')}")
-                        if highlight['media_type'] == 'Video':
-                            # Use a real YouTube video for demo or a placeholder
-                            # Note: Streamlit's st.video usually expects a direct video URL, not a YouTube watch page.
-                            # For YouTube, a generic embed works but actual playback might require an API key or a specific embed URL.
-                            # Here, I'll use a public domain video or a known placeholder if available.
-                            st.video("https://www.learningcontainer.com/wp-content/uploads/2020/05/sample-mp4-file.mp4") # Example public domain video
-                            st.caption("*(Sample Video)*")
-                        else: # Image
-                            st.image(highlight['url'], caption="Highlight Image", use_column_width=True)
-                        st.link_button("View Full", highlight['url'])
+            def render_highlight_card(highlight):
+                st.subheader(highlight['event_description'])
+                st.write(f"**Player:** {highlight['player']}")
+                st.write(f"**Match ID:** {highlight['match_id']}")
+                st.caption(f"Recorded: {highlight['timestamp'].strftime('%Y-%m-%d %H:%M')}")
+                if highlight['media_type'] == 'Video':
+                    # Use a real YouTube video for demo or a placeholder
+                    # Note: Streamlit's st.video usually expects a direct video URL, not a YouTube watch page.
+                    # For YouTube, a generic embed works but actual playback might require an API key or a specific embed URL.
+                    # Here, I'll use a public domain video or a known placeholder if available.
+                    st.video("https://www.learningcontainer.com/wp-content/uploads/2020/05/sample-mp4-file.mp4") # Example public domain video
+                    st.caption("*(Sample Video)*")
+                else: # Image
+                    st.image(highlight['url'], caption="Highlight Image", use_column_width=True)
+                st.link_button("View Full", highlight['url'])
+
+            # Display highlights in a grid (3 columns), a reasonable number per page
+            components.paginated_card_grid(filtered_highlights, render_highlight_card, key="highlights_grid",
+                                           page_size=15, reset_on=selected_highlight_type)
         else:
             st.info("No highlights found for the selected filter.")
 
     st.markdown("---")
     with st.expander("View All Highlights Data (Tabular)"):
-        st.dataframe(data["Highlights"], use_container_width=True)
+        show_table("Highlights")
 
 
 elif selected_tab == "🧑‍💻 Create Account":
@@ -813,7 +825,7 @@ elif selected_tab == "🧑‍💻 Create Account":
         user_name = st.text_input("Full Name", max_chars=100)
         user_email = st.text_input("Email", max_chars=100)
         user_phone = st.text_input("Phone Number", max_chars=20)
-        user_gender = st.selectbox("Gender", ['Male', 'Female', 'Other', 'Prefer not to say'])
+        user_gender = st.selectbox("Gender", genders)
         user_birthdate = st.date_input("Date of Birth", min_value=datetime(1950, 1, 1).date(), max_value=datetime(2007, 1, 1).date())
         user_location = st.selectbox("Nearest City/Venue", venues)
 
@@ -831,23 +843,17 @@ elif selected_tab == "🧑‍💻 Create Account":
             elif "@" not in user_email or "." not in user_email:
                 st.error("Please enter a valid email address.")
             else:
-                # In a real app, you would get a unique ID from a database
-                new_user_id = f"UID_{len(data['Create Account']) + 1:04d}"
+                new_user_id = submit_record("Create Account", {
+                    'name': user_name, 'email': user_email, 'phone': user_phone,
+                    'gender': user_gender, 'birthdate': user_birthdate, 'location': user_location,
+                    'joined_date': datetime.now().date(), 'sports_interested_in': user_sports_interested, 'role': user_role
+                })
                 st.success(f"Welcome, {user_name}! Your account ({new_user_id}) has been created successfully.")
-                st.info("Note: This is a demo. Data is not permanently stored or added to the underlying DataFrame.")
-                # You would typically add new_user_data to a database here
-                # new_user_data = {
-                #     'user_id': new_user_id, 'name': user_name, 'email': user_email, 'phone': user_phone,
-                #     'gender': user_gender, 'birthdate': user_birthdate, 'location': user_location,
-                #     'joined_date': datetime.now().date(), 'sports_interested_in': user_sports_interested, 'role': user_role
-                # }
-                # new_user_df = pd.DataFrame([new_user_data])
-                # data["Create Account"] = pd.concat([data["Create Account"], new_user_df], ignore_index=True)
 
 
     st.markdown("---")
     with st.expander("View Existing Accounts (Tabular)"):
-        st.dataframe(data["Create Account"], use_container_width=True)
+        show_table("Create Account")
 
 
 elif selected_tab == "🛒 Shop":
@@ -862,57 +868,62 @@ elif selected_tab == "🛒 Shop":
 
         search_query = col_search.text_input("Search Products (e.g., 'Bat', 'Jersey')", "")
 
-        filtered_products = data["Shop"]
-        if selected_category != 'All':
-            filtered_products = filtered_products[filtered_products['category'] == selected_category]
+        shop_version = data.versions["Shop"]
+        shop_df = data["Shop"]
 
-        if search_query:
-            filtered_products = filtered_products[
-                filtered_products['name'].str.contains(search_query, case=False, na=False) |
-                filtered_products['description'].str.contains(search_query, case=False, na=False)
-            ]
+        def filter_products():
+            products = shop_df
+            if search_query:
+                # Prefix-matched, BM25-ranked lookup in the cached token index (best matches first)
+                matching_rows = get_product_index().search(search_query)
+                if matching_rows is not None:
+                    products = products.iloc[matching_rows]
+            return views.filter_rows(products, {'category': selected_category})
+
+        filtered_products = get_view_cache().get("shop", shop_version, (selected_category, search_query),
+                                                 filter_products, base=shop_df)
 
         if not filtered_products.empty:
-            # Display products in a grid (3 columns)
-            cols = st.columns(3)
-            for i, product in filtered_products.iterrows():
-                with cols[i % 3]:
-                    with st.container(border=True):
-                        st.image(product['image_url'], caption=product['name'], use_column_width=True) # Use a placeholder image
-                        st.subheader(product['name'])
-                        st.markdown(f"**Price:** <span style='font-size:1.2em; color:#4CAF50;'>₹{product['price']:.2f}</span>", unsafe_allow_html=True)
-                        st.caption(f"Category: {product['category']}")
-                        st.write(f"Rating: ⭐ {product['ratings']} ({product['sold_count']} sold)")
-                        if product['inventory_count'] > 0:
-                            st.success(f"In Stock: {product['inventory_count']}")
-                            if st.button(f"Add to Cart", key=f"add_to_cart_{product['product_id']}"):
-                                st.toast(f"'{product['name']}' added to cart! (Demo)")
-                        else:
-                            st.error("Out of Stock")
+            def render_product_card(product):
+                st.image(product['image_url'], caption=product['name'], use_column_width=True) # Use a placeholder image
+                st.subheader(product['name'])
+                st.markdown(f"**Price:** <span style='font-size:1.2em; color:#4CAF50;'>₹{product['price']:.2f}</span>", unsafe_allow_html=True)
+                st.caption(f"Category: {product['category']}")
+                st.write(f"Rating: ⭐ {product['ratings']} ({product['sold_count']} sold)")
+                if product['inventory_count'] > 0:
+                    st.success(f"In Stock: {product['inventory_count']}")
+                    if st.button(f"Add to Cart", key=f"add_to_cart_{product['product_id']}"):
+                        st.toast(f"'{product['name']}' added to cart! (Demo)")
+                else:
+                    st.error("Out of Stock")
+
+            # Display products in a grid (3 columns), one page at a time
+            components.paginated_card_grid(filtered_products, render_product_card, key="shop_grid", page_size=12,
+                                           reset_on=(selected_category, search_query))
         else:
             st.info("No products found matching your filters.")
 
     st.markdown("---")
+    with st.expander("Sales by Category"):
+        if st.toggle("Show chart", key="sales_chart"):
+            st.plotly_chart(cached_figure("sales_by_category", ("Shop",), (), lambda: charts.sales_by_category(data["Shop"])),
+                            use_container_width=True)
     with st.expander("View All Shop Products (Tabular)"):
-        st.dataframe(data["Shop"], use_container_width=True)
+        show_table("Shop")
 
 elif selected_tab == "🧍‍♂️ Profile":
     st.markdown("### Your Sportsphere Profile")
     st.write("Manage your public profile and view your comprehensive stats.")
 
     if not data["Profile"].empty and not data["My Stats"].empty:
-        # Merge Profile and My Stats to get a comprehensive player_data
-        # Ensure the merge column 'user_id' exists in both.
-        # Use a left merge to keep all profiles, filling missing stats with NaN
-        merged_profile_stats = pd.merge(data["Profile"], data["My Stats"], on='user_id', how='left')
+        # Profile and My Stats are joined once and indexed by user_id; missing stats are <NA>
+        player_index = get_player_index()
 
-        all_profile_ids = sorted(merged_profile_stats['user_id'].unique().tolist())
-        selected_profile_id = st.selectbox("Select Your Profile", all_profile_ids, index=0)
+        selected_profile_id = pick_player("Select Your Profile", player_index.profile_ids, player_index, key="profile_player")
 
-        profile_info = merged_profile_stats[merged_profile_stats['user_id'] == selected_profile_id]
+        profile_info = player_index.get(selected_profile_id)
 
-        if not profile_info.empty:
-            profile_info = profile_info.iloc[0] # Get the single row for the selected profile
+        if profile_info is not None:
             col_left, col_right = st.columns([0.3, 0.7])
             with col_left:
                 st.image(profile_info['photo_url'], width=200, caption=profile_info['name'])
@@ -921,30 +932,30 @@ elif selected_tab == "🧍‍♂️ Profile":
                 st.markdown(f"<p style='font-size:1.1em;'>📍 {profile_info['location']} | Level: <b>{profile_info['level']}</b></p>", unsafe_allow_html=True)
                 st.markdown(f"<p><i>{profile_info['bio']}</i></p>", unsafe_allow_html=True)
 
-                # Ensure teams_joined is handled as a list, and default if empty
-                teams_joined_display = ', '.join(profile_info['teams_joined']) if isinstance(profile_info['teams_joined'], list) and profile_info['teams_joined'] else 'N/A'
+                teams_joined_display = ', '.join(list_items(profile_info['teams_joined'])) or 'N/A'
                 st.write(f"**Teams Joined:** {teams_joined_display}")
 
             st.markdown("---")
             st.subheader("Sports Journey")
             col_m, col_t = st.columns(2)
             # Use data from the merged DataFrame, providing defaults for NaN values
-            col_m.metric("Matches Played", int(profile_info.get('matches_played', 0))) # .get() or fillna
+            matches_played = profile_info.get('matches_played')
+            col_m.metric("Matches Played", int(matches_played) if pd.notna(matches_played) else 0)
             col_t.metric("Tournaments Participated", int(profile_info.get('tournaments', 0)))
 
             st.markdown("#### Achievements")
-            if profile_info['achievements'] and len(profile_info['achievements']) > 0:
-                for ach in profile_info['achievements']:
+            if list_items(profile_info['achievements']):
+                for ach in list_items(profile_info['achievements']):
                     st.success(f"🏆 {ach}")
             else:
                 st.info("No achievements yet. Keep playing!")
 
-        else:
+        elif selected_profile_id is not None:
             st.info("Profile not found for the selected ID.")
 
     st.markdown("---")
     with st.expander("View All Profiles Data (Tabular)"):
-        st.dataframe(data["Profile"], use_container_width=True)
+        show_table("Profile")
 
 
 elif selected_tab == "🌐 Change Language":
@@ -970,7 +981,7 @@ elif selected_tab == "🌐 Change Language":
 
     st.markdown("---")
     with st.expander("View Language Data (Tabular)"):
-        st.dataframe(data["Change Language"], use_container_width=True)
+        show_table("Change Language")
 
 elif selected_tab == "🔗 Share App":
     st.markdown("### Spread the Word!")
@@ -995,14 +1006,14 @@ elif selected_tab == "🔗 Share App":
     st.subheader("Recent Share Activity")
     if not data["Share App"].empty:
         # Display recent shares
-        recent_shares = data["Share App"].sort_values(by='timestamp', ascending=False).head(5).reset_index(drop=True)
+        recent_shares = get_share_store().top(5)
         for i, share in recent_shares.iterrows():
-            st.markdown(f"**[{share['timestamp'].strftime('%Y-%m-%d %H:%M')}]** `{share['user_id']}` shared on **{share['platform']}** to **{share['shared_to']}**.")
+            st.markdown(f"**[{share['timestamp'].strftime('%Y-%m-%d %H:%M')}]** `{format_user_id(share['user_id'])}` shared on **{share['platform']}** to **{share['shared_to']}**.")
     else:
         st.info("No share activity recorded yet.")
 
     with st.expander("View All Share Data (Tabular)"):
-        st.dataframe(data["Share App"], use_container_width=True)
+        show_table("Share App")
 
 
 elif selected_tab == "🆘 Help & Support":
@@ -1020,36 +1031,39 @@ elif selected_tab == "🆘 Help & Support":
         if ticket_submitted:
             if not ticket_user_id or not description:
                 st.error("Please provide your User ID and a description of the issue.")
+            elif schema.parse_key('user_id', ticket_user_id) is None:
+                st.error("Please enter a valid User ID (e.g., UID_0001).")
             else:
-                new_ticket_id = f"TICKET_{len(data['Help & Support']) + 1:04d}"
+                new_ticket_id = submit_record("Help & Support", {
+                    'user_id': ticket_user_id, 'issue_type': issue_type, 'description': description,
+                    'status': 'Open', 'created_at': datetime.now(), 'resolved_at': None, 'agent_id': None
+                })
                 st.success(f"Your ticket ({new_ticket_id}) has been submitted! We will review it shortly.")
-                st.info("Note: This is a demo. Data is not permanently stored or added to the underlying DataFrame.")
-                # You would add ticket data to a database here.
 
     st.markdown("---")
     st.subheader("Your Open Tickets")
     if not data["Help & Support"].empty:
         # Filter for open or in-progress tickets
         # For demo, let's just pick a random user to display their tickets
-        demo_user_tickets = data["Help & Support"][data["Help & Support"]['user_id'] == random.choice(data["Help & Support"]['user_id'].unique())].head(5).reset_index(drop=True)
+        demo_user_tickets = data["Help & Support"][data["Help & Support"]['user_id'] == random.choice(data["Help & Support"]['user_id'].dropna().unique())].head(5).reset_index(drop=True)
 
         if not demo_user_tickets.empty:
-            st.write(f"Showing sample tickets for user: **{demo_user_tickets.iloc[0]['user_id']}**")
+            st.write(f"Showing sample tickets for user: **{format_user_id(demo_user_tickets.iloc[0]['user_id'])}**")
             for i, ticket in demo_user_tickets.iterrows():
                 with st.container(border=True):
                     status_color = 'orange' if ticket['status'] == 'In Progress' else 'green' if ticket['status'] == 'Resolved' or ticket['status'] == 'Closed' else 'red'
-                    st.markdown(f"**Ticket ID:** {ticket['ticket_id']} | **Issue Type:** {ticket['issue_type']}")
+                    st.markdown(f"**Ticket ID:** {schema.format_key('ticket_id', ticket['ticket_id'])} | **Issue Type:** {ticket['issue_type']}")
                     st.markdown(f"**Status:** <span style='color:{status_color}; font-weight:bold;'>{ticket['status']}</span>", unsafe_allow_html=True)
                     st.caption(f"Created: {ticket['created_at'].strftime('%Y-%m-%d %H:%M')}")
                     with st.expander("View Details"):
                         st.write(ticket['description'])
                         if pd.notna(ticket['resolved_at']):
-                            st.info(f"Resolved on: {ticket['resolved_at'].strftime('%Y-%m-%d %H:%M')} by Agent {ticket['agent_id']}")
+                            st.info(f"Resolved on: {ticket['resolved_at'].strftime('%Y-%m-%d %H:%M')} by Agent {schema.format_key('agent_id', ticket['agent_id'])}")
         else:
             st.info("No open support tickets found for this sample.")
 
     with st.expander("View All Help & Support Tickets (Tabular)"):
-        st.dataframe(data["Help & Support"], use_container_width=True)
+        show_table("Help & Support")
 
 elif selected_tab == "📧 Contact Us":
     st.markdown("### Get in Touch!")
@@ -1069,16 +1083,17 @@ elif selected_tab == "📧 Contact Us":
             elif "@" not in contact_email or "." not in contact_email:
                 st.error("Please enter a valid email address.")
             else:
-                new_contact_id = f"CONT_{len(data['Contact Us']) + 1:04d}"
+                submit_record("Contact Us", {
+                    'user_id': None, 'name': contact_name, 'email': contact_email, 'message': contact_message,
+                    'timestamp': datetime.now(), 'response_status': 'Pending'
+                })
                 st.success("Thank you for your message! We will get back to you soon.")
-                st.info("Note: This is a demo. Data is not permanently stored or added to the underlying DataFrame.")
-                # You would add contact data to a database here.
 
     st.markdown("---")
     st.subheader("Recent Contacts")
     if not data["Contact Us"].empty:
         # Display recent contacts
-        recent_contacts = data["Contact Us"].sort_values(by='timestamp', ascending=False).head(5).reset_index(drop=True)
+        recent_contacts = get_contact_store().top(5)
         for i, contact in recent_contacts.iterrows():
             response_status_color = 'orange' if contact['response_status'] == 'Pending' else 'green'
             st.markdown(f"**[{contact['timestamp'].strftime('%Y-%m-%d %H:%M')}]** From **{contact['name']}** ({contact['email']}) - Status: <span style='color:{response_status_color}; font-weight:bold;'>{contact['response_status']}</span>", unsafe_allow_html=True)
@@ -1086,7 +1101,32 @@ elif selected_tab == "📧 Contact Us":
         st.info("No recent contact messages.")
 
     with st.expander("View All Contact Us Data (Tabular)"):
-        st.dataframe(data["Contact Us"], use_container_width=True)
+        show_table("Contact Us")
+
+render = profiler.finish(get_render_metrics()[0]) if profiler.ENABLED else None
+startup.finish()
+if render is not None and st.sidebar.checkbox("Show render profile"):
+    render_metrics, metrics_server = get_render_metrics()
+    st.sidebar.markdown("### Render Profile")
+    st.sidebar.metric("Render Time", f"{render.seconds * 1000:.0f} ms")
+    st.sidebar.write(f"Pandas ops: {render.pandas_ops:,} | Rows scanned: {render.rows_scanned:,} | "
+                     f"Sent: {render.bytes_sent / 1024:,.1f} KB")
+    if render.accesses:
+        st.sidebar.dataframe(pd.DataFrame(render.accesses, columns=['kind', 'name', 'seconds', 'rows']),
+                             hide_index=True)
+    cold_start = startup.report()
+    if cold_start is not None:
+        st.sidebar.write(f"Cold start: {cold_start['script_seconds']:.2f}s script, "
+                         + ", ".join(f"{phase} {seconds}s" for phase, seconds in cold_start['phases'].items()))
+    cache = data.cache_stats()
+    st.sidebar.write(f"Shared cache: {(cache['dataset_bytes'] + cache['derived_bytes']) / 2**20:,.1f} of "
+                     f"{cache['memory_budget'] / 2**20:,.0f} MB | {cache['derived']} derived, "
+                     f"{cache['hits']:,} hits, {cache['misses']:,} misses, {cache['evictions']:,} evictions")
+    st.sidebar.markdown("**All tabs (this process)**")
+    st.sidebar.dataframe(render_metrics.tab_frame(), hide_index=True)
+    if metrics_server is not None:
+        host, port = metrics_server.server_address[:2]
+        st.sidebar.caption(f"Metrics: http://{host}:{port}/metrics (JSON: /metrics.json)")
 
 # Footer
 st.markdown("---")
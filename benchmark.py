@@ -0,0 +1,354 @@
+"""Benchmarks data generation and every tab of the app, and writes a JSON report.
+
+    python benchmark.py --scales 0.1 1 5 --out bench.json
+    python benchmark.py --compare bench.json      # exits 1 on a regression
+    python benchmark.py --schedule-teams 1000 4000 --skip-generation --skip-tabs
+    python benchmark.py --cold-starts 5 --skip-generation --skip-scheduling --skip-tabs
+
+Each generation scale runs in a fresh process so its peak RSS is its own.
+Tabs are driven headlessly with Streamlit's AppTest: the first visit to a tab
+is timed as "cold" (datasets and derived views get built), later visits as
+"warm" (a normal rerun). Cold starts run the app's first render in fresh
+interpreters and collect the phase timings of its startup report.
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+REPORT_VERSION = 1
+
+
+# --- Memory ---
+def _status_kb(field):
+    """A ``kB`` field of /proc/self/status (Linux only), or None."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def rss_mb():
+    kb = _status_kb("VmRSS")
+    return round(kb / 1024, 1) if kb is not None else None
+
+
+def process_peak_rss_mb():
+    """Peak RSS over the whole life of the process (unaffected by ``reset_peak_rss``)."""
+    kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":  # bytes on macOS, kilobytes elsewhere
+        kb //= 1024
+    return round(kb / 1024, 1)
+
+
+def peak_rss_mb():
+    """Peak RSS since the last ``reset_peak_rss``, where supported."""
+    kb = _status_kb("VmHWM")
+    return round(kb / 1024, 1) if kb is not None else process_peak_rss_mb()
+
+
+def reset_peak_rss():
+    """Resets the peak-RSS watermark so the next reading covers only what follows (Linux 4.0+)."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def frame_memory(data):
+    """Rows and deep memory (bytes) of every dataset."""
+    return {
+        name: {'rows': len(df), 'bytes': int(df.memory_usage(deep=True).sum())}
+        for name, df in data.items()
+    }
+
+
+# --- Data generation ---
+def _generation_run(scale, seed):
+    import datagen  # Imported in the worker so its import cost isn't shared between scales
+
+    start = time.perf_counter()
+    data = datagen.generate_all_data(seed=seed, scale=scale)
+    seconds = time.perf_counter() - start
+    datasets = frame_memory(data)
+    return {
+        'scale': scale,
+        'seconds': round(seconds, 3),
+        'rows': sum(d['rows'] for d in datasets.values()),
+        'bytes': sum(d['bytes'] for d in datasets.values()),
+        'peak_rss_mb': peak_rss_mb(),
+        'datasets': datasets,
+    }
+
+
+def bench_generation(scales, seed, repeats=1):
+    """Times ``generate_all_data`` at each scale; each run gets a fresh process."""
+    results = []
+    for scale in scales:
+        runs = []
+        for _ in range(repeats):
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+                runs.append(pool.submit(_generation_run, scale, seed).result())
+        best = min(runs, key=lambda run: run['seconds'])
+        best['runs'] = [run['seconds'] for run in runs]
+        results.append(best)
+        print(f"generate scale={scale:g}: {best['seconds']:.2f}s, {best['rows']:,} rows, "
+              f"{best['bytes'] / 2**20:.1f} MB frames, peak RSS {best['peak_rss_mb']} MB")
+    return results
+
+
+# --- Fixture scheduling ---
+def bench_scheduling(team_counts, repeats=3):
+    """Times fixture generation plus scheduling for each format and team count (best of ``repeats``)."""
+    from datetime import date
+
+    import fixtures
+    from constants import tournament_formats, venues
+
+    results = []
+    for n_teams in team_counts:
+        teams = [f"Team {i}" for i in range(n_teams)]
+        for tournament_format in tournament_formats:
+            runs = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                scheduled = fixtures.schedule(fixtures.generate_fixtures(tournament_format, teams), venues,
+                                              date(2025, 1, 1), matches_per_venue=len(fixtures.KICKOFFS))
+                runs.append(time.perf_counter() - start)
+            result = {
+                'teams': n_teams,
+                'format': tournament_format,
+                'matches': len(scheduled),
+                'days': int((scheduled['date'].max() - scheduled['date'].min()).days) + 1,
+                'seconds': round(min(runs), 4),
+            }
+            results.append(result)
+            print(f"schedule {tournament_format} teams={n_teams}: {result['matches']:,} matches over "
+                  f"{result['days']:,} days in {result['seconds']:.3f}s")
+    return results
+
+
+# --- Cold start ---
+_COLD_START_SCRIPT = """
+import sys
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=float(sys.argv[2])).run()
+sys.exit(1 if at.exception else 0)
+"""
+
+
+def bench_cold_start(scale, runs=3, timeout=300):
+    """First render of the app in ``runs`` fresh interpreters: wall time from interpreter start, and the
+    phases of the app's startup report (see ``startup.py``)."""
+    workdir = tempfile.mkdtemp(prefix="sportsphere-cold-")
+    results = []
+    for run in range(runs):
+        report_path = os.path.join(workdir, f"startup-{run}.json")
+        env = dict(os.environ, SPORTSPHERE_SCALE=str(scale), SPORTSPHERE_STARTUP_REPORT=report_path,
+                   SPORTSPHERE_DB=os.path.join(workdir, "bench.db"))
+        start = time.perf_counter()
+        completed = subprocess.run([sys.executable, "-c", _COLD_START_SCRIPT, APP_PATH, str(timeout)], env=env,
+                                   cwd=os.path.dirname(APP_PATH), capture_output=True, text=True, timeout=timeout)
+        seconds = time.perf_counter() - start
+        report = {}
+        if os.path.exists(report_path):
+            with open(report_path) as f:
+                report = json.load(f)
+        results.append({'seconds': round(seconds, 3), 'ok': completed.returncode == 0, **report})
+    seconds = statistics.median(run['seconds'] for run in results)
+    phases = {phase: round(statistics.median(run['phases'][phase] for run in results if phase in run.get('phases', {})), 3)
+              for phase in results[0].get('phases', {}) if phase != 'before_script'}
+    print(f"cold start: {seconds:.2f}s to first render ({', '.join(f'{p} {s}s' for p, s in phases.items())})")
+    return {'seconds': round(seconds, 3), 'phases': phases, 'runs': results}
+
+
+# --- Tabs ---
+def bench_tabs(scale, repeats=3, timeout=300, tabs=None):
+    """Renders every tab headlessly; returns cold and warm render times and memory per tab."""
+    from streamlit.testing.v1 import AppTest
+
+    os.environ["SPORTSPHERE_SCALE"] = str(scale)
+    # Keep anything the app writes away from the real database
+    os.environ.setdefault("SPORTSPHERE_DB", os.path.join(tempfile.mkdtemp(prefix="sportsphere-bench-"), "bench.db"))
+
+    reset_peak_rss()
+    start = time.perf_counter()
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout).run()
+    startup = {'seconds': round(time.perf_counter() - start, 3), 'rss_mb': rss_mb(), 'peak_rss_mb': peak_rss_mb(),
+               'errors': [e.message for e in at.exception]}
+    print(f"startup: {startup['seconds']:.2f}s, RSS {startup['rss_mb']} MB")
+
+    results = {}
+    for tab in tabs or at.sidebar.radio[0].options:
+        rss_before = rss_mb()
+        reset_peak_rss()
+        start = time.perf_counter()
+        at.sidebar.radio[0].set_value(tab).run()
+        cold = time.perf_counter() - start
+        errors = [e.message for e in at.exception]
+        peak = peak_rss_mb()
+        warm = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            at.run()
+            warm.append(time.perf_counter() - start)
+        results[tab] = {
+            'cold_seconds': round(cold, 3),
+            'warm_seconds': round(statistics.median(warm), 3) if warm else None,
+            'warm_runs': [round(seconds, 3) for seconds in warm],
+            'rss_before_mb': rss_before,
+            'rss_after_mb': rss_mb(),
+            'peak_rss_mb': peak,
+            'errors': errors,
+        }
+        print(f"{tab}: cold {cold:.3f}s, warm {results[tab]['warm_seconds']}s, "
+              f"RSS {rss_before} -> {results[tab]['rss_after_mb']} MB" + (f", ERRORS {errors}" if errors else ""))
+
+    return startup, results
+
+
+def bench_datasets(scale, snapshot_dir=None):
+    """Load time and memory of every dataset as the app holds them (snapshot if one matches, else generated)."""
+    import datagen
+    import registry
+
+    snapshot_dir = snapshot_dir or os.environ.get("SPORTSPHERE_DATA_DIR", os.path.join(os.path.dirname(APP_PATH), "data"))
+    data = registry.DatasetRegistry(datagen.DataGenerator(seed=datagen.DEFAULT_SEED, scale=scale), snapshot_dir)
+    results = {}
+    for name in data:
+        start = time.perf_counter()
+        df = data[name]
+        results[name] = {'load_seconds': round(time.perf_counter() - start, 3), **frame_memory({name: df})[name]}
+    return results
+
+
+# --- Report ---
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(APP_PATH),
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment():
+    import numpy
+    import pandas
+    import streamlit
+
+    return {
+        'commit': _git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'pandas': pandas.__version__,
+        'numpy': numpy.__version__,
+        'streamlit': streamlit.__version__,
+    }
+
+
+def compare(baseline, report, tolerance=0.25, min_seconds=0.05):
+    """Timings and memory that got worse than ``baseline`` by more than ``tolerance`` (a fraction).
+
+    Timings below ``min_seconds`` in both reports are ignored as noise.
+    """
+    regressions = []
+
+    def check(label, old, new, floor=0.0):
+        if old is None or new is None or max(old, new) < floor:
+            return
+        if new > old * (1 + tolerance):
+            regressions.append(f"{label}: {old} -> {new} (+{(new / old - 1) * 100 if old else float('inf'):.0f}%)")
+
+    old_generation = {run['scale']: run for run in baseline.get('generation', [])}
+    for run in report.get('generation', []):
+        old = old_generation.get(run['scale'])
+        if old:
+            check(f"generate scale={run['scale']:g} seconds", old['seconds'], run['seconds'], min_seconds)
+            check(f"generate scale={run['scale']:g} peak RSS MB", old['peak_rss_mb'], run['peak_rss_mb'])
+    old_scheduling = {(run['format'], run['teams']): run for run in baseline.get('scheduling', [])}
+    for run in report.get('scheduling', []):
+        old = old_scheduling.get((run['format'], run['teams']))
+        if old:
+            check(f"schedule {run['format']} teams={run['teams']} seconds", old['seconds'], run['seconds'], min_seconds)
+    if 'cold_start' in baseline and 'cold_start' in report:
+        check("cold start seconds", baseline['cold_start']['seconds'], report['cold_start']['seconds'], min_seconds)
+    old_tabs = baseline.get('tabs', {})
+    for tab, result in report.get('tabs', {}).items():
+        old = old_tabs.get(tab)
+        if old:
+            check(f"{tab} cold seconds", old['cold_seconds'], result['cold_seconds'], min_seconds)
+            check(f"{tab} warm seconds", old['warm_seconds'], result['warm_seconds'], min_seconds)
+        if result['errors']:
+            regressions.append(f"{tab}: {result['errors'][0]}")
+    old_datasets = baseline.get('datasets', {})
+    for name, result in report.get('datasets', {}).items():
+        if name in old_datasets:
+            check(f"{name} bytes", old_datasets[name]['bytes'], result['bytes'])
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Sportsphere data generation and tab rendering.")
+    parser.add_argument("--scales", type=float, nargs="+", default=[0.1, 1.0], help="Generation scale factors")
+    parser.add_argument("--app-scale", type=float, default=1.0, help="Scale the app is rendered at")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeats", type=int, default=3, help="Warm reruns per tab")
+    parser.add_argument("--tabs", nargs="+", help="Only these tabs (labels as shown in the sidebar)")
+    parser.add_argument("--schedule-teams", type=int, nargs="+", default=[100, 1000],
+                        help="Team counts to benchmark fixture scheduling at")
+    parser.add_argument("--cold-starts", type=int, default=3, help="Fresh-interpreter first renders to time")
+    parser.add_argument("--skip-generation", action="store_true")
+    parser.add_argument("--skip-scheduling", action="store_true")
+    parser.add_argument("--skip-tabs", action="store_true")
+    parser.add_argument("--skip-cold-start", action="store_true")
+    parser.add_argument("--out", default="bench.json", help="Report path")
+    parser.add_argument("--compare", metavar="BASELINE", help="Report to compare against; exits 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown/growth vs the baseline")
+    args = parser.parse_args()
+
+    report = {'version': REPORT_VERSION, 'environment': environment(), 'app_scale': args.app_scale}
+    if not args.skip_generation:
+        report['generation'] = bench_generation(args.scales, args.seed)
+    if not args.skip_scheduling:
+        report['scheduling'] = bench_scheduling(args.schedule_teams)
+    report['datasets'] = bench_datasets(args.app_scale)
+    if not args.skip_cold_start:
+        report['cold_start'] = bench_cold_start(args.app_scale, args.cold_starts)
+    if not args.skip_tabs:
+        report['startup'], report['tabs'] = bench_tabs(args.app_scale, args.repeats, tabs=args.tabs)
+    report['peak_rss_mb'] = process_peak_rss_mb()
+
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Report written to {args.out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), report, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
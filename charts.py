@@ -0,0 +1,161 @@
+"""Server-side chart data for the Plotly figures.
+
+Raw frames are never handed to Plotly. Chart data is aggregated first (time
+buckets, group-by), long series are downsampled with Largest-Triangle-Three-
+Buckets, which keeps a line's visual shape with a few hundred points, and the
+finished figures are cached by their parameters. A figure whose serialized
+JSON exceeds ``MAX_PAYLOAD_BYTES`` is rebuilt with fewer points.
+
+Plotly is imported by the figure builders rather than at module load, so it
+only costs startup time once a chart is actually drawn.
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_POINTS = 500
+MIN_POINTS = 20
+MAX_PAYLOAD_BYTES = 250_000
+
+# Time bucket label -> pandas frequency
+BUCKETS = {"Day": 'D', "Week": 'W-MON', "Month": 'MS'}
+
+
+# --- Aggregation ---
+def time_buckets(df, time_column, freq, value=None, how='count', by=None):
+    """One row per time bucket (and ``by`` group): the row count, or ``how`` of ``value``.
+
+    Empty buckets inside the range are kept as zeros so lines don't skip gaps.
+    """
+    keys = [pd.Grouper(key=time_column, freq=freq)] + ([by] if by else [])
+    grouped = df.groupby(keys, observed=True)
+    series = grouped.size() if value is None else grouped[value].agg(how)
+    name = value or 'count'
+    if by is None:
+        return series.asfreq(freq, fill_value=0).rename(name).reset_index()
+    wide = series.unstack(by, fill_value=0).asfreq(freq, fill_value=0)
+    return wide.stack().rename(name).reset_index()
+
+
+def summary_runs(summaries):
+    """Runs parsed from ``"N runs, M wickets"`` performance summaries (NaN where missing).
+
+    Each distinct summary is parsed once and mapped back to the rows by category code.
+    """
+    values = pd.Categorical(summaries)
+    runs = pd.Series(values.categories, dtype=object).str.extract(r'^(\d+) runs', expand=False).astype(float).to_numpy()
+    return np.where(values.codes >= 0, runs[values.codes], np.nan)
+
+
+# --- Downsampling ---
+def lttb(x, y, threshold):
+    """Positions of the ``threshold`` points Largest-Triangle-Three-Buckets keeps (first and last always)."""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # threshold - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    kept = np.empty(threshold, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, stop = edges[i], edges[i + 1]
+        if i == threshold - 3:
+            next_x, next_y = x[n - 1], y[n - 1]
+        else:
+            next_x, next_y = x[stop:edges[i + 2]].mean(), y[stop:edges[i + 2]].mean()
+        # Twice the area of the triangle (previous kept point, candidate, next bucket's mean)
+        areas = np.abs((x[a] - next_x) * (y[start:stop] - y[a]) - (x[a] - x[start:stop]) * (next_y - y[a]))
+        a = start + int(np.argmax(areas))
+        kept[i + 1] = a
+    return kept
+
+
+def _numeric(values):
+    values = pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.to_numpy(dtype='datetime64[ns]').astype(np.int64)
+    return values.to_numpy(dtype=np.float64)
+
+
+def downsample(df, x, y, max_points=DEFAULT_MAX_POINTS, by=None):
+    """``df`` reduced to at most ``max_points`` points per series (each ``by`` group is a series)."""
+    if by is None:
+        if len(df) <= max_points:
+            return df
+        return df.iloc[lttb(_numeric(df[x]), _numeric(df[y]), max_points)]
+    parts = [downsample(group, x, y, max_points) for _, group in df.groupby(by, observed=True, sort=False)]
+    return pd.concat(parts, ignore_index=True) if parts else df
+
+
+# --- Figures ---
+def payload_bytes(fig):
+    return len(fig.to_json())
+
+
+def capped_figure(build, max_points=DEFAULT_MAX_POINTS, max_bytes=MAX_PAYLOAD_BYTES):
+    """``build(max_points)``, halving ``max_points`` until the figure's JSON fits in ``max_bytes``."""
+    fig = build(max_points)
+    while payload_bytes(fig) > max_bytes and max_points > MIN_POINTS:
+        max_points = max(MIN_POINTS, max_points // 2)
+        fig = build(max_points)
+    return fig
+
+
+def runs_over_time(matches_df, freq):
+    import plotly.express as px
+
+    df = matches_df[['date']].assign(runs=summary_runs(matches_df['performance_summary']))
+    totals = time_buckets(df, 'date', freq, value='runs', how='sum')
+    return capped_figure(lambda max_points: px.line(
+        downsample(totals, 'date', 'runs', max_points), x='date', y='runs', title="Runs Scored Over Time",
+        labels={'date': 'Date', 'runs': 'Runs'}))
+
+
+def feed_volume(feed_df, freq):
+    import plotly.express as px
+
+    counts = time_buckets(feed_df, 'timestamp', freq, by='event_type')
+    return capped_figure(lambda max_points: px.line(
+        downsample(counts, 'timestamp', 'count', max_points, by='event_type'), x='timestamp', y='count',
+        color='event_type', title="Feed Activity Over Time",
+        labels={'timestamp': 'Date', 'count': 'Events', 'event_type': 'Event'}))
+
+
+def sales_by_category(shop_df):
+    import plotly.express as px
+
+    sales = (
+        shop_df.assign(revenue=shop_df['price'] * shop_df['sold_count'])
+        .groupby('category', observed=True).agg(units=('sold_count', 'sum'), revenue=('revenue', 'sum'))
+        .reset_index().sort_values('units', ascending=False)
+    )
+    return px.bar(sales, x='category', y='units', hover_data={'revenue': ':.2f'}, color='category',
+                  title="Units Sold by Category", labels={'category': 'Category', 'units': 'Units Sold'})
+
+
+class FigureCache:
+    """LRU of finished figures keyed by (chart, source versions, parameters)."""
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._figures = OrderedDict()
+
+    def get(self, chart, versions, params, build):
+        key = (chart, versions, params)
+        with self._lock:
+            fig = self._figures.get(key)
+            if fig is not None:
+                self._figures.move_to_end(key)
+                return fig
+        fig = build()
+        with self._lock:
+            self._figures[key] = fig
+            while len(self._figures) > self.max_entries:
+                self._figures.popitem(last=False)
+        return fig
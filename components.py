@@ -0,0 +1,163 @@
+"""Reusable Streamlit UI components for Sportsphere."""
+import math
+import re
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import views
+
+
+# --- Paginated card grid ---
+def _page_key(key):
+    return f"{key}_page"
+
+
+def _shift_page(key, step, n_pages):
+    page = st.session_state.get(_page_key(key), 0) + step
+    st.session_state[_page_key(key)] = min(max(page, 0), n_pages - 1)
+
+
+def current_page(key, n_rows, page_size, reset_on=None):
+    """Returns the clamped page number for ``key``, resetting to the first page when ``reset_on`` changes."""
+    n_pages = max(1, math.ceil(n_rows / page_size))
+    filters_key = f"{key}_filters"
+    if reset_on is not None and st.session_state.get(filters_key) != reset_on:
+        st.session_state[filters_key] = reset_on
+        st.session_state[_page_key(key)] = 0
+    page = min(max(st.session_state.get(_page_key(key), 0), 0), n_pages - 1)
+    st.session_state[_page_key(key)] = page
+    return page, n_pages
+
+
+def page_slice(df, page, page_size):
+    """Server-side slice of the rows on ``page``; only these rows are ever rendered."""
+    start = page * page_size
+    return df.iloc[start:start + page_size]
+
+
+def pagination_controls(key, page, n_pages, n_rows, page_size):
+    if n_pages <= 1:
+        return
+    col_prev, col_info, col_next = st.columns([0.2, 0.6, 0.2])
+    col_prev.button("◀ Previous", key=f"{key}_prev", disabled=page == 0,
+                    on_click=_shift_page, args=(key, -1, n_pages))
+    first_row = page * page_size + 1
+    last_row = min(n_rows, (page + 1) * page_size)
+    col_info.markdown(
+        f"<p style='text-align: center;'>Page {page + 1} of {n_pages} · showing {first_row}–{last_row} of {n_rows}</p>",
+        unsafe_allow_html=True,
+    )
+    col_next.button("Next ▶", key=f"{key}_next", disabled=page >= n_pages - 1,
+                    on_click=_shift_page, args=(key, 1, n_pages))
+
+
+def card_grid(df, render_card, num_columns=3):
+    """Renders every row of ``df`` as a bordered card, filling ``num_columns`` columns left to right."""
+    cols = st.columns(num_columns)
+    for position, (_, row) in enumerate(df.iterrows()):
+        with cols[position % num_columns]:  # Distribute cards across columns by position, not index label
+            with st.container(border=True):  # Use a container to create a card-like effect
+                render_card(row)
+
+
+def paginated_card_grid(df, render_card, key, page_size=12, num_columns=3, reset_on=None):
+    """Renders ``df`` as bordered cards, one page at a time.
+
+    ``render_card(row)`` draws a single card's contents. Cards fill ``num_columns``
+    columns left to right; the current page is kept in ``st.session_state`` under
+    ``key`` and reset whenever ``reset_on`` (e.g. the active filters) changes.
+    """
+    page, n_pages = current_page(key, len(df), page_size, reset_on)
+    card_grid(page_slice(df, page, page_size), render_card, num_columns)
+    pagination_controls(key, page, n_pages, len(df), page_size)
+
+
+# --- Cursor-based "load more" grid ---
+def _load_more(key, cursor):
+    st.session_state[f"{key}_cursors"].append(cursor)
+
+
+def load_more_card_grid(fetch_page, render_card, key, page_size=12, num_columns=3, reset_on=None):
+    """Renders cursor-addressed pages with a "Load more" button.
+
+    ``fetch_page(limit, cursor)`` returns ``(rows, next_cursor)`` (see ``FeedStore.page``).
+    The cursors of the pages loaded so far live in ``st.session_state``; they are
+    cleared whenever ``reset_on`` changes.
+    """
+    cursors_key, filters_key = f"{key}_cursors", f"{key}_filters"
+    if cursors_key not in st.session_state or st.session_state.get(filters_key) != reset_on:
+        st.session_state[cursors_key] = [None]
+        st.session_state[filters_key] = reset_on
+
+    pages, next_cursor = [], None
+    for cursor in st.session_state[cursors_key]:
+        rows, next_cursor = fetch_page(page_size, cursor)
+        pages.append(rows)
+    card_grid(pd.concat(pages, ignore_index=True) if len(pages) > 1 else pages[0], render_card, num_columns)
+
+    if next_cursor is not None:
+        st.button("Load more", key=f"{key}_load_more", on_click=_load_more, args=(key, next_cursor))
+
+
+# --- Server-paged data grid ---
+def _table_rows(df, sort_column, ascending, filter_column, query, parse_value):
+    """Positions of the rows matching the filter, in sort order."""
+    positions = np.arange(len(df))
+    if query:
+        value = parse_value(filter_column, query) if parse_value else None
+        if value is not None:
+            mask = (df[filter_column] == value).to_numpy(dtype=bool, na_value=False)
+        else:
+            mask = views.search_mask(df[filter_column], query)
+        positions = positions[mask]
+    if sort_column is not None:
+        order = views.sorted_positions(df[sort_column].iloc[positions], ascending)
+        positions = positions[order]
+    return positions
+
+
+def paged_table(df, key, page_size=25, format_page=None, parse_value=None, cached=None):
+    """A sortable, filterable table that only ever sends one page of ``df`` to the browser.
+
+    Sorting and filtering run here over the columnar data. ``format_page(rows)``
+    prepares the visible rows for display (e.g. formatting ids);
+    ``parse_value(column, text)`` may turn a typed filter into an exact value to
+    match (or None to fall back to a substring search); ``cached(params, build)``
+    may memoize the row positions per sort/filter combination.
+    """
+    sortable = [column for column in df.columns if not views.is_list_column(df[column])]
+    col_sort, col_order, col_filter, col_query = st.columns([0.25, 0.15, 0.25, 0.35])
+    sort_column = col_sort.selectbox("Sort by", [None] + sortable, format_func=lambda c: "(table order)" if c is None else c,
+                                     key=f"{key}_sort")
+    ascending = col_order.selectbox("Order", ["Ascending", "Descending"], key=f"{key}_order") == "Ascending"
+    filter_column = col_filter.selectbox("Filter column", list(df.columns), key=f"{key}_filter_column")
+    query = col_query.text_input("Contains", key=f"{key}_query").strip()
+
+    params = (sort_column, ascending, filter_column, query)
+    if sort_column is None and not query:
+        positions = None  # Table order, unfiltered: pages are plain slices
+        n_rows = len(df)
+    else:
+        build = lambda: _table_rows(df, sort_column, ascending, filter_column, query, parse_value)
+        positions = cached(params, build) if cached else build()
+        n_rows = len(positions)
+
+    page, n_pages = current_page(key, n_rows, page_size, reset_on=params)
+    start = page * page_size
+    rows = df.iloc[start:start + page_size] if positions is None else df.iloc[positions[start:start + page_size]]
+    st.dataframe(format_page(rows) if format_page else rows, use_container_width=True, hide_index=True)
+    st.caption(f"{n_rows:,} of {len(df):,} rows")
+    pagination_controls(key, page, n_pages, n_rows, page_size)
+
+
+# --- Styles ---
+def stylesheet(path):
+    """The CSS file at ``path`` minified (comments and layout whitespace stripped) into a ``<style>`` tag."""
+    with open(path) as f:
+        css = f.read()
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{}:;,>])\s*', r'\1', css).replace(';}', '}')
+    return f"<style>{css.strip()}</style>"
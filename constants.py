@@ -0,0 +1,35 @@
+from datetime import datetime
+
+# --- GLOBAL CONSTANTS (shared by app.py, generate_data.py and the data engine) ---
+sports = ['Cricket', 'Football', 'Basketball', 'Badminton', 'Tennis', 'Volleyball']
+team_names = [
+    'Mumbai Mavericks', 'Delhi Dynamos', 'Chennai Chargers', 'Bangalore Blasters',
+    'Kolkata Knights', 'Hyderabad Hawks', 'Pune Panthers', 'Ahmedabad Avengers',
+    'Royal Challengers', 'Super Giants', 'Knight Riders', 'Sunrisers'
+]
+venues = [
+    'Wankhede Stadium', 'Eden Gardens', 'Chinnaswamy Stadium', 'Arun Jaitley Stadium',
+    'MA Chidambaram Stadium', 'Ekana Cricket Stadium', 'Sardar Patel Stadium',
+    'Lords Arena', 'MCG', 'Old Trafford', 'Madison Square Garden', 'Stade de France'
+]
+match_formats = ['T20', 'ODI', 'Test', 'Friendly', 'League', 'Cup Final']
+tournament_formats = ['Knockout', 'Round-robin', 'Group Stage & Playoffs']
+languages = [('en', 'English', True), ('hi', 'Hindi', False), ('es', 'Spanish', False), ('fr', 'French', False)]
+roles = ['Player', 'Scorer', 'Organizer', 'Spectator', 'Coach', 'Umpire']
+issue_types = ['Bug', 'Feature Request', 'Payment Issue', 'Account Issue', 'Other']
+platforms = ['WhatsApp', 'Twitter', 'Facebook', 'Email', 'Instagram', 'LinkedIn']
+feed_event_types = ['Match Result', 'Tournament Announcement', 'MVP Award', 'New Record']
+match_statuses = ['Live', 'Completed', 'Upcoming']
+scoring_statuses = ['Scheduled', 'In Progress', 'Completed']
+participation_statuses = ['Confirmed', 'Pending', 'Declined']
+match_results = ['Won', 'Lost', 'Draw', 'Ongoing']
+genders = ['Male', 'Female', 'Other', 'Prefer not to say']
+media_types = ['Video', 'Image']
+product_categories = ['Equipment', 'Apparel', 'Accessories', 'Footwear']
+share_targets = ['Friends', 'Group', 'Public']
+ticket_statuses = ['Open', 'In Progress', 'Resolved', 'Closed']
+response_statuses = ['Pending', 'Responded']
+
+# Date window for generated data. Current date is June 24, 2025; extend to the end of the year.
+start_date_data = datetime(2024, 1, 1)
+end_date_data = datetime(2025, 12, 31)
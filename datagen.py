@@ -0,0 +1,567 @@
+"""Vectorized synthetic data engine for Sportsphere.
+
+Every column is drawn in bulk from a seeded ``numpy.random.Generator``; Faker is
+only used to fill small pre-sampled pools (names, emails, sentences, ...) that
+are then indexed with random integers. Row counts scale linearly with ``scale``.
+
+Datasets are built in chunks of ``chunk_rows`` rows, each with its own random
+stream derived from (seed, dataset, chunk number). A dataset is therefore the
+same whether its chunks are built one after another or spread over a process
+pool (see ``generate_data.py --workers``).
+"""
+import zlib
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+import schema
+from constants import (
+    sports, team_names, venues, match_formats, tournament_formats, languages,
+    roles, issue_types, platforms, start_date_data, end_date_data,
+    feed_event_types, match_statuses, scoring_statuses, participation_statuses, match_results,
+    genders, media_types, product_categories, share_targets, ticket_statuses, response_statuses,
+)
+
+DEFAULT_SEED = 42
+DEFAULT_POOL_SIZE = 2000
+DEFAULT_CHUNK_ROWS = 100_000
+GUEST_CONTACT_RATE = 0.05  # Share of Contact Us messages sent without an account
+
+# Row counts at scale=1.0 (the sizes the app has always shipped with)
+BASE_ROWS = {
+    "Feed": 500,
+    "Cricket Scores": 300,
+    "Multi-Sport Scores": 300,
+    "Start Scoring": 100,
+    "Start a Tournament": 50,
+    "My Matches": 1000,
+    "My Teams": 200,
+    "My Stats": 1000,
+    "Highlights": 200,
+    "Create Account": 10000,
+    "Shop": 100,
+    "Profile": 10000,
+    "Change Language": len(languages),
+    "Share App": 200,
+    "Help & Support": 200,
+    "Contact Us": 200,
+}
+
+
+# --- Faker pools ---
+class FakerPools:
+    """Lazily pre-sampled Faker values, drawn once per kind and reused for every row."""
+
+    def __init__(self, seed=DEFAULT_SEED, size=DEFAULT_POOL_SIZE):
+        self.seed = seed
+        self.size = size
+        self._pools = {}
+        self._fake = None
+
+    @property
+    def fake(self):
+        # Imported on first use: an app serving a snapshot never generates data, so never pays for Faker
+        if self._fake is None:
+            from faker import Faker
+            self._fake = Faker()
+        return self._fake
+
+    def get(self, kind):
+        if kind not in self._pools:
+            # Re-seed per kind so a pool's contents don't depend on which pools were built first
+            self.fake.seed_instance(zlib.crc32(f"{self.seed}:{self.size}:{kind}".encode()))
+            if kind == 'paragraph':
+                values = [self.fake.paragraph(nb_sentences=3) for _ in range(self.size // 4 or 1)]
+            elif kind == 'word':
+                values = [self.fake.word().capitalize() for _ in range(self.size // 4 or 1)]
+            else:
+                values = [getattr(self.fake, kind)() for _ in range(self.size)]
+            self._pools[kind] = np.array(values, dtype=object)
+        return self._pools[kind]
+
+
+# --- Vectorized column primitives ---
+def choice(rng, values, n):
+    """Equivalent of ``[random.choice(values) for _ in range(n)]``."""
+    values = np.asarray(values, dtype=object)
+    return values[rng.integers(0, len(values), size=n)]
+
+
+def integers(rng, low, high, n):
+    """Equivalent of ``[random.randint(low, high) for _ in range(n)]`` (inclusive bounds)."""
+    return rng.integers(low, high + 1, size=n)
+
+
+def uniform(rng, low, high, n, decimals=1):
+    return np.round(rng.uniform(low, high, size=n), decimals)
+
+
+def dates(rng, start, end, n):
+    """Random dates (midnight) between ``start`` and ``end``, inclusive."""
+    days = rng.integers(0, (end - start).days + 1, size=n)
+    return np.datetime64(start, 's') + days.astype('timedelta64[D]')
+
+
+def timestamps(rng, start, end, n):
+    """Random second-resolution timestamps between ``start`` and ``end``, inclusive."""
+    seconds = rng.integers(0, int((end - start).total_seconds()) + 1, size=n)
+    return (np.datetime64(start, 's') + seconds.astype('timedelta64[s]')).astype('datetime64[ns]')
+
+
+def format_ids(prefix, numbers, width=4):
+    """Format integer keys as prefixed ids, e.g. ``format_ids('UID_', [1]) -> ['UID_0001']``."""
+    return (prefix + pd.Series(np.asarray(numbers)).astype(str).str.zfill(width)).to_numpy(dtype=object)
+
+
+def sequence_ids(prefix, n, width=4, start=1):
+    return format_ids(prefix, np.arange(start, start + n), width)
+
+
+def keys(n, start=1):
+    """Integer keys ``start .. start + n - 1`` for an id column (formatted by ``schema``)."""
+    return np.arange(start, start + n, dtype=np.int32)
+
+
+def concat(*parts):
+    """Element-wise string concatenation of arrays and scalars."""
+    result = ''
+    for part in parts:
+        if not np.isscalar(part):
+            part = pd.Series(part).astype(str).to_numpy(dtype=object)
+        result = result + part
+    return result
+
+
+def split_lists(values, lengths):
+    """A list column (Arrow offsets + values) splitting a flat array into rows of the given lengths."""
+    offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int32)
+    lists = pa.ListArray.from_arrays(pa.array(offsets), pa.array(values, type=pa.string()))
+    return pd.arrays.ArrowExtensionArray(lists)
+
+
+def sample_lists(rng, values, n, k_low, k_high, replace=False):
+    """Equivalent of ``random.sample(values, k=randint(k_low, k_high))`` per row (or choices with ``replace``)."""
+    values = np.asarray(values, dtype=object)
+    lengths = integers(rng, k_low, k_high, n)
+    if replace:
+        flat = values[rng.integers(0, len(values), size=int(lengths.sum()))]
+    else:
+        # A random permutation per row; keep the first k of each
+        perms = rng.random((n, len(values))).argsort(axis=1)
+        mask = np.arange(len(values)) < lengths[:, None]
+        flat = values[perms[mask]]
+    return split_lists(flat, lengths)
+
+
+# --- Key pools ---
+# Primary key of every dataset others refer to: dataset -> id prefix (None for integer keys, see ``schema.KEYS``)
+PRIMARY_KEYS = {
+    "Cricket Scores": 'MID_C',
+    "Multi-Sport Scores": 'MID_M',
+    "My Stats": None,
+    "Create Account": None,
+}
+
+# Foreign-key pools: pool -> datasets whose primary keys it draws from
+KEY_POOLS = {
+    'matches': ("Cricket Scores", "Multi-Sport Scores"),
+    'players': ("My Stats",),  # Users with stats (My Matches, team captains)
+    'users': ("Create Account",),
+}
+
+
+class KeyPools:
+    """Primary keys registered once per generator and sampled in bulk for foreign-key columns.
+
+    Keys are derived from row counts alone (ids are sequential), so every chunk
+    and worker process samples from the same pools without building the
+    referenced datasets, and every sampled key exists in its dataset.
+    """
+
+    def __init__(self, gen):
+        self.gen = gen
+        self._keys = {}
+
+    def keys(self, pool):
+        if pool not in self._keys:
+            parts = [
+                keys(self.gen.rows(name)) if PRIMARY_KEYS[name] is None else sequence_ids(PRIMARY_KEYS[name], self.gen.rows(name))
+                for name in KEY_POOLS[pool]
+            ]
+            self._keys[pool] = parts[0] if len(parts) == 1 else np.concatenate(parts)
+        return self._keys[pool]
+
+    def sample(self, rng, pool, n):
+        """``n`` keys drawn uniformly from ``pool``."""
+        values = self.keys(pool)
+        return values[rng.integers(0, len(values), size=n)]
+
+    def sample_lists(self, rng, pool, n, k_low, k_high):
+        """A list column of ``randint(k_low, k_high)`` keys per row (with replacement)."""
+        lengths = integers(rng, k_low, k_high, n)
+        return split_lists(self.sample(rng, pool, int(lengths.sum())), lengths)
+
+
+# --- Engine ---
+class DataGenerator:
+    """Seeded, scalable generator. Each chunk of each dataset draws from its own random stream."""
+
+    def __init__(self, seed=DEFAULT_SEED, scale=1.0, pool_size=DEFAULT_POOL_SIZE, chunk_rows=DEFAULT_CHUNK_ROWS):
+        self.seed = seed
+        self.scale = scale
+        self.chunk_rows = chunk_rows
+        self.pools = FakerPools(seed, pool_size)
+        self.key_pools = KeyPools(self)
+
+    def rows(self, name):
+        if name == "Change Language":
+            return BASE_ROWS[name]
+        return max(1, int(round(BASE_ROWS[name] * self.scale)))
+
+    def chunks(self, name):
+        """Number of chunks ``name`` is built in."""
+        return -(-self.rows(name) // self.chunk_rows)
+
+    def rng(self, name, chunk=0):
+        return np.random.default_rng([self.seed, zlib.crc32(name.encode()), chunk])
+
+    def fake(self, rng, kind, n):
+        return choice(rng, self.pools.get(kind), n)
+
+    def build_chunk(self, name, chunk, data=None):
+        """Builds rows ``[chunk * chunk_rows, (chunk + 1) * chunk_rows)`` of ``name`` with compact dtypes (see ``schema``).
+
+        ``data`` holds the same chunk of each dataset ``name`` depends on.
+        """
+        start = chunk * self.chunk_rows
+        view = ChunkView(self, name, chunk, start, min(start + self.chunk_rows, self.rows(name)))
+        return schema.apply(name, BUILDERS[name](view, data or {}))
+
+    def build(self, name, data=None):
+        """Builds one whole dataset. ``data`` holds already-built datasets it depends on."""
+        data = data or {}
+        parts = []
+        for chunk in range(self.chunks(name)):
+            start = chunk * self.chunk_rows
+            deps = {dep: data[dep].iloc[start:start + self.chunk_rows] for dep in DEPENDENCIES.get(name, ())}
+            parts.append(self.build_chunk(name, chunk, deps))
+        return merge_chunks(name, parts)
+
+    def build_all(self):
+        data = {}
+        for name in BUILDERS:
+            data[name] = self.build(name, data)
+        return data
+
+
+class ChunkView:
+    """What a builder sees while building one chunk: its own row count, offset and random stream."""
+
+    def __init__(self, gen, name, chunk, start, stop):
+        self.gen = gen
+        self.name = name
+        self.chunk = chunk
+        self.offset = start
+        self.n = stop - start
+        self.pools = gen.pools
+        self.key_pools = gen.key_pools
+
+    def rows(self, name):
+        # Other datasets' sizes (e.g. how many users exist) are always the full counts
+        return self.n if name == self.name else self.gen.rows(name)
+
+    def rng(self, name):
+        return self.gen.rng(name, self.chunk)
+
+    def fake(self, rng, kind, n):
+        return self.gen.fake(rng, kind, n)
+
+
+def merge_chunks(name, parts):
+    """Concatenates a dataset's chunks in order and applies its dataset-wide row order, if any."""
+    return order_rows(name, parts[0].reset_index(drop=True) if len(parts) == 1 else schema.concat(parts))
+
+
+def order_rows(name, df):
+    if name in ORDER_BY:
+        column, ascending = ORDER_BY[name]
+        ordered = df[column].is_monotonic_increasing if ascending else df[column].is_monotonic_decreasing
+        if not ordered:
+            df = df.sort_values(by=column, ascending=ascending, kind='stable', ignore_index=True)
+    return df
+
+
+# --- Dataset builders ---
+def build_feed(gen, data):
+    rng, n = gen.rng("Feed"), gen.rows("Feed")
+    feed_df = pd.DataFrame({
+        'timestamp': timestamps(rng, start_date_data, end_date_data, n),
+        'event_type': choice(rng, feed_event_types, n),
+        'user_name': gen.fake(rng, 'name', n),
+        'team_name': choice(rng, team_names + ['N/A'], n),  # Allow N/A for non-team events
+        'match_id': gen.key_pools.sample(rng, 'matches', n),
+        'message': concat(
+            choice(rng, ['Won by', 'Lost by', 'Declared MVP', 'Set new record'], n), ' ',
+            integers(rng, 1, 100, n), ' ',
+            choice(rng, ['runs', 'wickets', 'points', 'goals', 'medals'], n),
+        ),
+    })
+    return feed_df  # Sorted for recency once all chunks are merged (see ORDER_BY)
+
+
+def build_cricket_scores(gen, data):
+    rng, n = gen.rng("Cricket Scores"), gen.rows("Cricket Scores")
+    return pd.DataFrame({
+        'match_id': sequence_ids('MID_C', n, start=gen.offset + 1),
+        'team1_name': choice(rng, team_names, n),
+        'team2_name': choice(rng, team_names, n),
+        'score_team1': integers(rng, 50, 350, n),
+        'score_team2': integers(rng, 50, 350, n),
+        'overs': concat(integers(rng, 1, 50, n), '.', integers(rng, 0, 5, n)),
+        'wickets': integers(rng, 0, 10, n),
+        'status': choice(rng, match_statuses, n),
+        'current_inning': integers(rng, 1, 2, n),
+        'location': choice(rng, venues, n),
+        # Extend date range for upcoming
+        'match_date': dates(rng, start_date_data, end_date_data + timedelta(days=90), n),
+    })
+
+
+def build_multi_sport_scores(gen, data):
+    rng, n = gen.rng("Multi-Sport Scores"), gen.rows("Multi-Sport Scores")
+    return pd.DataFrame({
+        'sport_name': choice(rng, [s for s in sports if s != 'Cricket'], n),
+        'match_id': sequence_ids('MID_M', n, start=gen.offset + 1),
+        'team1': choice(rng, team_names, n),
+        'team2': choice(rng, team_names, n),
+        'score1': integers(rng, 0, 100, n),
+        'score2': integers(rng, 0, 100, n),
+        'time_elapsed': concat(integers(rng, 0, 90, n), ':', pd.Series(integers(rng, 0, 59, n)).astype(str).str.zfill(2)),
+        'status': choice(rng, match_statuses, n),
+    })
+
+
+def build_start_scoring(gen, data):
+    rng, n = gen.rng("Start Scoring"), gen.rows("Start Scoring")
+    return pd.DataFrame({
+        'match_id': sequence_ids('MID_S', n, start=gen.offset + 1),
+        'sport_type': choice(rng, sports, n),
+        'teams': split_lists(np.stack([choice(rng, team_names, n), choice(rng, team_names, n)], axis=1).ravel(), np.full(n, 2)),
+        'start_time': timestamps(rng, start_date_data, end_date_data, n),
+        'venue': choice(rng, venues, n),
+        'umpires': gen.fake(rng, 'name', n),
+        'scorers': gen.fake(rng, 'name', n),
+        'match_format': choice(rng, match_formats, n),
+        'number_of_overs': choice(rng, [20, 50, None], n).astype(float),
+        'status': choice(rng, scoring_statuses, n),
+    })
+
+
+def build_tournament(gen, data):
+    rng, n = gen.rng("Start a Tournament"), gen.rows("Start a Tournament")
+    return pd.DataFrame({
+        'tournament_id': keys(n, start=gen.offset + 1),
+        'name': concat(gen.fake(rng, 'word', n), ' Cup ', integers(rng, 2024, 2026, n)),
+        'organizer': gen.fake(rng, 'name', n),
+        'start_date': dates(rng, start_date_data, end_date_data, n),
+        'end_date': dates(rng, start_date_data, end_date_data, n) + integers(rng, 5, 30, n).astype('timedelta64[D]'),
+        'teams_list': sample_lists(rng, team_names, n, 4, 8),
+        'location': choice(rng, venues, n),
+        'match_ids': gen.key_pools.sample_lists(rng, 'matches', n, 5, 15),
+        'format': choice(rng, tournament_formats, n),
+    })
+
+
+def build_my_matches(gen, data):
+    rng, n = gen.rng("My Matches"), gen.rows("My Matches")
+    summaries = concat(integers(rng, 0, 100, n), ' runs, ', integers(rng, 0, 5, n), ' wickets')
+    return pd.DataFrame({
+        'user_id': gen.key_pools.sample(rng, 'players', n),  # Limited user IDs for easier selection
+        'match_id': gen.key_pools.sample(rng, 'matches', n),
+        'role': choice(rng, roles, n),
+        'participation_status': choice(rng, participation_statuses, n),
+        'result': choice(rng, match_results, n),
+        'date': dates(rng, start_date_data, end_date_data, n),
+        'performance_summary': np.where(rng.random(n) < 0.7, summaries, None),
+    })
+
+
+def build_my_teams(gen, data):
+    rng, n = gen.rng("My Teams"), gen.rows("My Teams")
+    i = gen.offset + np.arange(n)
+    return pd.DataFrame({
+        'team_id': keys(n, start=gen.offset + 1),
+        # Make team names unique
+        'team_name': concat(choice(rng, team_names, n), ' ', np.array([chr(65 + c) for c in range(26)], dtype=object)[i % 26]),
+        'created_by': gen.fake(rng, 'name', n),
+        'sport_type': choice(rng, sports, n),
+        'players_list': sample_lists(rng, gen.pools.get('name'), n, 5, 15, replace=True),
+        'rating': uniform(rng, 1, 5, n),
+        'wins': integers(rng, 0, 50, n),
+        'losses': integers(rng, 0, 50, n),
+        'logo_url': concat('https://picsum.photos/id/', 100 + i, '/100/100'),  # Placeholder images
+        'captain_id': gen.key_pools.sample(rng, 'players', n),
+    })
+
+
+def build_my_stats(gen, data):
+    rng, n = gen.rng("My Stats"), gen.rows("My Stats")
+    return pd.DataFrame({
+        'user_id': keys(n, start=gen.offset + 1),  # Match with user IDs from My Matches/Profile
+        'matches_played': integers(rng, 0, 50, n),
+        'runs_scored': integers(rng, 0, 2000, n),
+        'wickets_taken': integers(rng, 0, 100, n),
+        'catches': integers(rng, 0, 50, n),
+        'strike_rate': uniform(rng, 50, 200, n),
+        'economy': uniform(rng, 3, 10, n),
+        'average': uniform(rng, 10, 50, n),
+        'MVP_count': integers(rng, 0, 10, n),
+    })
+
+
+def build_highlights(gen, data):
+    rng, n = gen.rng("Highlights"), gen.rows("Highlights")
+    image_urls = concat('https://picsum.photos/id/', 200 + gen.offset + np.arange(n), '/600/400')
+    return pd.DataFrame({
+        'match_id': gen.key_pools.sample(rng, 'matches', n),
+        'media_type': choice(rng, media_types, n),
+        'timestamp': timestamps(rng, start_date_data, end_date_data, n),
+        'player': gen.fake(rng, 'name', n),
+        'event_description': concat(choice(rng, ['Six', 'Wicket', 'Catch', 'Goal', 'Dunk'], n), ' by ', gen.fake(rng, 'name', n)),
+        'url': np.where(rng.random(n) > 0.5, "https://www.youtube.com/watch?v=dQw4w9WgXcQ", image_urls),
+    })
+
+
+def build_create_account(gen, data):
+    rng, n = gen.rng("Create Account"), gen.rows("Create Account")
+    return pd.DataFrame({
+        'user_id': keys(n, start=gen.offset + 1),
+        'name': gen.fake(rng, 'name', n),
+        'email': gen.fake(rng, 'email', n),
+        'phone': gen.fake(rng, 'phone_number', n),
+        'gender': choice(rng, genders[:3], n),  # 'Prefer not to say' only comes from the sign-up form
+        'birthdate': dates(rng, datetime(1980, 1, 1), datetime(2005, 1, 1), n),
+        'location': choice(rng, venues, n),
+        'joined_date': dates(rng, start_date_data, end_date_data, n),
+        'sports_interested_in': sample_lists(rng, sports, n, 1, 4),
+        'role': choice(rng, roles, n),
+    })
+
+
+def build_shop(gen, data):
+    rng, n = gen.rng("Shop"), gen.rows("Shop")
+    return pd.DataFrame({
+        'product_id': keys(n, start=gen.offset + 1),
+        'name': concat(
+            choice(rng, ['Pro', 'Elite', 'Youth', 'Classic'], n), ' ',
+            choice(rng, ['Bat', 'Ball', 'Jersey', 'Shoes', 'Gloves', 'Racket'], n), ' ',
+            gen.fake(rng, 'word', n),
+        ),
+        'price': uniform(rng, 10, 200, n, decimals=2),
+        'category': choice(rng, product_categories, n),
+        'description': gen.fake(rng, 'sentence', n),
+        'image_url': concat('https://picsum.photos/id/', 300 + gen.offset + np.arange(n), '/300/200'),  # Placeholder images
+        'inventory_count': integers(rng, 0, 100, n),
+        'ratings': uniform(rng, 3, 5, n),
+        'sold_count': integers(rng, 0, 500, n),
+    })
+
+
+def build_profile(gen, data):
+    # Profile Data is tied to Create Account Data: every user_id gets a profile entry
+    create_account_df = data["Create Account"]
+    rng, n = gen.rng("Profile"), len(create_account_df)
+    return pd.DataFrame({
+        'user_id': create_account_df['user_id'].to_numpy(),
+        'name': create_account_df['name'].to_numpy(),
+        'photo_url': concat('https://picsum.photos/id/', 400 + gen.offset + np.arange(n), '/200/200'),  # Placeholder images
+        'teams_joined': sample_lists(rng, team_names, n, 0, 3),
+        'matches_played_profile': integers(rng, 0, 100, n),  # Separate column for profile
+        'tournaments': integers(rng, 0, 15, n),
+        'bio': gen.fake(rng, 'sentence', n),
+        'location': choice(rng, venues, n),
+        'achievements': sample_lists(rng, ['MVP', 'Top Scorer', 'Best Bowler', 'Tournament Winner', 'Fair Play Award'], n, 0, 5, replace=True),
+        'level': integers(rng, 1, 100, n),
+    })
+
+
+def build_language(gen, data):
+    return pd.DataFrame(languages, columns=['lang_code', 'language_name', 'is_default'])
+
+
+def build_share_app(gen, data):
+    rng, n = gen.rng("Share App"), gen.rows("Share App")
+    return pd.DataFrame({
+        'user_id': gen.key_pools.sample(rng, 'users', n),
+        'platform': choice(rng, platforms, n),
+        'timestamp': timestamps(rng, start_date_data, end_date_data, n),
+        'shared_to': choice(rng, share_targets, n),
+    })
+
+
+def build_help_support(gen, data):
+    rng, n = gen.rng("Help & Support"), gen.rows("Help & Support")
+    resolved = pd.Series(timestamps(rng, start_date_data, end_date_data, n))
+    return pd.DataFrame({
+        'ticket_id': keys(n, start=gen.offset + 1),
+        'user_id': gen.key_pools.sample(rng, 'users', n),
+        'issue_type': choice(rng, issue_types, n),
+        'description': gen.fake(rng, 'paragraph', n),
+        'status': choice(rng, ticket_statuses, n),
+        'created_at': timestamps(rng, start_date_data, end_date_data, n),
+        'resolved_at': resolved.where(rng.random(n) < 0.7),
+        'agent_id': integers(rng, 1, 50, n),
+    })
+
+
+def build_contact_us(gen, data):
+    rng, n = gen.rng("Contact Us"), gen.rows("Contact Us")
+    user_ids = pd.array(gen.key_pools.sample(rng, 'users', n), dtype='Int32')
+    user_ids[rng.random(n) < GUEST_CONTACT_RATE] = pd.NA  # Allow non-registered users (no user_id)
+    return pd.DataFrame({
+        'contact_id': keys(n, start=gen.offset + 1),
+        'user_id': user_ids,
+        'name': gen.fake(rng, 'name', n),
+        'email': gen.fake(rng, 'email', n),
+        'message': gen.fake(rng, 'paragraph', n),
+        'timestamp': timestamps(rng, start_date_data, end_date_data, n),
+        'response_status': choice(rng, response_statuses, n),
+    })
+
+
+# Datasets whose builder reads the matching rows of another dataset (Profile copies Create Account's users)
+DEPENDENCIES = {
+    "Profile": ("Create Account",),
+}
+
+# Dataset-wide row order, applied after chunks are merged: column, ascending
+ORDER_BY = {
+    "Feed": ('timestamp', False),
+}
+
+# Build order matters: datasets are listed after the datasets they depend on
+BUILDERS = {
+    "Feed": build_feed,
+    "Cricket Scores": build_cricket_scores,
+    "Multi-Sport Scores": build_multi_sport_scores,
+    "Start Scoring": build_start_scoring,
+    "Start a Tournament": build_tournament,
+    "My Matches": build_my_matches,
+    "My Teams": build_my_teams,
+    "My Stats": build_my_stats,
+    "Highlights": build_highlights,
+    "Create Account": build_create_account,
+    "Shop": build_shop,
+    "Profile": build_profile,
+    "Change Language": build_language,
+    "Share App": build_share_app,
+    "Help & Support": build_help_support,
+    "Contact Us": build_contact_us,
+}
+
+
+def generate_all_data(seed=DEFAULT_SEED, scale=1.0, pool_size=DEFAULT_POOL_SIZE, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Generates all synthetic data for the Sportsphere application."""
+    return DataGenerator(seed, scale, pool_size, chunk_rows).build_all()
@@ -0,0 +1,167 @@
+"""Time-ordered event store for the Feed, Share App and Contact Us activity lists.
+
+The base table is sorted newest-first once, when the store is built, and
+partitioned by a few low-cardinality columns (e.g. ``event_type`` and
+``team_name``). Reads of the newest N events, optionally within a partition,
+are then a slice rather than a sort of the whole table. New events go to a
+small sorted buffer that is merged on read and folded into the base table in
+batches; the registry appends committed rows this way instead of rebuilding
+the store.
+
+Pages are addressed by an opaque cursor (the last event returned), so "load
+more" stays correct while new events are being appended at the head.
+"""
+import bisect
+import threading
+
+import numpy as np
+import pandas as pd
+
+
+class FeedStore:
+    """Newest-first event log with per-partition indexes and cursor pagination."""
+
+    def __init__(self, df, time_column, partition_columns=(), flush_size=1024):
+        self.time_column = time_column
+        self.partition_columns = tuple(partition_columns)
+        self.flush_size = flush_size
+        self._lock = threading.Lock()
+        self._columns = list(df.columns)
+        self._next_seq = len(df)
+        # Newly appended events, oldest first: (time_ns, seq, row)
+        self._recent = []
+        base = df.reset_index(drop=True)
+        self._set_base(base, np.arange(len(base), dtype=np.int64))
+
+    def __len__(self):
+        return len(self._base) + len(self._recent)
+
+    # --- Building ---
+    def _set_base(self, base, seqs):
+        times = base[self.time_column].to_numpy(dtype='datetime64[ns]').astype(np.int64)
+        # Newest first; ties broken by the newer (higher) sequence number first
+        order = np.lexsort((-seqs, -times))
+        self._base = base.iloc[order].reset_index(drop=True)
+        self._times = times[order]
+        self._seqs = seqs[order]
+        # Per partition column: value -> code, the code of every row, and value -> newest-first positions
+        self._codes, self._code_of, self._partitions = {}, {}, {}
+        for column in self.partition_columns:
+            codes, uniques = pd.factorize(self._base[column])
+            order = np.argsort(codes, kind='stable')
+            order = order[codes[order] >= 0]  # Missing values belong to no partition
+            bounds = np.cumsum(np.bincount(codes[codes >= 0], minlength=len(uniques)))[:-1]
+            self._codes[column] = codes
+            self._code_of[column] = {value: code for code, value in enumerate(uniques.tolist())}
+            self._partitions[column] = dict(zip(uniques.tolist(), np.split(order, bounds)))
+
+    def append(self, row):
+        """Adds one event (a dict with the store's columns); returns its cursor."""
+        time_ns = pd.Timestamp(row[self.time_column]).value
+        with self._lock:
+            seq = self._next_seq
+            self._next_seq += 1
+            bisect.insort(self._recent, (time_ns, seq, dict(row)))
+            if len(self._recent) >= self.flush_size:
+                self._flush()
+        return f"{time_ns}:{seq}"
+
+    def extend(self, rows):
+        """Adds every event in the ``rows`` frame, in order."""
+        for row in rows.to_dict('records'):
+            self.append(row)
+
+    def _flush(self):
+        """Folds the recent buffer into the base table (one merge per ``flush_size`` appends)."""
+        recent = pd.DataFrame([row for _, _, row in self._recent], columns=self._columns)
+        recent[self.time_column] = pd.to_datetime(recent[self.time_column])
+        base = pd.concat([self._base, recent], ignore_index=True)
+        seqs = np.concatenate([self._seqs, np.array([seq for _, seq, _ in self._recent], dtype=np.int64)])
+        self._recent = []
+        self._set_base(base, seqs)
+
+    # --- Reading ---
+    @staticmethod
+    def _parse_cursor(cursor):
+        if not cursor:
+            return None
+        time_ns, _, seq = cursor.partition(':')
+        return int(time_ns), int(seq)
+
+    @staticmethod
+    def _older(time_ns, seq, cursor):
+        return cursor is None or (time_ns, seq) < cursor
+
+    def _first_older(self, positions, after):
+        """Index into ``positions`` of the first base event older than ``after`` (binary search)."""
+        low, high = 0, len(positions)
+        while low < high:
+            mid = (low + high) // 2
+            position = positions[mid]
+            if (self._times[position], self._seqs[position]) < after:
+                high = mid
+            else:
+                low = mid + 1
+        return low
+
+    def _base_slice(self, filters, after, count):
+        """Up to ``count`` base positions older than ``after`` that match ``filters``, newest first."""
+        for column in filters:
+            if column not in self._partitions:
+                raise KeyError(f"{column!r} is not a partition column")
+        if not filters:
+            start = 0 if after is None else self._first_older(range(len(self._times)), after)
+            return np.arange(start, min(start + count, len(self._times)))
+        # Walk the smallest matching partition and check the other filters through their row codes
+        primary = min(filters, key=lambda c: len(self._partitions[c].get(filters[c], ())))
+        positions = self._partitions[primary].get(filters[primary])
+        if positions is None:
+            return np.empty(0, dtype=np.int64)
+        others = [(self._codes[c], self._code_of[c].get(v, -2)) for c, v in filters.items() if c != primary]
+        start = 0 if after is None else self._first_older(positions, after)
+        found, chunk = [], max(count * 4, 256)
+        while start < len(positions) and sum(len(part) for part in found) < count:
+            candidates = positions[start:start + chunk]
+            for codes, code in others:
+                candidates = candidates[codes[candidates] == code]
+            found.append(candidates)
+            start += chunk
+        return np.concatenate(found)[:count] if found else np.empty(0, dtype=np.int64)
+
+    def page(self, limit, cursor=None, **filters):
+        """Returns ``(rows, next_cursor)``: up to ``limit`` events older than ``cursor``, newest first.
+
+        ``filters`` select partitions, e.g. ``page(20, event_type='MVP Award')``.
+        ``next_cursor`` is None once there is nothing older.
+        """
+        after = self._parse_cursor(cursor)
+        with self._lock:
+            # One extra item tells us whether anything older remains
+            base_positions = self._base_slice(filters, after, limit + 1)
+            base_items = [
+                (int(self._times[p]), int(self._seqs[p]), p) for p in base_positions.tolist()
+            ]
+            recent_items = [
+                (time_ns, seq, row) for time_ns, seq, row in reversed(self._recent)
+                if self._older(time_ns, seq, after) and all(row.get(c) == v for c, v in filters.items())
+            ][:limit + 1]
+            # Merge the two newest-first runs
+            merged = sorted(base_items + recent_items, key=lambda item: (item[0], item[1]), reverse=True)[:limit + 1]
+            has_more = len(merged) > limit
+            merged = merged[:limit]
+            if not recent_items:
+                rows = self._base.iloc[[item for _, _, item in merged]].reset_index(drop=True)
+            else:
+                rows = pd.DataFrame(
+                    [item if isinstance(item, dict) else self._base.iloc[item].to_dict() for _, _, item in merged],
+                    columns=self._columns,
+                )
+        next_cursor = f"{merged[-1][0]}:{merged[-1][1]}" if has_more else None
+        return rows, next_cursor
+
+    def top(self, n, **filters):
+        """The newest ``n`` events, optionally within partitions."""
+        return self.page(n, **filters)[0]
+
+    def partition_values(self, column):
+        return sorted(self._partitions[column])
@@ -0,0 +1,209 @@
+"""Fixture generation and scheduling for tournaments.
+
+Pairings are generated per format as arrays of rounds and participants:
+
+* Round-robin: every team meets every other team once (circle method);
+* Knockout: a seeded single-elimination bracket, with byes for the top seeds
+  when the team count isn't a power of two;
+* Group Stage & Playoffs: round-robin groups whose best teams go into a
+  knockout bracket.
+
+``schedule`` then lays the fixtures out on the calendar in one vectorized
+pass. A round's matches fill the day's slots (venues x matches per venue) and
+spill into the following days; the next round starts the day after, so no team
+plays twice in a day and knockout rounds come after the rounds feeding them.
+"""
+from datetime import time
+
+import numpy as np
+import pandas as pd
+
+from constants import tournament_formats
+
+KNOCKOUT, ROUND_ROBIN, GROUP_STAGE = tournament_formats
+
+# Kick-off times of the matches a venue hosts on one day
+KICKOFFS = (time(10), time(14), time(18))
+
+FIXTURE_COLUMNS = ['round', 'stage', 'home', 'away']
+
+
+# --- Pairings ---
+def round_robin_pairs(n_teams):
+    """``(round, home, away)`` index arrays in which every pair of ``n_teams`` teams meets once."""
+    if n_teams < 2:
+        raise ValueError("a round-robin needs at least two teams")
+    n = n_teams + n_teams % 2  # A dummy team gives the bye when the count is odd
+    rounds = np.arange(n - 1)[:, None]
+    slots = np.arange(n // 2)[None, :]
+
+    def team_at(position):
+        # Circle method: position 0 stays put while the others rotate one place per round
+        return np.where(position == 0, 0, 1 + (position - 1 + rounds) % (n - 1))
+
+    home, away = team_at(slots), team_at(n - 1 - slots)
+    # Alternate home and away so no team is at home every round
+    swap = (rounds + slots) % 2 == 1
+    home, away = np.where(swap, away, home), np.where(swap, home, away)
+    rounds = np.broadcast_to(rounds, home.shape)
+    real = (home < n_teams) & (away < n_teams)
+    return rounds[real], home[real], away[real]
+
+
+def round_robin(teams, stage="League", first_round=0):
+    teams = np.asarray(teams, dtype=object)
+    rounds, home, away = round_robin_pairs(len(teams))
+    return pd.DataFrame({'round': rounds + first_round, 'stage': stage, 'home': teams[home], 'away': teams[away]})
+
+
+def seed_order(size):
+    """Bracket positions of seeds 1..size (a power of two), so the top seeds can only meet late."""
+    order = [1]
+    while len(order) < size:
+        order = [seed for top in order for seed in (top, 2 * len(order) + 1 - top)]
+    return order
+
+
+def knockout_stage_name(n_teams):
+    return {2: "Final", 4: "Semi-final", 8: "Quarter-final"}.get(n_teams, f"Round of {n_teams}")
+
+
+def knockout(teams, first_round=0):
+    """Single-elimination fixtures for ``teams`` (in seed order). Later rounds name their
+    participants after the matches they come from, e.g. ``Winner of Semi-final 2``."""
+    if len(teams) < 2:
+        raise ValueError("a knockout needs at least two teams")
+    size = 1 << (len(teams) - 1).bit_length()
+    # Seeds beyond the team count are byes: their opponent goes straight through
+    entrants = [teams[seed - 1] if seed <= len(teams) else None for seed in seed_order(size)]
+    rows, round_number = [], first_round
+    while len(entrants) > 1:
+        stage = knockout_stage_name(len(entrants))
+        winners, played = [], 0
+        for home, away in zip(entrants[0::2], entrants[1::2]):
+            if home is None or away is None:
+                winners.append(away if home is None else home)
+                continue
+            played += 1
+            rows.append((round_number, stage, home, away))
+            winners.append(f"Winner of {stage} {played}")
+        entrants = winners
+        round_number += 1
+    return pd.DataFrame(rows, columns=FIXTURE_COLUMNS)
+
+
+def group_name(g):
+    """``Group A`` .. ``Group Z``, then ``Group AA``, ``Group AB``, ..."""
+    letters = ""
+    g += 1
+    while g:
+        g, remainder = divmod(g - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return f"Group {letters}"
+
+
+def group_stage(teams, group_size=4, advance=2):
+    """Round-robin groups (teams dealt out in seed order) followed by a knockout of the top ``advance`` of each.
+
+    With a single group (fewer than two groups' worth of teams) its top four
+    play semi-finals, or its top two a final when there are no more than
+    ``group_size`` teams.
+    """
+    n_groups = max(1, len(teams) // group_size)
+    groups = [teams[g::n_groups] for g in range(n_groups)]
+    parts = [round_robin(group, stage=group_name(g)) for g, group in enumerate(groups) if len(group) > 1]
+    fixtures = pd.concat(parts, ignore_index=True)
+    if n_groups == 1:
+        advance = 4 if len(teams) > group_size else 2
+    return pd.concat([fixtures, playoffs(n_groups, advance, first_round=int(fixtures['round'].max()) + 1)],
+                     ignore_index=True)
+
+
+def playoffs(n_groups, advance, first_round=0):
+    """Knockout between the top ``advance`` of each group, seeded by group place.
+
+    Lower places are rotated across groups until no first-round match is
+    between two teams from the same group.
+    """
+    def place(p, groups):
+        return [f"{group_name(g)} #{p + 1}" for g in groups]
+
+    for shift in range(n_groups):
+        rotated = [(g + shift) % n_groups for g in range(n_groups)]
+        qualifiers = place(0, range(n_groups)) + [team for p in range(1, advance) for team in place(p, rotated)]
+        bracket = knockout(qualifiers, first_round)
+        first = bracket[bracket['round'] == first_round]
+        same_group = first['home'].str.split(' #').str[0] == first['away'].str.split(' #').str[0]
+        if not same_group.any():
+            break
+    return bracket
+
+
+def generate_fixtures(tournament_format, teams):
+    """Fixtures for ``teams`` under one of ``constants.tournament_formats``."""
+    teams = list(teams)
+    if tournament_format == ROUND_ROBIN:
+        return round_robin(teams)
+    if tournament_format == KNOCKOUT:
+        return knockout(teams)
+    if tournament_format == GROUP_STAGE:
+        return group_stage(teams)
+    raise ValueError(f"unknown tournament format {tournament_format!r}")
+
+
+# --- Scheduling ---
+def schedule(fixtures, venues, start_date, end_date=None, matches_per_venue=1, kickoffs=KICKOFFS):
+    """Assigns every fixture a date, venue and kick-off time.
+
+    A venue hosts at most ``matches_per_venue`` matches a day (one per kick-off
+    time). Raises ValueError if the fixtures need more days than ``start_date`` ..
+    ``end_date`` allows.
+    """
+    venues = np.asarray(venues, dtype=object)
+    if not len(venues):
+        raise ValueError("at least one venue is needed")
+    matches_per_venue = min(matches_per_venue, len(kickoffs))
+    capacity = len(venues) * matches_per_venue
+
+    fixtures = fixtures.sort_values('round', kind='stable', ignore_index=True)
+    rounds = fixtures['round'].to_numpy()
+    per_round = np.bincount(rounds)
+    days_per_round = -(-per_round // capacity)
+    first_day = np.concatenate([[0], np.cumsum(days_per_round)[:-1]])
+    first_match = np.concatenate([[0], np.cumsum(per_round)[:-1]])
+
+    position = np.arange(len(fixtures)) - first_match[rounds]  # Position of each match within its round
+    day = first_day[rounds] + position // capacity
+    slot = position % capacity
+    days_needed = int(days_per_round.sum())
+    if end_date is not None and days_needed > (end_date - start_date).days + 1:
+        raise ValueError(f"{len(fixtures)} matches need {days_needed} days at {capacity} matches a day; "
+                         f"the tournament has {(end_date - start_date).days + 1}")
+
+    dates = np.datetime64(start_date, 'D') + day.astype('timedelta64[D]')
+    kickoff_offsets = np.array([k.hour * 60 + k.minute for k in kickoffs], dtype='timedelta64[m]')
+    return fixtures.assign(
+        date=dates.astype('datetime64[ns]'),
+        start_time=(dates + kickoff_offsets[slot // len(venues)]).astype('datetime64[ns]'),
+        venue=venues[slot % len(venues)],
+    )
+
+
+def scoring_records(scheduled, sport_type, overs=20):
+    """Start Scoring rows for scheduled fixtures (see ``persistence.ID_FORMATS`` for how they get ids)."""
+    finals = scheduled['stage'].to_numpy() == "Final"
+    return [
+        {
+            'sport_type': sport_type,
+            'teams': [home, away],
+            'start_time': start_time.to_pydatetime(),
+            'venue': venue,
+            'umpires': None,
+            'scorers': None,
+            'match_format': 'Cup Final' if final else 'League',
+            'number_of_overs': overs if sport_type == 'Cricket' else None,
+            'status': 'Scheduled',
+        }
+        for home, away, start_time, venue, final in zip(
+            scheduled['home'], scheduled['away'], scheduled['start_time'], scheduled['venue'], finals)
+    ]
@@ -0,0 +1,131 @@
+"""Precomputed lookup structures over the Sportsphere datasets.
+
+These are built once per dataset version (see ``DatasetRegistry.derived``) so
+that tab reruns do hash lookups instead of merges and full-column scans.
+"""
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+class PlayerIndex:
+    """Profile joined with My Stats, indexed by ``user_id``.
+
+    Serves both the My Stats and Profile tabs: the join runs once, the id lists
+    for the selectboxes are pre-sorted, and selecting a player is a hash lookup.
+    """
+
+    def __init__(self, profile_df, stats_df):
+        # Outer join so stats rows without a profile (and vice versa) stay addressable
+        table = profile_df.merge(stats_df, on='user_id', how='outer')
+        # The outer join introduces missing values; keep integer columns integral rather than float
+        for source in (profile_df, stats_df):
+            for column, dtype in source.dtypes.items():
+                if dtype.kind in 'iu':
+                    table[column] = table[column].astype('Int64')
+        self.table = table.set_index('user_id', drop=False)
+        # Checking uniqueness builds the index's hash table now rather than on the first lookup
+        if not self.table.index.is_unique:
+            raise ValueError("user_id must be unique in Profile and My Stats")
+        self.profile_ids = np.sort(profile_df['user_id'].to_numpy()).tolist()
+        self.stats_ids = np.sort(stats_df['user_id'].to_numpy()).tolist()
+
+    def __contains__(self, user_id):
+        return user_id in self.table.index
+
+    def get(self, user_id):
+        """Returns the joined row for ``user_id`` as a Series, or None if unknown."""
+        try:
+            position = self.table.index.get_loc(user_id)
+        except KeyError:
+            return None
+        return self.table.iloc[position]
+
+
+class MatchHistoryIndex:
+    """My Matches grouped by ``user_id``, each user's rows newest first.
+
+    The table is sorted once by (user_id, date descending), so one user's
+    history is a contiguous slice found by binary search, and per-user result
+    counts are tallied in the same pass.
+    """
+
+    def __init__(self, matches_df):
+        user_ids = matches_df['user_id'].to_numpy()
+        dates = matches_df['date'].to_numpy()
+        # lexsort sorts by the last key first and is stable, so equal dates keep their table order
+        order = np.lexsort((-dates.astype('datetime64[ns]').astype(np.int64), user_ids))
+        self.table = matches_df.take(order).reset_index(drop=True)
+        unique_ids, starts = np.unique(user_ids[order], return_index=True)
+        self.user_ids = unique_ids.tolist()
+        self._bounds = np.append(starts, len(order))
+        self._position = {user_id: position for position, user_id in enumerate(self.user_ids)}
+
+        results = pd.Categorical(self.table['result'])
+        users = np.repeat(np.arange(len(self.user_ids)), np.diff(self._bounds))
+        known = results.codes >= 0
+        n_results = len(results.categories)
+        counts = np.bincount(users[known] * n_results + results.codes[known],
+                             minlength=len(self.user_ids) * n_results).reshape(len(self.user_ids), n_results)
+        self.results = pd.DataFrame(counts, index=pd.Index(self.user_ids, name='user_id'), columns=list(results.categories))
+        self.results.insert(0, 'matches', np.diff(self._bounds))
+
+    def __contains__(self, user_id):
+        return user_id in self._position
+
+    def history(self, user_id):
+        """``user_id``'s matches, newest first (an empty frame for unknown users)."""
+        position = self._position.get(user_id)
+        if position is None:
+            return self.table.iloc[:0]
+        return self.table.iloc[self._bounds[position]:self._bounds[position + 1]]
+
+    def summary(self, user_id):
+        """Match count and count per result (``Won``, ``Lost``, ...) for ``user_id``."""
+        if user_id not in self._position:
+            return pd.Series(0, index=self.results.columns)
+        return self.results.loc[user_id]
+
+
+def list_contains(values, item):
+    """Boolean mask of the rows of an Arrow list column that contain ``item`` (vectorized, no per-row lists)."""
+    lists = pa.array(values)
+    matches = pc.equal(pc.list_flatten(lists), item).fill_null(False)
+    mask = np.zeros(len(lists), dtype=bool)
+    mask[pc.filter(pc.list_parent_indices(lists), matches).to_numpy()] = True
+    return mask
+
+
+class MembershipIndex:
+    """Exploded child table of a list column: item -> positions of the rows whose list contains it.
+
+    Answers "all teams with player X" or "all users interested in Badminton"
+    with one binary search instead of a scan over the column.
+    """
+
+    def __init__(self, values):
+        lists = pa.array(values)
+        codes, items = pd.factorize(pc.list_flatten(lists).to_numpy(zero_copy_only=False))
+        parents = pc.list_parent_indices(lists).to_numpy().astype(np.int64)
+        # One (item, row) pair per row even if a list repeats an item; sorted by item, then row
+        self.n_rows = len(lists)
+        pairs = np.unique(codes.astype(np.int64) * max(self.n_rows, 1) + parents)
+        self.items = items.tolist()
+        self._code_of = {item: code for code, item in enumerate(self.items)}
+        self._parents = pairs % max(self.n_rows, 1)
+        self._bounds = np.searchsorted(pairs // max(self.n_rows, 1), np.arange(len(self.items) + 1))
+
+    def __contains__(self, item):
+        return item in self._code_of
+
+    def rows_containing(self, item):
+        """Sorted row positions whose list contains ``item``."""
+        code = self._code_of.get(item)
+        if code is None:
+            return np.empty(0, dtype=np.int64)
+        return self._parents[self._bounds[code]:self._bounds[code + 1]]
+
+    def counts(self):
+        """Rows per item, e.g. how many users are interested in each sport."""
+        return pd.Series(np.diff(self._bounds), index=self.items).sort_values(ascending=False)
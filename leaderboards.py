@@ -0,0 +1,149 @@
+"""Player leaderboards over My Stats.
+
+Each ``Leaderboard`` keeps one metric sorted once (best first), so the top K
+is a slice and a player's rank or percentile is a binary search. Boards for a
+segment of players (a location, a team, a level band from Profile) are built
+on first use and kept in a small LRU; stat updates are applied to every cached
+board in place instead of re-sorting.
+"""
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+import indexes
+
+# Metric column -> label shown in the app
+METRICS = {
+    'runs_scored': "Runs Scored",
+    'wickets_taken': "Wickets Taken",
+    'MVP_count': "MVP Count",
+    'strike_rate': "Strike Rate",
+    'average': "Average",
+}
+
+# Profile level bands players can be filtered by (inclusive bounds)
+LEVEL_BANDS = {
+    "1-25": (1, 25),
+    "26-50": (26, 50),
+    "51-75": (51, 75),
+    "76-100": (76, 100),
+}
+
+ANY = 'All'
+
+
+class Leaderboard:
+    """Players ranked by one metric, highest first; ties are ordered by user id and share a rank."""
+
+    def __init__(self, user_ids, values):
+        user_ids = np.asarray(user_ids, dtype=np.int64)
+        keys = -np.asarray(values, dtype=np.float64)  # Ascending keys = descending values
+        order = np.lexsort((user_ids, keys))
+        self._keys = keys[order]
+        self._ids = user_ids[order]
+        self._value_of = dict(zip(user_ids.tolist(), (-keys).tolist()))
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, user_id):
+        return user_id in self._value_of
+
+    def top(self, k=10):
+        """The best ``k`` players as ``(rank, user_id, value)`` rows."""
+        keys = self._keys[:k]
+        ranks = np.searchsorted(self._keys, keys, side='left') + 1
+        return pd.DataFrame({'rank': ranks, 'user_id': self._ids[:k], 'value': -keys})
+
+    def rank(self, user_id):
+        """1-based rank of ``user_id`` (players with a higher value + 1), or None if not on the board."""
+        value = self._value_of.get(user_id)
+        if value is None:
+            return None
+        return int(np.searchsorted(self._keys, -value, side='left')) + 1
+
+    def percentile(self, user_id):
+        """Share of the board (0-100) with a value at or below ``user_id``'s."""
+        value = self._value_of.get(user_id)
+        if value is None:
+            return None
+        at_or_below = len(self._keys) - np.searchsorted(self._keys, -value, side='left')
+        return 100.0 * at_or_below / len(self._keys)
+
+    def _locate(self, user_id, value):
+        # Equal values form a run ordered by user id, so two binary searches find the exact position
+        lo = np.searchsorted(self._keys, -value, side='left')
+        hi = np.searchsorted(self._keys, -value, side='right')
+        return lo + int(np.searchsorted(self._ids[lo:hi], user_id))
+
+    def update(self, user_id, value):
+        """Moves (or adds) ``user_id`` to its position for ``value`` without re-sorting the board."""
+        old = self._value_of.get(user_id)
+        if old is not None:
+            position = self._locate(user_id, old)
+            self._keys = np.delete(self._keys, position)
+            self._ids = np.delete(self._ids, position)
+        position = self._locate(user_id, value)
+        self._keys = np.insert(self._keys, position, -value)
+        self._ids = np.insert(self._ids, position, user_id)
+        self._value_of[user_id] = float(value)
+
+
+class LeaderboardEngine:
+    """Leaderboards per metric and player segment over My Stats joined with Profile."""
+
+    CACHE_SIZE = 64
+
+    def __init__(self, profile_df, stats_df):
+        profile = profile_df[['user_id', 'name', 'location', 'teams_joined', 'level']]
+        # Every player with stats is ranked, with or without a profile
+        self.players = stats_df[['user_id', *METRICS]].merge(profile, on='user_id', how='left')
+        self._user_ids = self.players['user_id'].to_numpy(dtype=np.int64)
+        self._position = {user_id: position for position, user_id in enumerate(self._user_ids.tolist())}
+        self._teams = indexes.MembershipIndex(self.players['teams_joined'])
+        self.locations = sorted(self.players['location'].dropna().unique().tolist())
+        self.teams = sorted(self._teams.items)
+        self._boards = OrderedDict()  # (metric, location, team, level band) -> Leaderboard
+
+    def _segment(self, location, team, level):
+        """Boolean mask of the players in a segment (``ANY`` leaves that filter off)."""
+        mask = np.ones(len(self.players), dtype=bool)
+        if location != ANY:
+            mask &= (self.players['location'] == location).to_numpy(dtype=bool, na_value=False)
+        if team != ANY:
+            in_team = np.zeros(len(self.players), dtype=bool)
+            in_team[self._teams.rows_containing(team)] = True
+            mask &= in_team
+        if level != ANY:
+            low, high = LEVEL_BANDS[level]
+            levels = self.players['level']
+            mask &= ((levels >= low) & (levels <= high)).to_numpy(dtype=bool, na_value=False)
+        return mask
+
+    def board(self, metric, location=ANY, team=ANY, level=ANY):
+        """The leaderboard for ``metric`` within a segment, built on first use."""
+        key = (metric, location, team, level)
+        board = self._boards.get(key)
+        if board is not None:
+            self._boards.move_to_end(key)
+            return board
+        mask = self._segment(location, team, level)
+        board = Leaderboard(self._user_ids[mask], self.players[metric].to_numpy(dtype=np.float64)[mask])
+        self._boards[key] = board
+        if len(self._boards) > self.CACHE_SIZE:
+            self._boards.popitem(last=False)
+        return board
+
+    def name(self, user_id):
+        position = self._position.get(user_id)
+        return None if position is None else self.players['name'].iloc[position]
+
+    def update_stats(self, user_id, **values):
+        """Applies new metric values for an existing player to every cached board that ranks them."""
+        position = self._position[user_id]
+        for column, value in values.items():
+            self.players.loc[position, column] = value
+        for (metric, *_), board in self._boards.items():
+            if metric in values and user_id in board:
+                board.update(user_id, values[metric])
@@ -0,0 +1,398 @@
+"""Incremental live-score ingestion for the Cricket and Multi-Sport tabs.
+
+Score events arrive from one or more sources (a tailed JSON-lines file, a TCP
+socket speaking JSON lines, or an in-process queue) and are applied to an
+in-memory ``MatchStateStore`` keyed by ``match_id``. The store versions every
+change per kind (cricket or multi-sport), so each tab redraws only inside a
+``st.fragment`` and only when one of its own matches changed.
+
+Event format (one JSON object per line)::
+
+    {"match_id": "MID_C0001", "type": "ball", "runs": 4, "wicket": false, "extras": 0}
+    {"match_id": "MID_C0001", "type": "innings"}
+    {"match_id": "MID_M0001", "type": "score", "team": 2, "points": 3}
+    {"match_id": "MID_M0001", "type": "clock", "time_elapsed": "45:00"}
+    {"match_id": "MID_M0001", "type": "status", "status": "Completed"}
+"""
+import json
+import logging
+import os
+import queue
+import random
+import socket
+import threading
+import time
+
+import pandas as pd
+
+CRICKET = "Cricket Scores"
+MULTI_SPORT = "Multi-Sport Scores"
+
+# Event type -> {field: (allowed types, required)}; ints exclude bools, which JSON also decodes
+EVENT_FIELDS = {
+    'ball': {'runs': (int, False), 'extras': (int, False), 'wicket': (bool, False), 'extras_only': (bool, False)},
+    'innings': {},
+    'score': {'team': (int, False), 'points': (int, False)},
+    'clock': {'time_elapsed': (str, True)},
+    'status': {'status': (str, True)},
+}
+
+logger = logging.getLogger(__name__)
+
+
+def overs_to_balls(overs):
+    whole, _, balls = str(overs).partition('.')
+    return int(whole or 0) * 6 + int(balls or 0)
+
+
+def balls_to_overs(balls):
+    return f"{balls // 6}.{balls % 6}"
+
+
+def validate_event(event):
+    """Raises ValueError unless ``event`` is an object with a known type and well-typed fields."""
+    if not isinstance(event, dict):
+        raise ValueError(f"event is not an object: {event!r}")
+    if not isinstance(event.get('match_id'), str):
+        raise ValueError(f"missing or invalid match_id: {event!r}")
+    fields = EVENT_FIELDS.get(event.get('type'))
+    if fields is None:
+        raise ValueError(f"unknown event type: {event!r}")
+    for field, (kind, required) in fields.items():
+        if field not in event:
+            if required:
+                raise ValueError(f"missing {field}: {event!r}")
+            continue
+        value = event[field]
+        if not isinstance(value, kind) or (kind is int and isinstance(value, bool)):
+            raise ValueError(f"invalid {field}: {event!r}")
+    for field in ('runs', 'extras', 'points'):
+        if event.get(field, 0) < 0:
+            raise ValueError(f"negative {field}: {event!r}")
+    if event.get('team', 1) not in (1, 2):
+        raise ValueError(f"team must be 1 or 2: {event!r}")
+
+
+# --- Match state store ---
+class MatchStateStore:
+    """Current state of every match, keyed by ``match_id``, with a change log by version.
+
+    ``versions`` counts the changes per kind; a kind's cached frame is patched
+    with just the rows of the matches that changed since it was last read.
+    """
+
+    def __init__(self, cricket_df, multi_sport_df):
+        self._lock = threading.Lock()
+        self.versions = {CRICKET: 0, MULTI_SPORT: 0}
+        self._matches = {}  # match_id -> row dict (same columns as the source frame)
+        self._kinds = {}  # match_id -> CRICKET / MULTI_SPORT
+        self._balls = {}  # match_id -> legal balls bowled in the current innings (cricket only)
+        self._changed = {}  # match_id -> version (of its kind) of its last change
+        self._frames = {}  # kind -> (version, DataFrame, {match_id: row position}) cache
+        self._dirty = {CRICKET: set(), MULTI_SPORT: set()}  # Match ids changed since the cached frame
+        self._columns = {CRICKET: list(cricket_df.columns), MULTI_SPORT: list(multi_sport_df.columns)}
+        for kind, df in ((CRICKET, cricket_df), (MULTI_SPORT, multi_sport_df)):
+            for row in df.to_dict('records'):
+                self._matches[row['match_id']] = row
+                self._kinds[row['match_id']] = kind
+                if kind == CRICKET:
+                    self._balls[row['match_id']] = overs_to_balls(row['overs'])
+
+    def __contains__(self, match_id):
+        return match_id in self._matches
+
+    def apply(self, event):
+        """Applies one event; returns False if it names an unknown match or a type that match doesn't take.
+
+        Raises ValueError, before changing anything, if the event is malformed (see ``validate_event``).
+        """
+        validate_event(event)
+        match_id = event['match_id']
+        with self._lock:
+            match = self._matches.get(match_id)
+            if match is None:
+                return False
+            kind = self._kinds[match_id]
+            if kind == CRICKET:
+                applied = self._apply_cricket(match_id, match, event)
+            else:
+                applied = self._apply_multi_sport(match, event)
+            if applied:
+                self.versions[kind] += 1
+                self._changed[match_id] = self.versions[kind]
+                self._dirty[kind].add(match_id)
+            return applied
+
+    def apply_many(self, events):
+        return sum(self.apply(event) for event in events)
+
+    def _apply_cricket(self, match_id, match, event):
+        kind = event.get('type')
+        if kind == 'ball':
+            batting = 'score_team1' if match['current_inning'] == 1 else 'score_team2'
+            match[batting] += event.get('runs', 0) + event.get('extras', 0)
+            if not event.get('extras_only'):  # Wides and no-balls aren't legal deliveries
+                self._balls[match_id] += 1
+                match['overs'] = balls_to_overs(self._balls[match_id])
+            if event.get('wicket'):
+                match['wickets'] = min(match['wickets'] + 1, 10)
+            match['status'] = 'Live'
+        elif kind == 'innings':
+            match['current_inning'] = 2
+            match['wickets'] = 0
+            self._balls[match_id] = 0
+            match['overs'] = balls_to_overs(0)
+        elif kind == 'status':
+            match['status'] = event['status']
+        else:
+            return False
+        return True
+
+    def _apply_multi_sport(self, match, event):
+        kind = event.get('type')
+        if kind == 'score':
+            column = 'score1' if event.get('team', 1) == 1 else 'score2'
+            match[column] += event.get('points', 1)
+            match['status'] = 'Live'
+        elif kind == 'clock':
+            match['time_elapsed'] = event['time_elapsed']
+        elif kind == 'status':
+            match['status'] = event['status']
+        else:
+            return False
+        return True
+
+    def changed_since(self, kind, version):
+        """``kind`` match ids changed after that kind's ``version``."""
+        with self._lock:
+            return [match_id for match_id, changed in self._changed.items()
+                    if changed > version and self._kinds[match_id] == kind]
+
+    def frame(self, kind):
+        """Current state of every ``kind`` match as a DataFrame; only changed rows are redone after a change."""
+        with self._lock:
+            version = self.versions[kind]
+            cached = self._frames.get(kind)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            if cached is None:
+                match_ids = [match_id for match_id in self._matches if self._kinds[match_id] == kind]
+                df = pd.DataFrame([self._matches[match_id] for match_id in match_ids], columns=self._columns[kind])
+                positions = {match_id: i for i, match_id in enumerate(match_ids)}
+            else:
+                # Earlier frames may still be in use (view caches hold them), so patch a copy
+                _, df, positions = cached
+                df = df.copy()
+                changed = list(self._dirty[kind])
+                rows = [positions[match_id] for match_id in changed]
+                for column in self._columns[kind]:
+                    df.iloc[rows, df.columns.get_loc(column)] = [self._matches[match_id][column] for match_id in changed]
+            self._dirty[kind].clear()
+            self._frames[kind] = (version, df, positions)
+            return df
+
+    def live_match_ids(self, kind=None):
+        with self._lock:
+            return [
+                match_id for match_id, match in self._matches.items()
+                if match['status'] == 'Live' and (kind is None or self._kinds[match_id] == kind)
+            ]
+
+
+# --- Event sources ---
+class QueueSource:
+    """In-process producer: anything can ``put`` events onto the queue."""
+
+    def __init__(self):
+        self.queue = queue.Queue()
+
+    def put(self, event):
+        self.queue.put(event)
+
+    def read(self, max_events=1000, timeout=0.1):
+        events = []
+        try:
+            events.append(self.queue.get(timeout=timeout))
+            while len(events) < max_events:
+                events.append(self.queue.get_nowait())
+        except queue.Empty:
+            pass
+        return events
+
+
+class FileSource:
+    """Tails a JSON-lines file, picking up events appended after the last read."""
+
+    def __init__(self, path, from_start=False):
+        self.path = path
+        self._offset = 0 if from_start or not os.path.exists(path) else os.path.getsize(path)
+
+    def read(self, max_events=1000, timeout=0.1):
+        try:
+            with open(self.path) as f:
+                f.seek(self._offset)
+                lines = []
+                while len(lines) < max_events:
+                    line = f.readline()
+                    if not line.endswith('\n'):
+                        break  # Partial line: re-read it once the writer finishes it
+                    lines.append(line)
+                    self._offset = f.tell()
+        except OSError:
+            lines = []
+        if not lines:
+            time.sleep(timeout)
+        return _parse_lines(lines)
+
+
+class SocketSource:
+    """Connects to ``host:port`` and reads newline-delimited JSON events, reconnecting on failure."""
+
+    def __init__(self, host, port):
+        self.address = (host, int(port))
+        self._sock = None
+        self._buffer = b''
+
+    def read(self, max_events=1000, timeout=0.1):
+        if self._sock is None:
+            try:
+                self._sock = socket.create_connection(self.address, timeout=timeout)
+            except OSError:
+                time.sleep(timeout * 10)
+                return []
+        self._sock.settimeout(timeout)
+        try:
+            chunk = self._sock.recv(65536)
+            if not chunk:
+                raise OSError("connection closed")
+            self._buffer += chunk
+        except socket.timeout:
+            pass
+        except OSError:
+            self._sock.close()
+            self._sock = None
+            return []
+        *lines, self._buffer = self._buffer.split(b'\n')
+        return _parse_lines(line.decode() for line in lines)
+
+
+class SimulatedSource:
+    """Demo producer emitting random deltas for matches that are currently live."""
+
+    def __init__(self, store, events_per_second=5, seed=None):
+        self.store = store
+        self.interval = 1.0 / events_per_second
+        self.random = random.Random(seed)
+
+    def read(self, max_events=1000, timeout=0.1):
+        time.sleep(self.interval)
+        live = self.store.live_match_ids()
+        if not live:
+            return []
+        match_id = self.random.choice(live)
+        if match_id.startswith('MID_C'):
+            return [{'match_id': match_id, 'type': 'ball', 'runs': self.random.choice([0, 0, 1, 1, 2, 4, 6]),
+                     'wicket': self.random.random() < 0.05}]
+        return [{'match_id': match_id, 'type': 'score', 'team': self.random.choice([1, 2]), 'points': 1}]
+
+
+def _parse_lines(lines):
+    events = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            events.append(json.loads(line))
+        except ValueError:
+            continue  # Skip malformed lines rather than stalling the feed
+    return events
+
+
+# --- Ingestion ---
+class LiveScoreIngestor:
+    """Background threads pulling events from each source into the store in batches."""
+
+    def __init__(self, store, sources):
+        self.store = store
+        self.sources = list(sources)
+        self.events_applied = 0
+        self.events_rejected = 0  # Malformed events, skipped
+        self._stop = threading.Event()
+        self._threads = []
+
+    def start(self):
+        for source in self.sources:
+            thread = threading.Thread(target=self._run, args=(source,), daemon=True,
+                                      name=f"live-scores-{type(source).__name__}")
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout=1)
+
+    def stats(self):
+        return {'events_applied': self.events_applied, 'events_rejected': self.events_rejected}
+
+    def _run(self, source):
+        while not self._stop.is_set():
+            for event in source.read():
+                # A bad event is counted and skipped; it must not stop this source's thread
+                try:
+                    self.events_applied += self.store.apply(event)
+                except Exception:
+                    self.events_rejected += 1
+                    logger.warning("Rejected live-score event from %s", type(source).__name__, exc_info=True)
+
+
+def sources_from_env(store, environ=os.environ):
+    """Event sources configured by SPORTSPHERE_LIVE_FILE, SPORTSPHERE_LIVE_SOCKET and SPORTSPHERE_LIVE_SIMULATE."""
+    sources = []
+    if environ.get("SPORTSPHERE_LIVE_FILE"):
+        sources.append(FileSource(environ["SPORTSPHERE_LIVE_FILE"]))
+    if environ.get("SPORTSPHERE_LIVE_SOCKET"):
+        host, _, port = environ["SPORTSPHERE_LIVE_SOCKET"].rpartition(':')
+        sources.append(SocketSource(host or 'localhost', port))
+    if environ.get("SPORTSPHERE_LIVE_SIMULATE"):
+        sources.append(SimulatedSource(store))
+    return sources
+
+
+# --- Wiring ---
+class LiveFeed:
+    """A store, the ingestor feeding it and an in-process producer, shared by every session."""
+
+    def __init__(self, store, ingestor, producer, refresh_seconds):
+        self.store = store
+        self.ingestor = ingestor
+        self.producer = producer  # In-process producer: live_feed.producer.put(event)
+        self.refresh_seconds = refresh_seconds
+
+    def updated_since_last_view(self, session_state, kind):
+        """``kind`` match ids changed since this session last drew that kind's matches."""
+        version_key = f"live_version_{kind}"
+        version = self.store.versions[kind]
+        updated = set(self.store.changed_since(kind, session_state.get(version_key, version)))
+        session_state[version_key] = version
+        return updated
+
+
+def start_live_feed(cricket_df, multi_sport_df, environ=os.environ):
+    """Seeds a store from the score datasets and starts ingesting from the configured sources.
+
+    Fragments poll every SPORTSPHERE_LIVE_REFRESH seconds; by default they only
+    poll when an external source is configured, since otherwise nothing changes.
+    """
+    store = MatchStateStore(cricket_df, multi_sport_df)
+    producer = QueueSource()
+    external = sources_from_env(store, environ)
+    ingestor = LiveScoreIngestor(store, [producer] + external).start()
+    refresh = environ.get("SPORTSPHERE_LIVE_REFRESH")
+    if refresh is not None:
+        refresh_seconds = float(refresh) or None
+    else:
+        refresh_seconds = 2.0 if external else None
+    return LiveFeed(store, ingestor, producer, refresh_seconds)
@@ -0,0 +1,236 @@
+"""Persistent, batched write path for the Sportsphere forms.
+
+Form submissions are stored in an embedded SQLite database (WAL mode):
+
+* ids come from atomic per-dataset sequences, allocated in blocks so most
+  submissions never touch the database to get an id;
+* records go onto an in-memory queue and a single writer thread appends them
+  to an append-only ``records`` table, committing in batches;
+* listeners are told about each committed batch, so in-memory datasets can be
+  extended without reloading or copying them per submission.
+"""
+import atexit
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+import pandas as pd
+
+# Dataset -> (id column, id format) for every form that creates records
+ID_FORMATS = {
+    "Start Scoring": ('match_id', "MID_S{:04d}"),
+    "Start a Tournament": ('tournament_id', "TID_{:04d}"),
+    "Create Account": ('user_id', "UID_{:04d}"),
+    "Help & Support": ('ticket_id', "TICKET_{:04d}"),
+    "Contact Us": ('contact_id', "CONT_{:04d}"),
+}
+
+COMMIT_ATTEMPTS = 3  # Tries per batch before it is logged and dropped
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sequences (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS records (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    dataset TEXT NOT NULL,
+    record_id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS records_by_dataset ON records (dataset, seq);
+"""
+
+
+def _connect(path):
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def _to_json(value):
+    if isinstance(value, (datetime, pd.Timestamp)):
+        return value.isoformat()
+    return str(value)  # dates, times and anything else JSON doesn't know
+
+
+class WriteStore:
+    """Append-only record store with batched commits and block-allocated id sequences."""
+
+    def __init__(self, path, batch_size=500, flush_interval=0.05, id_block_size=32):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.id_block_size = id_block_size
+        self._queue = queue.Queue()
+        self._listeners = []
+        self.dropped_records = 0  # Records in batches that could not be committed
+        self._id_lock = threading.Lock()
+        self._id_blocks = {}  # sequence -> [next id, last id reserved]
+        self._id_conn = _connect(path)
+        self._id_conn.executescript(SCHEMA)
+        self._stopped = threading.Event()
+        self._writer = threading.Thread(target=self._run_writer, daemon=True, name="sportsphere-writer")
+        self._writer.start()
+        atexit.register(self.close)
+
+    # --- Id sequences ---
+    def next_id(self, sequence, floor=0):
+        """Next value of ``sequence`` (never below ``floor + 1``); unique across threads and processes."""
+        with self._id_lock:
+            block = self._id_blocks.get(sequence)
+            if block is None or block[0] > block[1] or block[0] <= floor:
+                block = self._reserve_block(sequence, floor)
+                self._id_blocks[sequence] = block
+            value = block[0]
+            block[0] += 1
+            return value
+
+    def reserve_ids(self, sequence, count, floor=0):
+        """``count`` consecutive values of ``sequence`` reserved at once (for bulk submissions)."""
+        with self._id_lock:
+            start, _ = self._reserve_block(sequence, floor, count)
+        return range(start, start + count)
+
+    def _reserve_block(self, sequence, floor, size=None):
+        # BEGIN IMMEDIATE takes the write lock up front, so two processes can't reserve the same block
+        conn = self._id_conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("INSERT OR IGNORE INTO sequences (name, value) VALUES (?, 0)", (sequence,))
+            (current,) = conn.execute("SELECT value FROM sequences WHERE name = ?", (sequence,)).fetchone()
+            start = max(current, floor) + 1
+            last = start + (size or self.id_block_size) - 1
+            conn.execute("UPDATE sequences SET value = ? WHERE name = ?", (last, sequence))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return [start, last]
+
+    def new_record_id(self, dataset, existing_rows=0):
+        """Formatted id for a new ``dataset`` record, e.g. ``UID_10001``."""
+        _, id_format = ID_FORMATS[dataset]
+        return id_format.format(self.next_id(dataset, floor=existing_rows))
+
+    # --- Writes ---
+    def submit(self, dataset, record, existing_rows=0):
+        """Assigns the record its id, queues it for the writer and returns the id immediately."""
+        id_column, _ = ID_FORMATS[dataset]
+        record = dict(record)
+        record[id_column] = self.new_record_id(dataset, existing_rows)
+        self._queue.put((dataset, record))
+        return record[id_column]
+
+    def submit_many(self, dataset, records, existing_rows=0):
+        """``submit`` for a batch of records with one id reservation; returns their ids in order."""
+        if not records:
+            return []
+        id_column, id_format = ID_FORMATS[dataset]
+        ids = [id_format.format(value) for value in self.reserve_ids(dataset, len(records), floor=existing_rows)]
+        for record, record_id in zip(records, ids):
+            self._queue.put((dataset, {**record, id_column: record_id}))
+        return ids
+
+    def add_listener(self, callback):
+        """``callback(dataset, records)`` runs on the writer thread after each committed batch."""
+        self._listeners.append(callback)
+
+    def _run_writer(self):
+        conn = _connect(self.path)
+        while not (self._stopped.is_set() and self._queue.empty()):
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            # Whatever happens to the batch, the writer keeps running and flush() still returns
+            try:
+                if self._commit(conn, batch):
+                    self._notify(batch)
+            except Exception:
+                self.dropped_records += len(batch)
+                logger.exception("Dropped a batch of %d records", len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        conn.close()
+
+    def _commit(self, conn, batch):
+        """Inserts the batch in one transaction, retrying SQLite errors; returns False if it was dropped."""
+        now = datetime.now().isoformat(timespec='seconds')
+        rows = [
+            (dataset, record[ID_FORMATS[dataset][0]], json.dumps(record, default=_to_json), now)
+            for dataset, record in batch
+        ]
+        for attempt in range(1, COMMIT_ATTEMPTS + 1):
+            try:
+                conn.execute("BEGIN")
+                conn.executemany("INSERT INTO records (dataset, record_id, payload, created_at) VALUES (?, ?, ?, ?)",
+                                 rows)
+                conn.execute("COMMIT")
+                return True
+            except sqlite3.Error:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                if attempt == COMMIT_ATTEMPTS:
+                    self.dropped_records += len(batch)
+                    logger.exception("Dropped a batch of %d records after %d attempts", len(batch), attempt)
+                    return False
+                time.sleep(self.flush_interval * attempt)
+        return False
+
+    def _notify(self, batch):
+        by_dataset = {}
+        for dataset, record in batch:
+            by_dataset.setdefault(dataset, []).append(record)
+        for dataset, records in by_dataset.items():
+            for callback in self._listeners:
+                try:
+                    callback(dataset, records)
+                except Exception:
+                    # One failing listener must not stop the others or the writer
+                    logger.exception("Listener %r failed on %d %s records", callback, len(records), dataset)
+
+    def flush(self):
+        """Blocks until every queued record is committed."""
+        self._queue.join()
+
+    def close(self):
+        if not self._stopped.is_set():
+            self._stopped.set()
+            self._writer.join(timeout=5)
+            self._id_conn.close()
+
+    # --- Reads ---
+    def records(self, dataset):
+        """Every committed record for ``dataset``, oldest first."""
+        conn = _connect(self.path)
+        try:
+            rows = conn.execute("SELECT payload FROM records WHERE dataset = ? ORDER BY seq", (dataset,)).fetchall()
+        finally:
+            conn.close()
+        return [json.loads(payload) for (payload,) in rows]
+
+
+def records_to_frame(records, like):
+    """Converts stored records to a frame with ``like``'s columns and datetime dtypes."""
+    frame = pd.DataFrame(records, columns=like.columns)
+    for column, dtype in like.dtypes.items():
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            frame[column] = pd.to_datetime(frame[column]).astype(dtype)
+        elif frame[column].isna().all() and dtype.kind not in 'iub':
+            frame[column] = frame[column].astype(dtype)  # Keep fields the form doesn't fill in at the dataset's dtype
+    return frame
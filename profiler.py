@@ -0,0 +1,260 @@
+"""Opt-in render profiler for the app's tabs.
+
+Set ``SPORTSPHERE_PROFILE=1`` to turn it on. Each script run then records,
+for the selected tab's branch:
+
+* wall time;
+* dataset and derived-structure accesses through ``DatasetRegistry`` (time,
+  rows returned);
+* common pandas operations called by the app (outermost calls only) and the
+  rows they scanned;
+* bytes of the messages sent to the frontend.
+
+Runs are aggregated per tab in a process-wide ``Metrics`` object, shown in a
+sidebar panel and served as Prometheus text (``/metrics``) and JSON
+(``/metrics.json``) on a local port. When profiling is off nothing is patched
+and ``start``/``finish`` return immediately.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+ENABLED = os.environ.get("SPORTSPHERE_PROFILE", "") == "1"
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = int(os.environ.get("SPORTSPHERE_METRICS_PORT", "9464"))
+
+# Operations counted when profiling; each is wrapped once in ``install``
+PANDAS_OPERATIONS = {
+    pd.DataFrame: ('__getitem__', 'merge', 'groupby', 'sort_values', 'query', 'drop_duplicates', 'apply',
+                   'assign', 'iterrows', 'to_dict', 'copy'),
+    pd.Series: ('isin', 'apply', 'map', 'value_counts', 'sort_values', 'unique', 'dropna', 'tolist'),
+}
+
+_local = threading.local()
+
+
+class TabRun:
+    """Measurements of one script run of one tab."""
+
+    def __init__(self, tab):
+        self.tab = tab
+        self.started = time.perf_counter()
+        self.seconds = None
+        self.pandas_ops = 0
+        self.rows_scanned = 0
+        self.bytes_sent = 0
+        self.accesses = []  # (kind, name, seconds, rows)
+
+    def as_dict(self):
+        return {
+            'tab': self.tab,
+            'seconds': self.seconds,
+            'pandas_ops': self.pandas_ops,
+            'rows_scanned': self.rows_scanned,
+            'bytes_sent': self.bytes_sent,
+            'accesses': [
+                {'kind': kind, 'name': name, 'seconds': seconds, 'rows': rows}
+                for kind, name, seconds, rows in self.accesses
+            ],
+        }
+
+
+def current():
+    """The run being recorded on this thread (each session's script runs on its own thread), if any."""
+    return getattr(_local, 'run', None)
+
+
+# --- Instrumentation ---
+def _count_pandas(method):
+    @functools.wraps(method)
+    def counted(self, *args, **kwargs):
+        run = current()
+        if run is None or getattr(_local, 'depth', 0):
+            return method(self, *args, **kwargs)
+        # Only the outermost call counts; pandas calls its own methods internally
+        _local.depth = 1
+        try:
+            run.pandas_ops += 1
+            run.rows_scanned += len(self)
+            return method(self, *args, **kwargs)
+        finally:
+            _local.depth = 0
+    return counted
+
+
+def _timed_access(kind, method, name_of):
+    @functools.wraps(method)
+    def timed(self, *args, **kwargs):
+        run = current()
+        if run is None:
+            return method(self, *args, **kwargs)
+        started = time.perf_counter()
+        value = method(self, *args, **kwargs)
+        rows = len(value) if isinstance(value, (pd.DataFrame, pd.Series)) else None
+        run.accesses.append((kind, name_of(*args), time.perf_counter() - started, rows))
+        return value
+    return timed
+
+
+def _counted_enqueue(enqueue):
+    def counted(msg):
+        run = current()
+        if run is not None:
+            run.bytes_sent += msg.ByteSize()
+        enqueue(msg)
+    counted.profiled = True
+    return counted
+
+
+_install_lock = threading.Lock()
+_installed = False
+
+
+def install(registry_class):
+    """Wraps the pandas operations and ``registry_class`` accessors once per process."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        for cls, names in PANDAS_OPERATIONS.items():
+            for name in names:
+                setattr(cls, name, _count_pandas(getattr(cls, name)))
+        registry_class.__getitem__ = _timed_access('dataset', registry_class.__getitem__, lambda name: name)
+        registry_class.derived = _timed_access('derived', registry_class.derived, lambda key, *_: key)
+        _installed = True
+
+
+# --- Runs ---
+def start(tab):
+    """Starts recording ``tab`` on this thread. A run that never finished (an exception, a rerun) is dropped."""
+    if not ENABLED:
+        return
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    if ctx is not None and not getattr(ctx._enqueue, 'profiled', False):
+        ctx._enqueue = _counted_enqueue(ctx._enqueue)
+    _local.run = TabRun(tab)
+
+
+def finish(metrics):
+    """Stops recording, adds the run to ``metrics`` and returns it (None when profiling is off)."""
+    run = current()
+    if run is None:
+        return None
+    _local.run = None
+    run.seconds = time.perf_counter() - run.started
+    metrics.add(run)
+    return run
+
+
+class Metrics:
+    """Per-tab and per-access totals across every session in the process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.tabs = {}  # tab -> {'renders', 'seconds_sum', 'seconds_max', 'pandas_ops', 'rows_scanned', 'bytes_sent'}
+        self.accesses = {}  # (kind, name) -> {'count', 'seconds_sum'}
+
+    def add(self, run):
+        with self._lock:
+            tab = self.tabs.setdefault(run.tab, dict.fromkeys(
+                ('renders', 'seconds_sum', 'seconds_max', 'pandas_ops', 'rows_scanned', 'bytes_sent'), 0))
+            tab['renders'] += 1
+            tab['seconds_sum'] += run.seconds
+            tab['seconds_max'] = max(tab['seconds_max'], run.seconds)
+            tab['pandas_ops'] += run.pandas_ops
+            tab['rows_scanned'] += run.rows_scanned
+            tab['bytes_sent'] += run.bytes_sent
+            for kind, name, seconds, _ in run.accesses:
+                access = self.accesses.setdefault((kind, name), {'count': 0, 'seconds_sum': 0.0})
+                access['count'] += 1
+                access['seconds_sum'] += seconds
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'tabs': {tab: dict(totals) for tab, totals in self.tabs.items()},
+                'accesses': [{'kind': kind, 'name': name, **totals} for (kind, name), totals in self.accesses.items()],
+            }
+
+    def tab_frame(self):
+        """Per-tab totals as a frame, slowest average first."""
+        tabs = self.snapshot()['tabs']
+        df = pd.DataFrame.from_dict(tabs, orient='index').rename_axis('tab').reset_index()
+        if df.empty:
+            return df
+        df.insert(2, 'seconds_avg', df['seconds_sum'] / df['renders'])
+        return df.sort_values('seconds_avg', ascending=False, ignore_index=True)
+
+    def prometheus(self):
+        """The totals in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = []
+
+        def family(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(f"{name}{{{labels}}} {value}" for labels, value in samples)
+
+        tabs = [(f'tab="{_escape(tab)}"', totals) for tab, totals in snapshot['tabs'].items()]
+        family("sportsphere_tab_renders_total", "counter", "Script runs per tab.",
+               [(labels, totals['renders']) for labels, totals in tabs])
+        family("sportsphere_tab_render_seconds_sum", "counter", "Wall time spent rendering each tab.",
+               [(labels, totals['seconds_sum']) for labels, totals in tabs])
+        family("sportsphere_tab_render_seconds_max", "gauge", "Slowest render of each tab.",
+               [(labels, totals['seconds_max']) for labels, totals in tabs])
+        family("sportsphere_tab_pandas_ops_total", "counter", "Pandas operations called while rendering.",
+               [(labels, totals['pandas_ops']) for labels, totals in tabs])
+        family("sportsphere_tab_rows_scanned_total", "counter", "Rows passed to those pandas operations.",
+               [(labels, totals['rows_scanned']) for labels, totals in tabs])
+        family("sportsphere_tab_bytes_sent_total", "counter", "Bytes of messages sent to the frontend.",
+               [(labels, totals['bytes_sent']) for labels, totals in tabs])
+        accesses = [(f'kind="{access["kind"]}",name="{_escape(access["name"])}"', access)
+                    for access in snapshot['accesses']]
+        family("sportsphere_data_access_total", "counter", "Dataset and derived-structure accesses.",
+               [(labels, access['count']) for labels, access in accesses])
+        family("sportsphere_data_access_seconds_sum", "counter", "Time spent in those accesses.",
+               [(labels, access['seconds_sum']) for labels, access in accesses])
+        return "\n".join(lines) + "\n"
+
+
+def _escape(label):
+    return str(label).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# --- Metrics endpoint ---
+def serve(metrics, host=METRICS_HOST, port=METRICS_PORT):
+    """Serves ``metrics`` on ``http://host:port/metrics`` (and ``/metrics.json``) from a daemon thread.
+
+    Returns the server, or None if the port is taken (e.g. by another app process).
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/metrics":
+                body, content_type = metrics.prometheus().encode(), "text/plain; version=0.0.4; charset=utf-8"
+            elif self.path == "/metrics.json":
+                body, content_type = json.dumps(metrics.snapshot()).encode(), "application/json"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    try:
+        server = ThreadingHTTPServer((host, port), Handler)
+    except OSError:
+        return None
+    threading.Thread(target=server.serve_forever, name="metrics-endpoint", daemon=True).start()
+    return server
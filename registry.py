@@ -0,0 +1,320 @@
+"""Lazy, dependency-aware dataset registry.
+
+The registry behaves like the ``data`` dict the app has always used
+(``data["Feed"]``), but a dataset is only loaded from the snapshot, or
+generated, the first time something asks for it. Datasets it depends on are
+resolved first and cached alongside it.
+
+The registry is shared by every session (``st.cache_resource``), so sessions
+get the cached frames themselves rather than per-session copies. Reference
+datasets, which nothing writes to, are handed out with read-only numpy
+arrays.
+Derived structures are kept in an LRU bounded by a memory budget shared with
+the loaded datasets. One built with an ``append`` hook (e.g. a ``FeedStore``)
+takes committed rows as they arrive instead of being dropped and rebuilt.
+
+Records committed through the forms are appended to a per-dataset tail of
+small frames; the tail is merged into the dataset once, on the next read or
+when it passes ``TAIL_ROWS``, rather than copying the dataset per submission.
+"""
+import itertools
+import logging
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+import datagen
+import persistence
+import schema
+import snapshot
+
+
+logger = logging.getLogger(__name__)
+
+# Read-only lookup data: never written through the forms, so every session can share the same arrays
+REFERENCE_DATASETS = ("Change Language", "My Teams", "Shop")
+
+# Committed rows held outside a dataset before they are merged in without waiting for a read
+TAIL_ROWS = 10_000
+
+# Containers larger than this are sized from a sample of their items
+_SAMPLE_ITEMS = 64
+
+
+def estimate_bytes(value, depth=4):
+    """Approximate memory held by ``value``: arrays and frames exactly, containers and objects by walking them."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=False).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=False))
+    if isinstance(value, (pa.Array, pa.ChunkedArray, pa.Table)):
+        return value.nbytes
+    size = sys.getsizeof(value)
+    if depth == 0:
+        return size
+    if isinstance(value, dict):
+        items = list(itertools.islice(value.items(), _SAMPLE_ITEMS))
+        sampled = sum(estimate_bytes(k, depth - 1) + estimate_bytes(v, depth - 1) for k, v in items)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = list(itertools.islice(value, _SAMPLE_ITEMS))
+        sampled = sum(estimate_bytes(item, depth - 1) for item in items)
+    elif hasattr(value, '__dict__') and not isinstance(value, type):
+        return size + estimate_bytes(vars(value), depth - 1)
+    else:
+        return size
+    return size + (sampled * len(value) // len(items) if items else 0)
+
+
+def _read_only(frame):
+    """Marks the numpy arrays behind ``frame`` read-only in place (no copy), so in-place writes to them raise
+    ValueError instead of changing every session's data. (Arrow-backed columns aren't covered: pandas
+    swaps in new Arrow buffers on write, which callers must not do to shared frames.)"""
+    for block in frame._mgr.blocks:
+        values = block.values
+        if isinstance(values, (pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray)):
+            arrays = (values._data, values._mask)
+        else:
+            arrays = (values, getattr(values, '_ndarray', None))  # Plain blocks; categorical codes, datetimes
+        for array in arrays:
+            # Object arrays stay writable: pandas' deep memory_usage can't read read-only object buffers
+            if isinstance(array, np.ndarray) and array.dtype != object:
+                array.flags.writeable = False
+    return frame
+
+
+class DatasetRegistry(Mapping):
+    """Builds or loads each dataset on first access and caches it for the lifetime of the process.
+
+    ``memory_budget`` (bytes, optional) bounds loaded datasets plus derived
+    structures; least recently used derived structures are evicted to stay
+    under it. Datasets themselves are never evicted.
+    """
+
+    def __init__(self, generator, snapshot_dir=None, write_store=None, memory_budget=None):
+        self.generator = generator
+        self.snapshot_dir = snapshot_dir
+        self.write_store = write_store
+        self.memory_budget = memory_budget
+        self._frames = {}
+        self._frame_bytes = {}
+        self._generated_rows = {}  # name -> rows generated or read from the snapshot, before submitted records
+        self._tails = {}  # name -> frames of committed rows not merged into the dataset yet
+        self._submitted_ids = {}  # name -> ids of the submitted records in the dataset or its tail
+        # Bumped whenever a dataset's contents change (persisted writes, invalidation)
+        self.versions = {name: 0 for name in datagen.BUILDERS}
+        # Derived structures (joins, indexes) keyed by name: (source datasets, value, bytes, append hook),
+        # least recently used first
+        self._derived = OrderedDict()
+        self._derived_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Re-entrant: resolving a dataset resolves its dependencies under the same lock
+        self._lock = threading.RLock()
+        self._use_snapshot = self._snapshot_matches()
+        if write_store is not None:
+            write_store.add_listener(self.append_rows)
+
+    def _snapshot_matches(self):
+        if self.snapshot_dir is None:
+            return False
+        manifest = snapshot.read_manifest(self.snapshot_dir)
+        if manifest is None:
+            return False
+        # Generated data depends on all of these, so a snapshot built with other settings can't stand in for it
+        mismatches = [
+            f"{field} {manifest[field]!r} != {getattr(self.generator, field)!r}"
+            for field in ("seed", "scale", "chunk_rows") if manifest[field] != getattr(self.generator, field)
+        ]
+        if set(manifest["datasets"]) != set(snapshot.FILE_NAMES):
+            mismatches.append("different datasets")
+        if mismatches:
+            logger.warning("Ignoring the snapshot in %s and generating data instead: %s",
+                           self.snapshot_dir, ", ".join(mismatches))
+        return not mismatches
+
+    def __getitem__(self, name):
+        if name not in datagen.BUILDERS:
+            raise KeyError(name)
+        frame = self._frames.get(name)
+        if frame is None or name in self._tails:
+            with self._lock:
+                frame = self._frames.get(name)
+                if frame is None:
+                    frame = self._materialize(name)
+                    self._store(name, frame)
+                elif name in self._tails:
+                    frame = self._merge_tail(name)
+        return frame
+
+    def _store(self, name, frame):
+        if name in REFERENCE_DATASETS:
+            _read_only(frame)
+        self._frames[name] = frame
+        self._frame_bytes[name] = estimate_bytes(frame)
+        self._evict()
+
+    def __iter__(self):
+        return iter(datagen.BUILDERS)
+
+    def __len__(self):
+        return len(datagen.BUILDERS)
+
+    def _materialize(self, name):
+        if self._use_snapshot:
+            # Sharded snapshots hold one part per chunk, so dataset-wide ordering is applied on load
+            frame = datagen.order_rows(name, snapshot.read_dataset(self.snapshot_dir, name))
+        else:
+            # Builders see only generated rows, so generation stays the same whatever has been submitted
+            deps = {dep: self[dep].iloc[:self._generated_rows[dep]] for dep in self.dependencies(name)}
+            frame = self.generator.build(name, deps)
+        self._generated_rows[name] = len(frame)
+        if self.write_store is not None and name in persistence.ID_FORMATS:
+            # Records submitted through the forms, persisted across restarts. Ids that clash with
+            # generated rows (submitted while running at a smaller scale) are shadowed by the generated ones.
+            stored = schema.apply(name, persistence.records_to_frame(self.write_store.records(name), frame))
+            id_column, _ = persistence.ID_FORMATS[name]
+            self._submitted_ids[name] = set(stored[id_column].tolist())
+            stored = stored[~stored[id_column].isin(frame[id_column])]
+            if len(stored):
+                frame = schema.concat([frame, stored])
+        return frame
+
+    def append_rows(self, name, records):
+        """Queues committed records for ``name`` if it's loaded (once per write batch) and updates derived caches.
+
+        Derived structures with an ``append`` hook get the new rows; the rest are dropped.
+        """
+        with self._lock:
+            frame = self._frames.get(name)
+            rows = None
+            if frame is not None:
+                rows = schema.apply(name, persistence.records_to_frame(records, frame))
+                # A batch committed while ``name`` was being materialized was already read from the store
+                id_column, _ = persistence.ID_FORMATS[name]
+                seen = self._submitted_ids.setdefault(name, set())
+                rows = rows[[record_id not in seen for record_id in rows[id_column].tolist()]]
+                if len(rows):
+                    seen.update(rows[id_column].tolist())
+                    tail = self._tails.setdefault(name, [])
+                    tail.append(rows)
+                    if sum(len(part) for part in tail) >= TAIL_ROWS:
+                        self._merge_tail(name)
+            self._drop_derived({name}, appended=rows)
+            self.versions[name] += 1
+
+    def _merge_tail(self, name):
+        frame = schema.concat([self._frames[name], *self._tails.pop(name)])
+        self._store(name, frame)
+        return frame
+
+    @staticmethod
+    def dependencies(name):
+        """Direct and transitive dependencies of ``name``, dependencies first."""
+        ordered = []
+        for dep in datagen.DEPENDENCIES.get(name, ()):
+            for sub_dep in DatasetRegistry.dependencies(dep) + [dep]:
+                if sub_dep not in ordered:
+                    ordered.append(sub_dep)
+        return ordered
+
+    @staticmethod
+    def dependents(name):
+        """Datasets that (transitively) depend on ``name``."""
+        return [other for other in datagen.BUILDERS if name in DatasetRegistry.dependencies(other)]
+
+    def is_loaded(self, name):
+        return name in self._frames
+
+    def loaded(self):
+        return list(self._frames)
+
+    def derived(self, key, sources, build, append=None):
+        """Caches ``build(*frames)`` over the ``sources`` datasets until one of them is invalidated or evicted.
+
+        With a single source, ``append(value, rows)`` (if given) adds committed rows to the cached value in
+        place, so it survives writes to its source.
+        """
+        entry = self._derived.get(key)
+        if entry is None:
+            with self._lock:
+                entry = self._derived.get(key)
+                if entry is None:
+                    return self._build_derived(key, sources, build, append)
+        try:
+            self._derived.move_to_end(key)
+        except KeyError:  # Evicted by another session since the lookup
+            pass
+        self.hits += 1
+        return entry[1]
+
+    def _build_derived(self, key, sources, build, append=None):
+        self.misses += 1
+        value = build(*(self[source] for source in sources))
+        size = estimate_bytes(value)
+        self._derived[key] = (tuple(sources), value, size, append if len(sources) == 1 else None)
+        self._derived_bytes += size
+        self._evict(keep=key)
+        return value
+
+    def _evict(self, keep=None):
+        """Drops least recently used derived structures (never ``keep``) while over the memory budget."""
+        if self.memory_budget is None:
+            return
+        while self.memory_bytes() > self.memory_budget:
+            # A snapshot of the keys: hits reorder the dict without the lock
+            key = next((key for key in list(self._derived) if key != keep), None)
+            if key is None:
+                return
+            self._derived_bytes -= self._derived.pop(key)[2]
+            self.evictions += 1
+
+    def _drop_derived(self, stale, appended=None):
+        """Drops derived structures built from ``stale`` datasets, or appends ``appended`` rows to those that can."""
+        for key, (sources, value, size, append) in list(self._derived.items()):
+            if not stale.intersection(sources):
+                continue
+            if append is not None and appended is not None:
+                if len(appended):
+                    append(value, appended)
+                    growth = estimate_bytes(appended)
+                    self._derived[key] = (sources, value, size + growth, append)
+                    self._derived_bytes += growth
+            else:
+                del self._derived[key]
+                self._derived_bytes -= size
+
+    def memory_bytes(self):
+        """Estimated bytes held by loaded datasets and derived structures."""
+        return sum(self._frame_bytes.values()) + self._derived_bytes
+
+    def cache_stats(self):
+        with self._lock:
+            return {
+                'datasets': len(self._frames),
+                'dataset_bytes': sum(self._frame_bytes.values()),
+                'derived': len(self._derived),
+                'derived_bytes': self._derived_bytes,
+                'memory_budget': self.memory_budget,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def invalidate(self, name):
+        """Drops ``name`` and everything built from it; they are rebuilt on next access."""
+        with self._lock:
+            stale = {name, *self.dependents(name)}
+            for dataset in stale:
+                self._frames.pop(dataset, None)
+                self._tails.pop(dataset, None)
+                self._frame_bytes.pop(dataset, None)
+                self.versions[dataset] += 1
+            self._drop_derived(stale)
@@ -0,0 +1,231 @@
+"""Compact column types for the Sportsphere datasets.
+
+Every dataset goes through ``apply`` before the app sees it:
+
+* columns drawn from a fixed list (statuses, venues, roles, ...) become
+  ``Categorical`` with the list from ``constants`` as categories, so filters
+  like ``df['status'] == 'Live'`` compare small integer codes;
+* Faker-pooled text (names, emails, bios, ...) and match ids, which repeat a
+  few thousand distinct values, become ``Categorical`` with inferred categories;
+* mostly-unique text (urls, product names, ...), and any text typed into the
+  forms, is stored Arrow-backed (``string[pyarrow]``) rather than as one
+  Python object per row, so submissions don't grow a column's categories;
+* list columns (teams, players, achievements, ...) are Arrow list arrays:
+  one offsets buffer and one flat values buffer instead of a Python list
+  per row (see ``indexes.list_contains`` for membership queries);
+* single-prefix ids (``UID_0001``, ``TICKET_0001``, ...) are stored as integer
+  keys and formatted back to strings only for display (``format_key``);
+* other integer columns are downcast to int32.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pandas.api.types import union_categoricals
+
+from constants import (
+    sports, team_names, venues, match_formats, tournament_formats, roles, issue_types, platforms,
+    feed_event_types, match_statuses, scoring_statuses, participation_statuses, match_results,
+    genders, media_types, product_categories, share_targets, ticket_statuses, response_statuses,
+)
+
+
+class Enum:
+    """A column whose values come from a known list; unexpected values extend the categories."""
+
+    def __init__(self, values):
+        self.values = list(dict.fromkeys(values))
+
+    def encode(self, values):
+        if isinstance(values.dtype, pd.CategoricalDtype) and list(values.cat.categories[:len(self.values)]) == self.values:
+            return values
+        extra = pd.Index(values.dropna().unique()).difference(self.values)
+        return values.astype(pd.CategoricalDtype(self.values + sorted(extra.tolist())))
+
+
+class Pooled:
+    """Free text drawn from a small pool of distinct values (Faker names, emails, sentences, ...)."""
+
+    def encode(self, values):
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            return values
+        return values.astype('category')
+
+
+class Text:
+    """Mostly-unique strings, stored contiguously in Arrow buffers."""
+
+    dtype = pd.StringDtype("pyarrow")
+
+    def encode(self, values):
+        return values if values.dtype == self.dtype else values.astype(self.dtype)
+
+
+class ListOf:
+    """Lists of strings; cells read back as Python lists (or ndarrays when iterating rows)."""
+
+    dtype = pd.ArrowDtype(pa.list_(pa.string()))
+
+    def encode(self, values):
+        if values.dtype == self.dtype:
+            return values
+        cells = [list(value) if pd.api.types.is_list_like(value) else None for value in values]
+        return pd.Series(pd.arrays.ArrowExtensionArray(pa.array(cells, type=self.dtype.pyarrow_dtype)), index=values.index)
+
+
+class Key:
+    """Prefixed ids (``UID_0001``) stored as integers; missing or malformed ids are <NA> when ``nullable``."""
+
+    def __init__(self, prefix, width=4, nullable=False):
+        self.prefix = prefix
+        self.width = width
+        self.nullable = nullable
+        self.dtype = 'Int32' if nullable else 'int32'
+        self._pattern = re.compile(rf"^{re.escape(prefix)}(\d+)$")
+
+    def parse(self, value):
+        """The integer key of one formatted id, or None if it isn't one of ours."""
+        match = self._pattern.match(str(value).strip())
+        return int(match.group(1)) if match else None
+
+    def format(self, key):
+        return "None" if pd.isna(key) else f"{self.prefix}{int(key):0{self.width}d}"
+
+    def encode(self, values):
+        if values.dtype.kind in 'iuf' or pd.api.types.infer_dtype(values, skipna=True) in ('integer', 'floating', 'empty'):
+            return values.astype(self.dtype)
+        digits = values.astype('string').str.extract(self._pattern, expand=False)
+        keys = pd.to_numeric(digits, errors='coerce').astype('Int32')
+        if not self.nullable and keys.isna().any():
+            raise ValueError(f"values without the {self.prefix!r} prefix in a non-nullable key column")
+        return keys.astype(self.dtype)
+
+    def decode(self, values):
+        """Vectorized ``format`` over a key column."""
+        keys = pd.Series(values).astype('Int64')
+        formatted = self.prefix + keys.astype('string').str.zfill(self.width)
+        return formatted.fillna("None").astype(object)
+
+
+POOLED = Pooled()
+TEXT = Text()
+LIST = ListOf()
+
+# Id columns mean the same thing in every dataset they appear in
+KEYS = {
+    'user_id': Key('UID_'),
+    'captain_id': Key('UID_'),
+    'team_id': Key('TEAM_'),
+    'tournament_id': Key('TID_'),
+    'product_id': Key('PROD_'),
+    'ticket_id': Key('TICKET_'),
+    'contact_id': Key('CONT_'),
+    'agent_id': Key('AGENT_', nullable=True),
+}
+# Ids typed in by visitors (or missing for guests) may not resolve
+NULLABLE_KEYS = {
+    ("Help & Support", 'user_id'): Key('UID_', nullable=True),
+    ("Contact Us", 'user_id'): Key('UID_', nullable=True),
+}
+
+SCHEMAS = {
+    "Feed": {
+        'event_type': Enum(feed_event_types), 'user_name': POOLED, 'team_name': Enum(team_names + ['N/A']),
+        'match_id': POOLED, 'message': POOLED,
+    },
+    "Cricket Scores": {
+        'match_id': POOLED, 'team1_name': Enum(team_names), 'team2_name': Enum(team_names), 'overs': POOLED,
+        'status': Enum(match_statuses), 'location': Enum(venues),
+    },
+    "Multi-Sport Scores": {
+        'sport_name': Enum(sports), 'match_id': POOLED, 'team1': Enum(team_names), 'team2': Enum(team_names),
+        'time_elapsed': POOLED, 'status': Enum(match_statuses),
+    },
+    "Start Scoring": {
+        'match_id': POOLED, 'sport_type': Enum(sports), 'teams': LIST, 'venue': Enum(venues), 'umpires': TEXT, 'scorers': TEXT,
+        'match_format': Enum(match_formats), 'status': Enum(scoring_statuses),
+    },
+    "Start a Tournament": {
+        'name': TEXT, 'organizer': TEXT, 'teams_list': LIST, 'location': Enum(venues), 'match_ids': LIST,
+        'format': Enum(tournament_formats),
+    },
+    "My Matches": {
+        'match_id': POOLED, 'role': Enum(roles), 'participation_status': Enum(participation_statuses),
+        'result': Enum(match_results), 'performance_summary': POOLED,
+    },
+    "My Teams": {
+        'team_name': TEXT, 'created_by': POOLED, 'sport_type': Enum(sports), 'players_list': LIST, 'logo_url': TEXT,
+    },
+    "Highlights": {
+        'match_id': POOLED, 'media_type': Enum(media_types), 'player': POOLED, 'event_description': TEXT, 'url': POOLED,
+    },
+    "Create Account": {
+        'name': TEXT, 'email': TEXT, 'phone': TEXT, 'gender': Enum(genders), 'location': Enum(venues),
+        'sports_interested_in': LIST, 'role': Enum(roles),
+    },
+    "Shop": {'name': TEXT, 'category': Enum(product_categories), 'description': POOLED, 'image_url': TEXT},
+    "Profile": {
+        'name': POOLED, 'photo_url': TEXT, 'teams_joined': LIST, 'bio': POOLED, 'location': Enum(venues),
+        'achievements': LIST,
+    },
+    "Share App": {'platform': Enum(platforms), 'shared_to': Enum(share_targets)},
+    "Help & Support": {'issue_type': Enum(issue_types), 'description': TEXT, 'status': Enum(ticket_statuses)},
+    "Contact Us": {'name': TEXT, 'email': TEXT, 'message': TEXT, 'response_status': Enum(response_statuses)},
+}
+
+
+def key_spec(column, dataset=None):
+    return NULLABLE_KEYS.get((dataset, column)) or KEYS.get(column)
+
+
+def column_specs(name, columns):
+    """Column -> spec for every column of ``name`` the schema knows about."""
+    specs = dict(SCHEMAS.get(name, {}))
+    for column in columns:
+        key = key_spec(column, name)
+        if key is not None:
+            specs[column] = key
+    return {column: spec for column, spec in specs.items() if column in columns}
+
+
+def apply(name, df):
+    """Returns ``df`` with compact dtypes for dataset ``name`` (a no-op for columns already compact)."""
+    specs = column_specs(name, df.columns)
+    columns = {}
+    for column in df.columns:
+        values = df[column]
+        if column in specs:
+            values = specs[column].encode(values)
+        elif values.dtype == np.int64 and len(values) and np.iinfo(np.int32).min <= values.min() and values.max() <= np.iinfo(np.int32).max:
+            values = values.astype(np.int32)
+        columns[column] = values
+    return pd.DataFrame(columns, index=df.index)
+
+
+def concat(frames):
+    """Concatenates frames keeping categorical columns categorical (categories are merged, in order)."""
+    frames = [frame.copy(deep=False) for frame in frames]
+    for column, dtype in frames[0].dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            merged = union_categoricals([pd.Categorical(frame[column]) for frame in frames], ignore_order=True)
+            for frame in frames:
+                frame[column] = frame[column].astype(merged.dtype)
+    return pd.concat(frames, ignore_index=True)
+
+
+def format_key(column, key, dataset=None):
+    """Display form of one id, e.g. ``format_key('user_id', 42) == 'UID_0042'``."""
+    return key_spec(column, dataset).format(key)
+
+
+def parse_key(column, value, dataset=None):
+    """Integer key of a typed-in id such as ``UID_0042``, or None if it isn't valid."""
+    return key_spec(column, dataset).parse(value)
+
+
+def readable(name, df):
+    """``df`` with its id columns formatted back to strings, for tables shown as-is."""
+    specs = column_specs(name, df.columns)
+    keys = {column: spec.decode(df[column]).to_numpy() for column, spec in specs.items() if isinstance(spec, Key)}
+    return df.assign(**keys) if keys else df
@@ -0,0 +1,327 @@
+"""Ball-by-ball cricket scoring for the Start Scoring tab.
+
+Every delivery is appended to a compact event log: a growable numpy structured
+array (14 bytes per ball, player names interned per match) rather than a
+dict per ball. Closing an innings early is logged too, as an entry with the
+``CLOSED`` extra code, so a replay ends that innings at the same point.
+Innings state (score, overs, run rate, required rate, the current partnership,
+batting and bowling figures) is updated in O(1) as each ball is recorded, so a
+scorecard never replays the log; ``MatchScorer.replay`` exists to rebuild a
+match from its log. ``ScoringEngine`` holds every match a
+process is scoring.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+BALLS_PER_OVER = 6
+MAX_WICKETS = 10
+
+# Delivery.extra codes
+NONE, WIDE, NO_BALL, BYE, LEG_BYE = range(5)
+EXTRA_NAMES = {WIDE: "Wide", NO_BALL: "No Ball", BYE: "Bye", LEG_BYE: "Leg Bye"}
+CLOSED = 5  # Not a delivery: the innings was closed early at this point
+
+DELIVERY = np.dtype([
+    ('innings', 'u1'),
+    ('ball', 'u2'),  # Legal balls bowled in the innings before this delivery
+    ('striker', 'u2'),
+    ('non_striker', 'u2'),
+    ('bowler', 'u2'),
+    ('runs', 'u1'),  # Runs run or hit (off the bat, or byes / extra runs on wides)
+    ('extra', 'u1'),
+    ('wicket', '?'),
+    ('incoming', 'u2'),  # Batter replacing the dismissed striker (NO_PLAYER if none)
+])
+NO_PLAYER = np.iinfo(np.uint16).max
+
+
+class DeliveryLog:
+    """Append-only structured array of deliveries with amortized O(1) appends."""
+
+    def __init__(self, capacity=256):
+        self._data = np.zeros(capacity, dtype=DELIVERY)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def append(self, *fields):
+        if self._size == len(self._data):
+            grown = np.zeros(2 * len(self._data), dtype=DELIVERY)
+            grown[:self._size] = self._data
+            self._data = grown
+        self._data[self._size] = fields
+        self._size += 1
+
+    @property
+    def deliveries(self):
+        """Read-only view of the recorded deliveries."""
+        view = self._data[:self._size]
+        view.flags.writeable = False
+        return view
+
+
+def format_overs(balls):
+    return f"{balls // BALLS_PER_OVER}.{balls % BALLS_PER_OVER}"
+
+
+class Innings:
+    """Running totals of one innings; every field is updated as balls are recorded."""
+
+    def __init__(self, number, batting_team, bowling_team, max_overs, striker, non_striker, bowler, target=None):
+        self.number = number
+        self.batting_team = batting_team
+        self.bowling_team = bowling_team
+        self.max_overs = max_overs
+        self.target = target
+        self.closed = False
+        self.runs = 0
+        self.wickets = 0
+        self.balls = 0  # Legal deliveries
+        self.extras = 0
+        self.striker, self.non_striker, self.bowler = striker, non_striker, bowler
+        self.last_over_bowler = None
+        self.over_runs = 0  # Conceded by the bowler in the current over (for maidens)
+        self.partnership_runs = 0
+        self.partnership_balls = 0
+        self.batters = {}  # name -> [runs, balls, fours, sixes, out]
+        self.bowlers = {}  # name -> [balls, runs, wickets, maidens]
+        self.fall_of_wickets = []  # (score, wickets, overs, batter)
+        self._batter(striker)
+        self._batter(non_striker)
+        self._bowler(bowler)
+
+    def _batter(self, name):
+        return self.batters.setdefault(name, [0, 0, 0, 0, False])
+
+    def _bowler(self, name):
+        return self.bowlers.setdefault(name, [0, 0, 0, 0])
+
+    @property
+    def complete(self):
+        return (
+            self.closed
+            or self.wickets >= MAX_WICKETS
+            or self.balls >= self.max_overs * BALLS_PER_OVER
+            or (self.target is not None and self.runs >= self.target)
+        )
+
+    @property
+    def overs(self):
+        return format_overs(self.balls)
+
+    @property
+    def over_complete(self):
+        """A new bowler is due before the next ball."""
+        return self.balls > 0 and self.balls % BALLS_PER_OVER == 0 and self.bowler is None
+
+    @property
+    def run_rate(self):
+        return self.runs * BALLS_PER_OVER / self.balls if self.balls else 0.0
+
+    @property
+    def required_rate(self):
+        if self.target is None:
+            return None
+        remaining = self.max_overs * BALLS_PER_OVER - self.balls
+        return max(self.target - self.runs, 0) * BALLS_PER_OVER / remaining if remaining else None
+
+    def record(self, runs, extra, wicket, next_batter):
+        """Applies one delivery in O(1)."""
+        legal = extra not in (WIDE, NO_BALL)
+        penalty = 1 if extra in (WIDE, NO_BALL) else 0
+        total = runs + penalty
+        self.runs += total
+        self.partnership_runs += total
+        if extra != NONE:
+            self.extras += penalty + (runs if extra in (WIDE, BYE, LEG_BYE) else 0)
+
+        striker = self._batter(self.striker)
+        if extra != WIDE:
+            striker[1] += 1  # Balls faced (no-balls count, wides don't)
+            self.partnership_balls += 1
+        if extra in (NONE, NO_BALL):
+            striker[0] += runs
+            striker[2] += runs == 4
+            striker[3] += runs == 6
+
+        bowler = self._bowler(self.bowler)
+        conceded = total if extra not in (BYE, LEG_BYE) else 0
+        bowler[1] += conceded
+        self.over_runs += conceded
+        if legal:
+            bowler[0] += 1
+            self.balls += 1
+
+        if wicket:
+            self.wickets += 1
+            bowler[2] += 1
+            striker[4] = True
+            self.fall_of_wickets.append((self.runs, self.wickets, self.overs, self.striker))
+            self.partnership_runs = self.partnership_balls = 0
+            self.striker = next_batter
+            if next_batter is not None:
+                self._batter(next_batter)
+        if runs % 2 == 1:
+            self.striker, self.non_striker = self.non_striker, self.striker
+        if legal and self.balls % BALLS_PER_OVER == 0:
+            if self.over_runs == 0:
+                bowler[3] += 1
+            self.over_runs = 0
+            self.striker, self.non_striker = self.non_striker, self.striker
+            self.last_over_bowler, self.bowler = self.bowler, None
+
+    def change_bowler(self, name):
+        if name == self.last_over_bowler:
+            raise ValueError(f"{name} bowled the previous over")
+        self.bowler = name
+        self._bowler(name)
+
+    def batting_card(self):
+        rows = [
+            (name, runs, balls, fours, sixes, round(100 * runs / balls, 1) if balls else 0.0,
+             "out" if out else ("batting*" if name == self.striker else "batting" if name == self.non_striker else "not out"))
+            for name, (runs, balls, fours, sixes, out) in self.batters.items()
+        ]
+        return pd.DataFrame(rows, columns=['Batter', 'R', 'B', '4s', '6s', 'SR', 'Status'])
+
+    def bowling_card(self):
+        rows = [
+            (name, format_overs(balls), maidens, runs, wickets, round(runs * BALLS_PER_OVER / balls, 2) if balls else 0.0)
+            for name, (balls, runs, wickets, maidens) in self.bowlers.items()
+        ]
+        return pd.DataFrame(rows, columns=['Bowler', 'O', 'M', 'R', 'W', 'Econ'])
+
+
+class MatchScorer:
+    """One cricket match: innings state plus the delivery log it was built from."""
+
+    def __init__(self, match_id, team1, team2, max_overs=20):
+        self.match_id = match_id
+        self.teams = (team1, team2)
+        self.max_overs = max_overs
+        self.log = DeliveryLog()
+        self.players = []  # Interned names; the log stores their positions
+        self._player_ids = {}
+        self.innings = []
+
+    def _player(self, name):
+        if name not in self._player_ids:
+            self._player_ids[name] = len(self.players)
+            self.players.append(name)
+        return self._player_ids[name]
+
+    @property
+    def current(self):
+        return self.innings[-1] if self.innings else None
+
+    @property
+    def complete(self):
+        return len(self.innings) == 2 and self.innings[1].complete
+
+    def start_innings(self, batting_team, striker, non_striker, bowler):
+        if self.current is not None and not self.current.complete:
+            raise ValueError("the current innings is still in progress")
+        if len(self.innings) == 2:
+            raise ValueError("both innings have been played")
+        bowling_team = self.teams[1] if batting_team == self.teams[0] else self.teams[0]
+        target = self.innings[0].runs + 1 if self.innings else None
+        self.innings.append(Innings(len(self.innings) + 1, batting_team, bowling_team, self.max_overs,
+                                    striker, non_striker, bowler, target))
+        return self.current
+
+    def end_innings(self):
+        """Closes the current innings early (a declaration, rain, ...)."""
+        innings = self.current
+        if innings is None or innings.complete:
+            raise ValueError("no innings in progress")
+        self.log.append(innings.number, innings.balls, self._player_or_none(innings.striker),
+                        self._player_or_none(innings.non_striker), self._player_or_none(innings.bowler),
+                        0, CLOSED, False, NO_PLAYER)
+        innings.closed = True
+
+    def _player_or_none(self, name):
+        return NO_PLAYER if name is None else self._player(name)
+
+    def record(self, runs=0, extra=NONE, wicket=False, next_batter=None, bowler=None):
+        """Records one delivery; ``bowler`` is required at the start of each over."""
+        innings = self.current
+        if innings is None or innings.complete:
+            raise ValueError("no innings in progress")
+        if bowler is not None and bowler != innings.bowler:
+            innings.change_bowler(bowler)
+        if innings.bowler is None:
+            raise ValueError("a new bowler is due for this over")
+        if wicket and next_batter is None and innings.wickets + 1 < MAX_WICKETS:
+            raise ValueError("the next batter is required")
+        incoming = self._player(next_batter) if wicket and next_batter is not None else NO_PLAYER
+        self.log.append(innings.number, innings.balls, self._player(innings.striker), self._player(innings.non_striker),
+                        self._player(innings.bowler), runs, extra, wicket, incoming)
+        innings.record(runs, extra, wicket, next_batter)
+
+    def result(self):
+        if not self.complete:
+            return None
+        first, second = self.innings
+        if second.runs > first.runs:
+            return f"{second.batting_team} won by {MAX_WICKETS - second.wickets} wickets"
+        if second.runs < first.runs:
+            return f"{first.batting_team} won by {first.runs - second.runs} runs"
+        return "Match tied"
+
+    def deliveries(self):
+        """The log as a frame with player names, for export."""
+        log = pd.DataFrame(self.log.deliveries)
+        players = np.append(np.asarray(self.players, dtype=object), None)
+
+        def names(column):
+            return players[np.where(log[column] == NO_PLAYER, len(players) - 1, log[column])]
+
+        return log.assign(striker=names('striker'), non_striker=names('non_striker'), bowler=names('bowler'),
+                          extra=log['extra'].map({**EXTRA_NAMES, CLOSED: "Innings closed"}).fillna(''),
+                          incoming=names('incoming'))
+
+    @classmethod
+    def replay(cls, match_id, team1, team2, max_overs, deliveries, players, batting_first):
+        """Rebuilds a match from its logged deliveries (e.g. after a restart)."""
+        scorer = cls(match_id, team1, team2, max_overs)
+
+        def name(position):
+            return None if position == NO_PLAYER else players[position]
+
+        for ball in deliveries:
+            if len(scorer.innings) < ball['innings']:
+                batting_team = batting_first if ball['innings'] == 1 else (team2 if batting_first == team1 else team1)
+                scorer.start_innings(batting_team, name(ball['striker']), name(ball['non_striker']),
+                                     name(ball['bowler']))
+            if ball['extra'] == CLOSED:
+                scorer.end_innings()
+                continue
+            scorer.record(int(ball['runs']), int(ball['extra']), bool(ball['wicket']), name(ball['incoming']),
+                          bowler=name(ball['bowler']))
+        return scorer
+
+
+class ScoringEngine:
+    """Every match being scored in this process, keyed by match id."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._matches = {}
+
+    def __contains__(self, match_id):
+        return match_id in self._matches
+
+    def get(self, match_id):
+        return self._matches.get(match_id)
+
+    def start(self, match_id, team1, team2, max_overs=20):
+        with self._lock:
+            if match_id not in self._matches:
+                self._matches[match_id] = MatchScorer(match_id, team1, team2, max_overs)
+            return self._matches[match_id]
+
+    def live(self):
+        return [scorer for scorer in self._matches.values() if scorer.innings and not scorer.complete]
@@ -0,0 +1,589 @@
+"""In-memory search indexes for Sportsphere.
+
+``InvertedIndex`` is a token -> postings index with BM25 ranking and prefix
+matching, so typeahead queries like ``"jer"`` find ``"Jersey"``. It is built
+once from a frame (vectorized) and supports incremental ``add`` calls when new
+rows arrive.
+
+``TrigramIndex`` matches on character trigrams instead of whole tokens, so
+people search also tolerates typos (``"wiliams"`` finds ``"Williams"``).
+"""
+import bisect
+import math
+import re
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+import views
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Field weights for the Shop index: a hit in the product name counts more than one in the description
+PRODUCT_FIELDS = {'name': 3.0, 'category': 2.0, 'description': 1.0}
+
+# Field weights for people search over Profile
+PROFILE_FIELDS = {'name': 3.0, 'teams_joined': 2.0, 'location': 2.0, 'bio': 1.0}
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+class InvertedIndex:
+    """BM25-ranked inverted index over weighted text fields.
+
+    Postings are flat CSR arrays over the sorted vocabulary (token id ->
+    documents, weighted term frequencies and BM25 impacts, in document order),
+    with each token's ranking (best impact first) precomputed, so a one-token
+    query reads its results straight off the index. Tokens sharing a prefix
+    have consecutive ids. Short prefixes (up to ``RANKED_PREFIX`` characters)
+    with large postings get summed, ranked lists of their own.
+
+    Documents added later go to a small pending segment, scored at query
+    time, that is merged in once it reaches ``COMPACT_SIZE`` postings;
+    compacted impacts use the collection statistics as of the last merge.
+    """
+
+    # Query results kept per index; typeahead reruns repeat the same few queries
+    RESULT_CACHE_SIZE = 256
+    COMPACT_SIZE = 50_000
+    # A prefix matching more tokens than this uses only its most frequent ones (like a search engine's
+    # max_expansions), so a short prefix never sums hundreds of posting lists
+    MAX_EXPANSIONS = 64
+    RANKED_PREFIX = 2
+
+    def __init__(self, field_weights, k1=1.2, b=0.75):
+        self.field_weights = dict(field_weights)
+        self.k1 = k1
+        self.b = b
+        self.keys = []  # Document number -> caller's key (e.g. row position)
+        self._lengths = []  # Weighted token count per document
+        self._total_length = 0.0
+        self._vocab = []  # Sorted compacted tokens; a token's id is its position
+        self._offsets = np.zeros(1, dtype=np.int64)  # CSR over token ids
+        self._docs = np.empty(0, dtype=np.int32)
+        self._tfs = np.empty(0, dtype=np.float32)
+        self._impacts = np.empty(0, dtype=np.float32)  # BM25 score of each posting
+        self._ranked = np.empty(0, dtype=np.int32)  # Positions of each token's postings, best first
+        self._prefixes = {}  # Short prefix -> slice of the prefix arrays (the same layout as the postings)
+        self._prefix_docs = np.empty(0, dtype=np.int32)
+        self._prefix_scores = np.empty(0, dtype=np.float32)
+        self._prefix_ranked = np.empty(0, dtype=np.int32)
+        self._pending = {}  # token -> ([docs], [weighted term frequencies]) added since the last compaction
+        self._pending_vocab = []  # Sorted tokens of the pending segment
+        self._pending_size = 0
+        self._results = OrderedDict()  # LRU of recent query results; cleared by add()
+        self._length_array = None
+        self._key_array = None
+
+    def __len__(self):
+        return len(self.keys)
+
+    @classmethod
+    def from_frame(cls, df, field_weights, **kwargs):
+        """Bulk-builds an index whose keys are the row positions of ``df``.
+
+        Each distinct value of a field is tokenized once, so categorical and
+        repeated values cost one tokenization however many rows share them.
+        """
+        index = cls(field_weights, **kwargs)
+        n = len(df)
+        index.keys = list(range(n))
+        index._key_array = np.arange(n)
+        fields = [(_field_values(df[field]), weight) for field, weight in index.field_weights.items()]
+        counted = [[_count_tokens(value) for value in distinct] for (_, _, distinct), _ in fields]
+        index._vocab = sorted({token for values in counted for counts in values for token in counts})
+        token_ids = {token: token_id for token_id, token in enumerate(index._vocab)}
+        token_parts, doc_parts, tf_parts = [], [], []
+        for ((docs, codes, _), weight), values in zip(fields, counted):
+            sizes = np.array([len(counts) for counts in values], dtype=np.int64)
+            total = int(sizes.sum())
+            flat_tokens = np.fromiter((token_ids[token] for counts in values for token in counts), np.int64, total)
+            flat_tfs = np.fromiter((tf for counts in values for tf in counts.values()), np.float32, total)
+            starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+            # Every (doc, value) occurrence expands to the value's tokens
+            repeats = sizes[codes]
+            occurrence = np.repeat(starts[codes] - np.concatenate([[0], np.cumsum(repeats)[:-1]]), repeats)
+            occurrence += np.arange(int(repeats.sum()))
+            token_parts.append(flat_tokens[occurrence])
+            doc_parts.append(np.repeat(docs, repeats))
+            tf_parts.append(flat_tfs[occurrence] * np.float32(weight))
+        # The same token in several fields of a document is one posting with the weights summed
+        tokens, docs, tfs = _sum_pairs(np.concatenate(token_parts), np.concatenate(doc_parts), max(n, 1),
+                                       np.concatenate(tf_parts))
+        lengths = np.bincount(docs, weights=tfs, minlength=n)
+        index._lengths = lengths.tolist()
+        index._total_length = float(lengths.sum())
+        index._set_postings(tokens, docs, tfs)
+        return index
+
+    def _set_postings(self, tokens, docs, tfs):
+        """Stores postings (sorted by token id, then document) as CSR arrays, scoring and ranking them."""
+        n_docs = max(len(self.keys), 1)
+        lengths = np.asarray(self._lengths, dtype=np.float64)
+        avg_length = self._total_length / n_docs or 1.0
+        self._offsets = np.searchsorted(tokens, np.arange(len(self._vocab) + 1))
+        doc_freq = np.diff(self._offsets)
+        idf = np.log(1 + (n_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+        norm = self.k1 * (1 - self.b + self.b * lengths[docs] / avg_length)
+        self._docs = docs.astype(np.int32)
+        self._tfs = tfs.astype(np.float32)
+        self._impacts = (idf[tokens] * tfs * (self.k1 + 1) / (tfs + norm)).astype(np.float32)
+        # Per token: best first, ties in document order
+        self._ranked = np.lexsort((-self._impacts, tokens)).astype(np.int32)
+        self._rank_prefixes(tokens)
+
+    def _rank_prefixes(self, posting_tokens):
+        """Sums and ranks the postings of each prefix of up to ``RANKED_PREFIX`` characters that matches
+        several tokens with more than an eighth as many postings as there are documents."""
+        n_docs = max(len(self.keys), 1)
+        prefixes, token_parts, doc_parts, score_parts = [], [], [], []
+        for length in range(1, self.RANKED_PREFIX + 1):
+            # Each token's prefix of this length (tokens shorter than it have none)
+            distinct, prefix_of, n_tokens = np.unique(
+                [token[:length] if len(token) >= length else '' for token in self._vocab],
+                return_inverse=True, return_counts=True)
+            postings = np.bincount(prefix_of, weights=np.diff(self._offsets), minlength=len(distinct))
+            keep = (n_tokens > 1) & (distinct != '') & (postings * 8 >= n_docs)
+            wanted = keep[prefix_of][posting_tokens]
+            # Numbered after the prefixes kept so far, so every prefix's postings end up contiguous
+            prefix_ids, docs, scores = _sum_pairs(
+                np.flatnonzero(keep).searchsorted(prefix_of[posting_tokens[wanted]]) + len(prefixes),
+                self._docs[wanted], n_docs, self._impacts[wanted].astype(np.float64))
+            prefixes += distinct[keep].tolist()
+            token_parts.append(prefix_ids)
+            doc_parts.append(docs)
+            score_parts.append(scores)
+        prefix_ids = np.concatenate(token_parts)
+        bounds = np.searchsorted(prefix_ids, np.arange(len(prefixes) + 1)).tolist()
+        self._prefixes = {prefix: slice(start, stop) for prefix, start, stop in zip(prefixes, bounds, bounds[1:])}
+        self._prefix_docs = np.concatenate(doc_parts).astype(np.int32)
+        self._prefix_scores = np.concatenate(score_parts).astype(np.float32)
+        self._prefix_ranked = np.lexsort((-self._prefix_scores, prefix_ids)).astype(np.int32)
+
+    def add(self, key, fields):
+        """Indexes one new document; ``fields`` maps field name -> text."""
+        doc = len(self.keys)
+        self.keys.append(key)
+        counts = {}
+        for field, weight in self.field_weights.items():
+            for token, tf in _count_tokens(fields.get(field, '')).items():
+                counts[token] = counts.get(token, 0.0) + tf * weight
+        length = sum(counts.values())
+        self._lengths.append(length)
+        self._total_length += length
+        self._length_array = self._key_array = None
+        self._results.clear()
+        for token, tf in counts.items():
+            if token not in self._pending:
+                self._pending[token] = ([], [])
+                bisect.insort(self._pending_vocab, token)
+            docs, tfs = self._pending[token]
+            docs.append(doc)
+            tfs.append(tf)
+        self._pending_size += len(counts)
+        if self._pending_size >= self.COMPACT_SIZE:
+            self.compact()
+        return doc
+
+    def compact(self):
+        """Merges the pending segment into the CSR arrays and rescores every posting."""
+        if not self._pending:
+            return
+        vocab = sorted(set(self._vocab).union(self._pending))
+        token_ids = {token: token_id for token_id, token in enumerate(vocab)}
+        remap = np.fromiter((token_ids[token] for token in self._vocab), np.int64, len(self._vocab))
+        old_tokens = remap[np.repeat(np.arange(len(self._vocab)), np.diff(self._offsets))]
+        new_tokens = np.concatenate([np.full(len(docs), token_ids[token]) for token, (docs, _) in self._pending.items()])
+        tokens = np.concatenate([old_tokens, new_tokens])
+        docs = np.concatenate([self._docs, *(docs for docs, _ in self._pending.values())]).astype(np.int64)
+        tfs = np.concatenate([self._tfs, *(tfs for _, tfs in self._pending.values())]).astype(np.float32)
+        # Pending documents are newer than every compacted one, so a stable sort keeps each list in doc order
+        order = np.argsort(tokens, kind='stable')
+        self._vocab = vocab
+        self._pending, self._pending_vocab, self._pending_size = {}, [], 0
+        self._results.clear()
+        self._set_postings(tokens[order], docs[order], tfs[order])
+
+    def expand(self, prefix):
+        """All indexed tokens starting with ``prefix``."""
+        tokens = self._vocab[_prefix_range(self._vocab, prefix)]
+        if self._pending_vocab:
+            tokens = sorted(set(tokens).union(self._pending_vocab[_prefix_range(self._pending_vocab, prefix)]))
+        return tokens
+
+    def _token_ids(self, term):
+        """Ids of the compacted tokens the prefix ``term`` expands to (its ``MAX_EXPANSIONS`` most frequent)."""
+        tokens = _prefix_range(self._vocab, term)
+        token_ids = np.arange(tokens.start, tokens.stop)
+        if len(token_ids) > self.MAX_EXPANSIONS:
+            doc_freq = self._offsets[token_ids + 1] - self._offsets[token_ids]
+            token_ids = np.sort(token_ids[np.argpartition(-doc_freq, self.MAX_EXPANSIONS)[:self.MAX_EXPANSIONS]])
+        return token_ids
+
+    def _ranked_docs(self, term, limit):
+        """The best ``limit`` documents for ``term`` when the index has them ranked already, else None."""
+        ranked = self._prefixes.get(term)
+        if ranked is not None:
+            return self._prefix_docs[self._prefix_ranked[ranked][:limit]]
+        token_ids = self._token_ids(term)
+        if len(token_ids) == 1:
+            token_id = token_ids[0]
+            return self._docs[self._ranked[self._offsets[token_id]:self._offsets[token_id + 1]][:limit]]
+        return None
+
+    def _term_parts(self, term):
+        """``(docs, scores)`` posting lists, in document order, of the documents matching the prefix ``term``;
+        a document is in at most one list per token."""
+        ranked = self._prefixes.get(term)
+        if ranked is not None:
+            parts = [(self._prefix_docs[ranked], self._prefix_scores[ranked])]
+        else:
+            parts = [(self._docs[self._offsets[token_id]:self._offsets[token_id + 1]],
+                      self._impacts[self._offsets[token_id]:self._offsets[token_id + 1]])
+                     for token_id in self._token_ids(term).tolist()]
+        return parts + [self._pending_impacts(token)
+                        for token in self._pending_vocab[_prefix_range(self._pending_vocab, term)]]
+
+    def _merge_parts(self, parts):
+        """``(docs, scores)`` of every document in ``parts``, in document order, scores summed."""
+        if not parts:
+            return np.empty(0, dtype=np.int32), np.empty(0)
+        if len(parts) == 1:
+            return parts[0]
+        docs = np.concatenate([docs for docs, _ in parts])
+        _, docs, scores = _sum_pairs(np.zeros(len(docs), dtype=np.int64), docs, len(self.keys),
+                                     np.concatenate([scores for _, scores in parts]).astype(np.float64))
+        return docs, scores
+
+    def _lookup(self, parts, docs):
+        """Summed scores in ``parts`` of each of ``docs`` (sorted); 0 where a document isn't in any."""
+        if len(parts) == 1:
+            part_docs, part_scores = parts[0]
+            if not len(part_docs):
+                return np.zeros(len(docs))
+            found = np.minimum(np.searchsorted(part_docs, docs), len(part_docs) - 1)
+            return np.where(part_docs[found] == docs, part_scores[found], 0.0)
+        # Several lists: scatter them into an array over documents (BM25 impacts are positive)
+        totals = np.zeros(len(self.keys))
+        for part_docs, part_scores in parts:
+            totals[part_docs] += part_scores
+        return totals[docs]
+
+    def _pending_impacts(self, token):
+        """BM25 scores of the pending documents containing ``token``, with the current statistics."""
+        if self._length_array is None:
+            self._length_array = np.asarray(self._lengths, dtype=np.float64)
+        n_docs = len(self.keys)
+        avg_length = self._total_length / n_docs or 1.0
+        docs, tfs = self._pending[token]
+        docs, tfs = np.asarray(docs, dtype=np.int32), np.asarray(tfs, dtype=np.float64)
+        position = bisect.bisect_left(self._vocab, token)
+        doc_freq = len(docs)
+        if position < len(self._vocab) and self._vocab[position] == token:
+            doc_freq += int(self._offsets[position + 1] - self._offsets[position])
+        idf = math.log(1 + (n_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+        norm = self.k1 * (1 - self.b + self.b * self._length_array[docs] / avg_length)
+        return docs, idf * tfs * (self.k1 + 1) / (tfs + norm)
+
+    def search(self, query, limit=None):
+        """Keys of documents matching every query term (as a prefix), best BM25 score first.
+
+        Returns None for a query without searchable tokens, meaning "no filter".
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return None
+        cache_key = (tuple(terms), limit)
+        if cache_key in self._results:
+            self._results.move_to_end(cache_key)
+            return self._results[cache_key]
+
+        docs = self._ranked_docs(terms[0], limit) if len(terms) == 1 and not self._pending else None
+        if docs is None:
+            # Every term must match: start from the rarest term's documents and look them up in the others
+            postings = sorted((self._term_parts(term) for term in terms),
+                              key=lambda parts: sum(len(docs) for docs, _ in parts))
+            docs, totals = self._merge_parts(postings[0])
+            for parts in postings[1:]:
+                scores = self._lookup(parts, docs)
+                hit = scores > 0
+                docs, totals = docs[hit], totals[hit] + scores[hit]
+            if limit is not None and limit < len(docs):
+                top = np.argpartition(-totals, limit - 1)[:limit]
+                docs, totals = docs[top], totals[top]
+            docs = docs[np.lexsort((docs, -totals))]
+        if self._key_array is None:
+            self._key_array = np.asarray(self.keys)
+        result = self._key_array[docs].tolist()
+
+        self._results[cache_key] = result
+        if len(self._results) > self.RESULT_CACHE_SIZE:
+            self._results.popitem(last=False)
+        return result
+
+
+def _prefix_range(vocab, prefix):
+    """Slice of the sorted ``vocab`` holding the tokens that start with ``prefix``."""
+    return slice(bisect.bisect_left(vocab, prefix), bisect.bisect_left(vocab, prefix + '\uffff'))
+
+
+def _sum_pairs(groups, docs, n_docs, weights=None):
+    """Sorts ``(group, doc)`` pairs and merges duplicates, summing their weights: ``(groups, docs, sums)``."""
+    pairs = groups.astype(np.int64) * n_docs + docs
+    order = np.argsort(pairs, kind='stable')
+    pairs = pairs[order]
+    first = np.flatnonzero(np.concatenate([[True], pairs[1:] != pairs[:-1]])) if len(pairs) else order
+    sums = np.add.reduceat(weights[order], first) if len(pairs) else weights[:0]
+    groups, docs = np.divmod(pairs[first], n_docs)
+    return groups, docs, sums
+
+
+def _count_tokens(text):
+    """Token -> occurrences in ``text``."""
+    counts = {}
+    for token in tokenize(text):
+        counts[token] = counts.get(token, 0) + 1
+    return counts
+
+
+def build_product_index(shop_df):
+    """Search index over product name, category and description; keys are row positions in ``shop_df``."""
+    return InvertedIndex.from_frame(shop_df, PRODUCT_FIELDS)
+
+
+# --- Trigram search ---
+def trigrams(token, prefix=False):
+    """Trigrams of ``token`` padded like pg_trgm (two spaces before, one after), so short and partial
+    words still produce some. A ``prefix`` token (still being typed) gets no end padding."""
+    padded = f"  {token}" if prefix else f"  {token} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def _field_values(values):
+    """``(docs, codes, distinct)``: each value of a column (list items count separately) as a code into ``distinct``."""
+    if views.is_list_column(values):
+        lists = pa.array(values)
+        docs = pc.list_parent_indices(lists).to_numpy()
+        codes, distinct = pd.factorize(pc.list_flatten(lists).to_numpy(zero_copy_only=False))
+    elif isinstance(values.dtype, pd.CategoricalDtype):
+        docs, codes, distinct = np.arange(len(values)), values.cat.codes.to_numpy(), values.cat.categories
+    else:
+        codes, distinct = pd.factorize(values.to_numpy(dtype=object))
+        docs = np.arange(len(values))
+    present = codes >= 0  # Missing values have no text
+    return docs[present], codes[present], np.asarray(distinct, dtype=object)
+
+
+class TrigramIndex:
+    """Fuzzy typeahead index: documents rank by the query trigrams they contain, weighted by field.
+
+    A document needs at least ``min_similarity`` of the query's trigrams to
+    match. Postings are kept in flat CSR arrays (trigram -> documents, field);
+    documents added later go to a small pending segment that is merged in once
+    it reaches ``COMPACT_SIZE`` entries.
+    """
+
+    COMPACT_SIZE = 50_000
+    RESULT_CACHE_SIZE = 256
+    MAX_QUERY_GRAMS = 64  # Keeps packed weight sums below _HIT; typeahead queries are far shorter
+    _HIT = 1 << 16
+
+    def __init__(self, field_weights, min_similarity=0.5):
+        # Fields ordered by weight, best first; postings store the position of the best field a trigram is in
+        self.fields = sorted(field_weights, key=field_weights.get, reverse=True)
+        # Per field: one hit plus the field weight in sixteenths, summed per document by ``_match``
+        self._packed_weights = np.array([self._HIT + round(16 * field_weights[field]) for field in self.fields],
+                                        dtype=np.int32)
+        self.min_similarity = min_similarity
+        self.keys = []  # Document number -> caller's key
+        self._gram_ids = {}  # trigram -> id
+        self._offsets = np.zeros(1, dtype=np.int64)  # CSR over gram ids
+        self._docs = np.empty(0, dtype=np.int32)
+        self._field = np.empty(0, dtype=np.uint8)
+        self._pending = {}  # gram id -> ([docs], [fields]) added since the last compaction
+        self._pending_size = 0
+        self._results = OrderedDict()
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _gram_id(self, gram):
+        gram_id = self._gram_ids.get(gram)
+        if gram_id is None:
+            gram_id = self._gram_ids[gram] = len(self._gram_ids)
+        return gram_id
+
+    def _text_grams(self, text):
+        return {self._gram_id(gram) for token in tokenize(text) for gram in trigrams(token)}
+
+    @classmethod
+    def from_frame(cls, df, field_weights, key_column=None, **kwargs):
+        """Bulk-builds an index over ``df``; keys are ``df[key_column]`` (row positions if None).
+
+        Each distinct value of a field is split into trigrams once, so
+        categorical and repeated values cost one tokenization however many
+        rows share them.
+        """
+        index = cls(field_weights, **kwargs)
+        n = len(df)
+        index.keys = df[key_column].tolist() if key_column is not None else list(range(n))
+        pair_parts, field_parts = [], []
+        for position, field in enumerate(index.fields):
+            docs, codes, distinct = _field_values(df[field])
+            grams = [sorted(index._text_grams(value)) for value in distinct]
+            counts = np.array([len(value_grams) for value_grams in grams], dtype=np.int64)
+            flat = np.fromiter((gram for value_grams in grams for gram in value_grams), dtype=np.int64,
+                               count=int(counts.sum()))
+            starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+            # Every (doc, value) occurrence expands to the value's trigrams
+            repeats = counts[codes]
+            occurrence_starts = np.repeat(starts[codes] - np.concatenate([[0], np.cumsum(repeats)[:-1]]), repeats)
+            gram_of = flat[occurrence_starts + np.arange(int(repeats.sum()))]
+            pair_parts.append(gram_of * max(n, 1) + np.repeat(docs, repeats))
+            field_parts.append(np.full(len(gram_of), position, dtype=np.uint8))
+        pairs = np.concatenate(pair_parts)
+        # Fields are in weight order, so the first occurrence of a (gram, doc) pair carries its best field
+        pairs, first = np.unique(pairs, return_index=True)
+        grams, docs = np.divmod(pairs, max(n, 1))
+        index._docs = docs.astype(np.int32)
+        index._field = np.concatenate(field_parts)[first]
+        index._offsets = np.searchsorted(grams, np.arange(len(index._gram_ids) + 1))
+        return index
+
+    def add(self, key, fields):
+        """Indexes one new document; ``fields`` maps field name -> text (or a list of texts)."""
+        doc = len(self.keys)
+        self.keys.append(key)
+        best = {}
+        for position, field in reversed(list(enumerate(self.fields))):
+            values = fields.get(field)
+            for value in (values if isinstance(values, (list, tuple)) else [values]):
+                if value is not None:
+                    best.update(dict.fromkeys(self._text_grams(value), position))
+        for gram_id, position in best.items():
+            docs, positions = self._pending.setdefault(gram_id, ([], []))
+            docs.append(doc)
+            positions.append(position)
+        self._pending_size += len(best)
+        self._results.clear()
+        if self._pending_size >= self.COMPACT_SIZE:
+            self.compact()
+        return doc
+
+    def compact(self):
+        """Merges the pending segment into the CSR arrays."""
+        if not self._pending:
+            return
+        n_grams = len(self._gram_ids)
+        old_grams = np.repeat(np.arange(len(self._offsets) - 1), np.diff(self._offsets))
+        new_grams = np.concatenate([np.full(len(docs), gram_id) for gram_id, (docs, _) in self._pending.items()])
+        new_docs = np.concatenate([docs for docs, _ in self._pending.values()]).astype(np.int32)
+        new_fields = np.concatenate([positions for _, positions in self._pending.values()]).astype(np.uint8)
+        grams = np.concatenate([old_grams, new_grams])
+        # Pending documents are newer than every compacted one, so a stable sort keeps each posting list in doc order
+        order = np.argsort(grams, kind='stable')
+        self._docs = np.concatenate([self._docs, new_docs])[order]
+        self._field = np.concatenate([self._field, new_fields])[order]
+        self._offsets = np.searchsorted(grams[order], np.arange(n_grams + 1))
+        self._pending, self._pending_size = {}, 0
+
+    def _postings(self, gram_id):
+        """``(docs, fields)`` of ``gram_id`` in document order (pending documents are the newest)."""
+        docs = fields = None
+        if gram_id < len(self._offsets) - 1:
+            start, stop = self._offsets[gram_id], self._offsets[gram_id + 1]
+            docs, fields = self._docs[start:stop], self._field[start:stop]
+        pending = self._pending.get(gram_id)
+        if pending is not None:
+            pending_docs, pending_fields = np.asarray(pending[0], dtype=np.int32), np.asarray(pending[1], dtype=np.uint8)
+            if docs is None:
+                return pending_docs, pending_fields
+            docs, fields = np.concatenate([docs, pending_docs]), np.concatenate([fields, pending_fields])
+        return docs, fields
+
+    def query_grams(self, query):
+        """Distinct trigrams of ``query`` (at most ``MAX_QUERY_GRAMS``); its last token is treated as a prefix
+        still being typed."""
+        tokens = tokenize(query)
+        grams = [gram for token in tokens[:-1] for gram in trigrams(token)]
+        if tokens:
+            grams += trigrams(tokens[-1], prefix=True)
+        return list(dict.fromkeys(grams))[:self.MAX_QUERY_GRAMS]
+
+    def _match(self, postings, needed):
+        """Documents holding at least ``needed`` of the query trigrams whose ``postings`` are given,
+        with their summed field weights.
+
+        Counts go in one packed int32 per document: hits above ``_HIT``, field
+        weights (in sixteenths) below it. A match must contain at least one of
+        the ``len(postings) - needed + 1`` rarest trigrams, so only those are
+        counted over every document; the commoner ones are only looked up for
+        the candidates that produced (binary search in their doc-ordered
+        posting lists) unless the candidates outnumber them.
+        """
+        postings = sorted(postings, key=lambda posting: len(posting[0]))
+        n_seeds = len(postings) - needed + 1
+        counts = np.zeros(len(self.keys), dtype=np.int32)
+        for docs, fields in postings[:n_seeds]:
+            counts[docs] += self._packed_weights[fields]
+        candidates = np.flatnonzero(counts)
+        for docs, fields in postings[n_seeds:]:
+            if len(candidates) * 8 < len(docs):
+                found = np.minimum(np.searchsorted(docs, candidates), len(docs) - 1)
+                hit = docs[found] == candidates
+                counts[candidates[hit]] += self._packed_weights[fields[found[hit]]]
+            else:
+                counts[docs] += self._packed_weights[fields]
+        matched = candidates[counts[candidates] >= needed * self._HIT]
+        return matched, (counts[matched] & (self._HIT - 1)) / 16
+
+    def search(self, query, limit=10):
+        """Keys of the best ``limit`` matches for ``query``, best first.
+
+        Returns None for a query without searchable tokens, meaning "no filter".
+        """
+        grams = self.query_grams(query)
+        if not grams:
+            return None
+        cache_key = (tuple(grams), limit)
+        if cache_key in self._results:
+            self._results.move_to_end(cache_key)
+            return self._results[cache_key]
+
+        postings = [self._postings(self._gram_ids[gram]) for gram in grams if gram in self._gram_ids]
+        needed = max(1, math.ceil(self.min_similarity * len(grams)))
+        if len(postings) < needed:
+            candidates, scores = np.empty(0, dtype=np.int64), np.empty(0)
+        else:
+            candidates, scores = self._match(postings, needed)
+        if limit is not None and limit < len(candidates):
+            # Everything above the limit-th best score, then the earliest documents tied with it
+            # (candidates are in document order), so a longer limit extends a shorter one's results
+            threshold = -np.partition(-scores, limit - 1)[limit - 1]
+            above = np.flatnonzero(scores > threshold)
+            ties = np.flatnonzero(scores == threshold)[:limit - len(above)]
+            keep = np.concatenate([above, ties])
+            candidates, scores = candidates[keep], scores[keep]
+        # Best score first; ties in document order
+        order = np.lexsort((candidates, -scores))
+        result = [self.keys[doc] for doc in candidates[order].tolist()]
+
+        self._results[cache_key] = result
+        if len(self._results) > self.RESULT_CACHE_SIZE:
+            self._results.popitem(last=False)
+        return result
+
+
+def build_profile_index(profile_df, stats_df=None):
+    """People search over Profile name, teams, location and bio; keys are user ids.
+
+    With ``stats_df``, only players who have My Stats are indexed.
+    """
+    if stats_df is not None:
+        profile_df = profile_df[profile_df['user_id'].isin(stats_df['user_id']).to_numpy()]
+    return TrigramIndex.from_frame(profile_df, PROFILE_FIELDS, key_column='user_id')
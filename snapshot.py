@@ -0,0 +1,168 @@
+"""Columnar on-disk snapshots of the Sportsphere datasets.
+
+Each dataset is written as an uncompressed Arrow IPC (Feather v2) file so it can
+be memory-mapped: every Streamlit worker that loads the same snapshot shares the
+file's pages through the OS page cache instead of regenerating the data. List
+columns (``teams_list``, ``players_list``, ``achievements``, ...) are stored as
+native Arrow ``list<string>`` columns rather than stringified lists.
+
+Sharded generation (``generate_data.py --workers``) writes each dataset as a
+folder of ``part-NNNNN.arrow`` files, one per generation chunk; readers merge
+the parts in order.
+"""
+import json
+import os
+from datetime import datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+import schema
+
+SNAPSHOT_VERSION = 3
+MANIFEST_NAME = "manifest.json"
+
+# File name (without extension) for each dataset
+FILE_NAMES = {
+    "Feed": "feed",
+    "Cricket Scores": "cricket_scores",
+    "Multi-Sport Scores": "multi_sport_scores",
+    "Start Scoring": "start_match",
+    "Start a Tournament": "tournament",
+    "My Matches": "my_matches",
+    "My Teams": "my_teams",
+    "My Stats": "my_stats",
+    "Highlights": "highlights",
+    "Create Account": "create_account",
+    "Shop": "shop",
+    "Profile": "profile",
+    "Change Language": "language",
+    "Share App": "share_app",
+    "Help & Support": "help_support",
+    "Contact Us": "contact_us",
+}
+
+
+def dataset_path(directory, name):
+    return os.path.join(directory, f"{FILE_NAMES[name]}.arrow")
+
+
+def part_path(directory, name, part):
+    return os.path.join(directory, FILE_NAMES[name], f"part-{part:05d}.arrow")
+
+
+def _write_atomic(table, path):
+    # Write to a temp file and rename so readers never see a half-written snapshot
+    tmp_path = f"{path}.tmp"
+    feather.write_feather(table, tmp_path, compression='uncompressed')
+    os.replace(tmp_path, path)
+
+
+def write_dataset(df, directory, name):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    _write_atomic(table, dataset_path(directory, name))
+    return table
+
+
+def write_part(df, directory, name, part):
+    """Writes one chunk of a partitioned dataset; returns its manifest entry."""
+    path = part_path(directory, name, part)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    _write_atomic(table, path)
+    return {"file": os.path.relpath(path, directory), "rows": table.num_rows}
+
+
+def _schema_entry(table):
+    return {field.name: str(field.type) for field in table.schema}
+
+
+def write_snapshot(data, directory, seed, scale, chunk_rows=None):
+    """Writes every dataset plus a manifest describing how the snapshot was generated."""
+    os.makedirs(directory, exist_ok=True)
+    datasets = {}
+    for name, df in data.items():
+        table = write_dataset(df, directory, name)
+        datasets[name] = {
+            "file": os.path.basename(dataset_path(directory, name)),
+            "rows": table.num_rows,
+            "schema": _schema_entry(table),
+        }
+    return write_manifest(directory, datasets, seed, scale, chunk_rows)
+
+
+def partitioned_entry(parts):
+    """Manifest entry of a dataset written as ``parts`` (``write_part`` results, in chunk order)."""
+    return {"parts": [part["file"] for part in parts], "rows": sum(part["rows"] for part in parts)}
+
+
+def write_manifest(directory, datasets, seed, scale, chunk_rows=None):
+    manifest = {
+        "version": SNAPSHOT_VERSION,
+        "seed": seed,
+        "scale": scale,
+        "chunk_rows": chunk_rows,
+        "created_at": datetime.now().isoformat(timespec='seconds'),
+        "datasets": datasets,
+    }
+    # The manifest goes last: its presence marks the snapshot as complete
+    tmp_path = os.path.join(directory, f"{MANIFEST_NAME}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(directory, MANIFEST_NAME))
+    return manifest
+
+
+def read_manifest(directory):
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME)) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get("version") == SNAPSHOT_VERSION else None
+
+
+def read_table(directory, name, memory_map=True):
+    """Reads one dataset as an Arrow table backed by the memory-mapped file."""
+    return feather.read_table(dataset_path(directory, name), memory_map=memory_map)
+
+
+def read_parts(directory, name, manifest, memory_map=True):
+    """Arrow tables of a partitioned dataset, in chunk order."""
+    return [
+        feather.read_table(os.path.join(directory, part), memory_map=memory_map)
+        for part in manifest["datasets"][name]["parts"]
+    ]
+
+
+def _pandas_type(arrow_type):
+    # List columns stay Arrow list arrays rather than becoming one ndarray per cell
+    return pd.ArrowDtype(arrow_type) if pa.types.is_list(arrow_type) else None
+
+
+def table_to_pandas(table):
+    # split_blocks avoids consolidating numeric columns, so they can stay views of the mapped buffers.
+    # The pandas metadata is ignored: dtypes come from the Arrow types here and from ``schema`` after loading.
+    return table.to_pandas(split_blocks=True, types_mapper=_pandas_type, ignore_metadata=True)
+
+
+def read_dataset(directory, name, memory_map=True, manifest=None):
+    """One dataset with compact dtypes (see ``schema``), merging its parts if it was written sharded."""
+    manifest = manifest or read_manifest(directory)
+    if manifest is not None and "parts" in manifest["datasets"].get(name, {}):
+        frames = [schema.apply(name, table_to_pandas(table)) for table in read_parts(directory, name, manifest, memory_map)]
+        return frames[0] if len(frames) == 1 else schema.concat(frames)
+    return schema.apply(name, table_to_pandas(read_table(directory, name, memory_map)))
+
+
+def load_snapshot(directory, seed=None, scale=None):
+    """Loads all datasets from ``directory``, or returns None if no matching snapshot exists."""
+    manifest = read_manifest(directory)
+    if manifest is None:
+        return None
+    if (seed is not None and manifest["seed"] != seed) or (scale is not None and manifest["scale"] != scale):
+        return None
+    if set(manifest["datasets"]) != set(FILE_NAMES):
+        return None
+    return {name: read_dataset(directory, name, manifest=manifest) for name in FILE_NAMES}
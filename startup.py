@@ -0,0 +1,81 @@
+"""Cold-start report for the app.
+
+The first script run in a process is the cold start: the app's modules are
+imported, the dataset registry is created (and any ``SPORTSPHERE_PRELOAD``
+datasets loaded) and the first tab renders. ``begin``, ``mark`` and ``finish``
+time those phases once per process. The report is logged (at INFO) and, with
+``SPORTSPHERE_STARTUP_REPORT=<path>``, written as JSON (``benchmark.py`` reads
+it). Later runs only pay a flag check.
+
+This module is imported before anything heavy, so it sticks to the standard
+library.
+"""
+import json
+import logging
+import os
+import sys
+import time
+
+REPORT_PATH = os.environ.get("SPORTSPHERE_STARTUP_REPORT")
+
+logger = logging.getLogger(__name__)
+
+_started = None
+_last = None
+_phases = {}  # phase -> seconds
+_report = None
+
+
+def process_age():
+    """Seconds since this process started (Linux only), or None."""
+    try:
+        with open("/proc/self/stat") as f:
+            # Fields after the parenthesized command name; starttime is field 22 of the whole line
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return round(uptime - start_ticks / os.sysconf("SC_CLK_TCK"), 3)
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def begin():
+    """Starts timing the first script run; later runs are ignored."""
+    global _started, _last
+    if _started is None:
+        _started = _last = time.perf_counter()
+        _phases['before_script'] = process_age()  # Interpreter and Streamlit server startup
+
+
+def mark(phase):
+    """Ends ``phase`` of the cold start (time since the previous mark)."""
+    global _last
+    if _report is not None or _started is None:
+        return
+    now = time.perf_counter()
+    _phases[phase] = round(now - _last, 3)
+    _last = now
+
+
+def finish(phase="first_render"):
+    """Ends the cold start; logs and returns the report the first time, None afterwards."""
+    global _report
+    if _report is not None or _started is None:
+        return None
+    mark(phase)
+    _report = {
+        'phases': dict(_phases),
+        'script_seconds': round(time.perf_counter() - _started, 3),
+        'process_seconds': process_age(),  # Process start to first page rendered
+        'modules_loaded': len(sys.modules),
+    }
+    logger.info("Sportsphere cold start: %s", json.dumps(_report))
+    if REPORT_PATH:
+        with open(REPORT_PATH, "w") as f:
+            json.dump(_report, f, indent=2)
+    return _report
+
+
+def report():
+    """The cold-start report, once the first run has finished."""
+    return _report
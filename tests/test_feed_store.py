@@ -0,0 +1,56 @@
+from datetime import datetime
+
+import pandas as pd
+
+import datagen
+import feed_store
+import persistence
+import registry
+
+
+def make_store(flush_size=4):
+    df = pd.DataFrame({
+        'event_id': range(10),
+        'kind': ['a', 'b'] * 5,
+        'timestamp': pd.date_range("2024-01-01", periods=10, freq="h"),
+    })
+    return feed_store.FeedStore(df, 'timestamp', ('kind',), flush_size=flush_size)
+
+
+def test_cursor_pages_stay_stable_across_appends():
+    store = make_store()
+    rows, cursor = store.page(3)
+    seen = rows['event_id'].tolist()
+    assert seen == [9, 8, 7]
+
+    new_id = 10
+    while cursor is not None:
+        # Newer events (enough to flush the buffer) arrive at the head between page loads
+        for _ in range(3):
+            timestamp = pd.Timestamp("2024-02-01") + pd.Timedelta(minutes=new_id)
+            store.append({'event_id': new_id, 'kind': 'a', 'timestamp': timestamp})
+            new_id += 1
+        rows, cursor = store.page(3, cursor)
+        seen += rows['event_id'].tolist()
+
+    assert seen == list(range(9, -1, -1))
+    assert store.top(3)['event_id'].tolist() == [new_id - 1, new_id - 2, new_id - 3]
+    assert store.page(20, kind='b')[0]['event_id'].tolist() == [9, 7, 5, 3, 1]
+
+
+def test_committed_rows_are_appended_to_the_cached_store(tmp_path):
+    write_store = persistence.WriteStore(str(tmp_path / "records.db"))
+    data = registry.DatasetRegistry(datagen.DataGenerator(seed=42, scale=1), write_store=write_store)
+    build = lambda df: feed_store.FeedStore(df, 'timestamp')
+    store = data.derived("contact_store", ("Contact Us",), build, append=feed_store.FeedStore.extend)
+    try:
+        write_store.submit("Contact Us", {'name': "New Fan", 'email': "fan@example.com", 'message': "Hi",
+                                          'timestamp': datetime(2100, 1, 1), 'response_status': 'Pending'},
+                           existing_rows=data.generator.rows("Contact Us"))
+        write_store.flush()
+    finally:
+        write_store.close()
+
+    assert data.derived("contact_store", ("Contact Us",), build, append=feed_store.FeedStore.extend) is store
+    assert store.top(1)['name'].tolist() == ["New Fan"]
+    assert len(store) == len(data["Contact Us"])
@@ -0,0 +1,20 @@
+import pytest
+
+import fixtures
+
+
+@pytest.mark.parametrize("n_teams, knockout_stages", [
+    (4, ["Final"]),
+    (5, ["Semi-final", "Semi-final", "Final"]),
+    (6, ["Semi-final", "Semi-final", "Final"]),
+    (7, ["Semi-final", "Semi-final", "Final"]),
+])
+def test_single_group_is_followed_by_playoffs(n_teams, knockout_stages):
+    teams = [f"Team {i}" for i in range(n_teams)]
+    fixture_list = fixtures.group_stage(teams)
+    group = fixture_list[fixture_list['stage'] == fixtures.group_name(0)]
+    knockout = fixture_list[fixture_list['stage'] != fixtures.group_name(0)]
+
+    assert len(group) == n_teams * (n_teams - 1) // 2
+    assert list(knockout['stage']) == knockout_stages
+    assert knockout['round'].min() > group['round'].max()
@@ -0,0 +1,28 @@
+import pandas as pd
+
+import datagen
+import live_scores
+
+
+def test_frames_patch_only_their_own_kind():
+    gen = datagen.DataGenerator(seed=42, scale=1)
+    store = live_scores.MatchStateStore(gen.build("Cricket Scores"), gen.build("Multi-Sport Scores"))
+    cricket, multi_sport = store.frame(live_scores.CRICKET), store.frame(live_scores.MULTI_SPORT)
+    cricket_before = cricket.copy()
+    cricket_id, multi_sport_id = cricket['match_id'].iloc[0], multi_sport['match_id'].iloc[1]
+
+    store.apply_many([{'match_id': cricket_id, 'type': 'ball', 'runs': 4, 'wicket': True},
+                      {'match_id': cricket_id, 'type': 'ball', 'extras': 1, 'extras_only': True}])
+
+    assert store.versions == {live_scores.CRICKET: 2, live_scores.MULTI_SPORT: 0}
+    assert store.frame(live_scores.MULTI_SPORT) is multi_sport
+    assert store.changed_since(live_scores.CRICKET, 0) == [cricket_id]
+    assert store.changed_since(live_scores.MULTI_SPORT, 0) == []
+
+    store.apply({'match_id': multi_sport_id, 'type': 'clock', 'time_elapsed': "45:00"})
+    for kind in (live_scores.CRICKET, live_scores.MULTI_SPORT):
+        rebuilt = pd.DataFrame([match for match_id, match in store._matches.items() if store._kinds[match_id] == kind],
+                               columns=store._columns[kind])
+        pd.testing.assert_frame_equal(store.frame(kind), rebuilt)
+    # Frames handed out earlier are left as they were
+    pd.testing.assert_frame_equal(cricket, cricket_before)
@@ -0,0 +1,40 @@
+import persistence
+
+
+def test_ids_are_unique_across_stores_sharing_a_database(tmp_path):
+    path = str(tmp_path / "records.db")
+    first, second = persistence.WriteStore(path, id_block_size=4), persistence.WriteStore(path, id_block_size=4)
+    try:
+        ids = []
+        for _ in range(10):
+            ids.append(first.new_record_id("Contact Us", existing_rows=100))
+            ids.append(second.new_record_id("Contact Us", existing_rows=100))
+        ids += second.submit_many("Contact Us", [{'name': "Bulk"}] * 5, existing_rows=100)
+    finally:
+        first.close()
+        second.close()
+
+    assert len(set(ids)) == len(ids) == 25
+    assert min(ids) == "CONT_0101"  # Never clashes with the generated rows
+
+
+def test_records_survive_a_restart(tmp_path):
+    path = str(tmp_path / "records.db")
+    store = persistence.WriteStore(path)
+    committed = []
+    store.add_listener(lambda dataset, records: committed.extend(records))
+    ids = [store.submit("Contact Us", {'name': f"Fan {i}", 'message': "Hi"}) for i in range(3)]
+    store.flush()
+    store.close()
+    assert [record['contact_id'] for record in committed] == ids
+
+    reopened = persistence.WriteStore(path)
+    try:
+        records = reopened.records("Contact Us")
+        next_id = reopened.new_record_id("Contact Us")
+    finally:
+        reopened.close()
+
+    assert [(record['contact_id'], record['name']) for record in records] == [
+        (record_id, f"Fan {i}") for i, record_id in enumerate(ids)]
+    assert next_id not in ids
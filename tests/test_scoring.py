@@ -0,0 +1,20 @@
+import scoring
+
+
+def test_replay_ends_innings_closed_early():
+    scorer = scoring.MatchScorer("MID_S0001", "Lions", "Tigers", max_overs=20)
+    scorer.start_innings("Lions", "A1", "A2", "B1")
+    for runs in (4, 1, 0):
+        scorer.record(runs)
+    scorer.end_innings()
+    scorer.start_innings("Tigers", "B1", "B2", "A1")
+    scorer.record(3)
+    scorer.end_innings()
+
+    replayed = scoring.MatchScorer.replay("MID_S0001", "Lions", "Tigers", 20, scorer.log.deliveries,
+                                          scorer.players, batting_first="Lions")
+
+    assert replayed.complete
+    assert [(i.runs, i.balls) for i in replayed.innings] == [(5, 3), (3, 1)]
+    assert replayed.result() == scorer.result() == "Lions won by 2 runs"
+    assert list(scorer.deliveries()['extra']) == ['', '', '', "Innings closed", '', "Innings closed"]
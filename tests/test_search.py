@@ -0,0 +1,60 @@
+import time
+
+import pandas as pd
+
+import datagen
+import search
+
+FIELDS = {'name': 3.0, 'description': 1.0}
+
+PRODUCTS = pd.DataFrame({
+    'name': ["Pro Cricket Bat", "Cricket Ball", "Running Shoes", "Bat Grip", "Jersey"],
+    'description': ["Willow bat for pros", "Leather ball", "Light shoes for running",
+                    "Grip tape for any bat handle, bat bat", "Team jersey"],
+})
+
+
+def test_bm25_ranks_name_hits_and_rare_terms_first():
+    index = search.InvertedIndex.from_frame(PRODUCTS, FIELDS)
+
+    # "bat" in the name outweighs repeats in the description; the shorter name ranks first
+    assert index.search("bat") == [3, 0]
+    # Every term must match, and the rarer term decides the order
+    assert index.search("cricket bat") == [0]
+    assert index.search("zzz") == []
+    assert index.search("") is None  # No filter
+
+
+def test_prefix_matches_every_token_with_that_prefix():
+    index = search.InvertedIndex.from_frame(PRODUCTS, FIELDS)
+
+    assert set(index.search("jer")) == {4}
+    assert set(index.search("r")) == {2}  # "running" only; tokens must start with the prefix
+    assert set(index.search("b")) == {0, 1, 3}  # "bat", "ball"
+    assert index.search("b", limit=2) == index.search("b")[:2]
+
+
+def test_compaction_matches_a_fresh_build():
+    index = search.InvertedIndex.from_frame(PRODUCTS, FIELDS)
+    index.add(5, {'name': "Bat Bag", 'description': "Holds a bat"})
+    assert set(index.search("bat")) == {0, 3, 5}
+    assert index.search("bag holds") == [5]
+    index.compact()
+
+    rebuilt = search.InvertedIndex.from_frame(
+        pd.concat([PRODUCTS, pd.DataFrame({'name': ["Bat Bag"], 'description': ["Holds a bat"]})],
+                  ignore_index=True), FIELDS)
+    for query in ("bat", "ba", "b", "bag holds"):
+        assert index.search(query) == rebuilt.search(query)
+
+
+def test_cold_short_prefix_query_is_fast():
+    shop = datagen.DataGenerator(scale=200).build("Shop")  # 20k products
+    index = search.build_product_index(shop)
+
+    for query in ("e", "de", "pro bat"):
+        start = time.perf_counter()
+        results = index.search(query, limit=20)
+        elapsed = time.perf_counter() - start
+        assert len(results) == 20
+        assert elapsed < 0.25, f"{query!r} took {elapsed:.3f}s"
@@ -0,0 +1,128 @@
+"""Per-session cache of filtered views over the shared datasets.
+
+Every widget interaction reruns the whole script, so a tab would otherwise
+re-filter its dataset on each rerun. ``ViewCache`` memoizes the filtered frame
+under ``(view, version, filters)``: the version is the source dataset's
+(``DatasetRegistry.versions``, ``MatchStateStore.versions``), so a write that
+changes the dataset also changes the key and the old views are dropped.
+
+Views are row subsets of the base frame; an unfiltered view is the base frame
+itself and is never copied or cached.
+"""
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+ANY = 'All'  # Filter value meaning "don't filter on this column", as shown in the selectboxes
+
+
+def filter_rows(df, filters):
+    """Rows of ``df`` matching every ``column -> value`` in ``filters`` (``ANY`` matches everything)."""
+    mask = None
+    for column, value in filters.items():
+        if value != ANY:
+            matches = (df[column] == value).to_numpy(dtype=bool, na_value=False)
+            mask = matches if mask is None else mask & matches
+    return df if mask is None else df[mask]
+
+
+def is_list_column(values):
+    return isinstance(values.dtype, pd.ArrowDtype) and pa.types.is_list(values.dtype.pyarrow_dtype)
+
+
+def search_mask(values, text):
+    """Boolean mask of the cells of ``values`` containing ``text`` (case-insensitive), computed per column type.
+
+    Categorical columns match their categories once and compare codes; list
+    columns match the flattened items and map hits back to their rows.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = pd.Series(values.cat.categories.astype(str))
+        hits = np.flatnonzero(categories.str.contains(text, case=False, regex=False).to_numpy())
+        return np.isin(values.cat.codes.to_numpy(), hits)
+    if is_list_column(values):
+        lists = pa.array(values)
+        matches = pc.match_substring(pc.list_flatten(lists), text, ignore_case=True).fill_null(False)
+        mask = np.zeros(len(lists), dtype=bool)
+        mask[pc.filter(pc.list_parent_indices(lists), matches).to_numpy()] = True
+        return mask
+    if pd.api.types.is_datetime64_any_dtype(values):
+        values = values.dt.strftime('%Y-%m-%d %H:%M:%S')
+    return values.astype('string').str.contains(text, case=False, regex=False).to_numpy(dtype=bool, na_value=False)
+
+
+def sorted_positions(values, ascending=True):
+    """Row positions ordering ``values`` (stable, missing values last; categoricals by value, not code)."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = values.cat.categories
+        ranks = np.argsort(np.argsort(categories.to_numpy(), kind='stable'), kind='stable')
+        codes = values.cat.codes.to_numpy()
+        keys = np.where(codes >= 0, ranks[codes], -1)
+        if not ascending:
+            keys = len(categories) - 1 - keys
+        keys = np.where(codes >= 0, keys, len(categories))  # Missing values last either way
+        return np.argsort(keys, kind='stable')
+    order = values.reset_index(drop=True).sort_values(ascending=ascending, kind='stable', na_position='last')
+    return order.index.to_numpy()
+
+
+def frame_bytes(view):
+    if isinstance(view, np.ndarray):
+        return view.nbytes
+    # Shallow size: object cells count as pointers, but the cached columns are mostly categorical/Arrow
+    return int(view.memory_usage(index=True, deep=False).sum())
+
+
+class ViewCache:
+    """LRU of filtered frames (or row positions) keyed by (view, source version, filters), bounded by entries and bytes."""
+
+    def __init__(self, max_entries=32, max_bytes=64 * 2**20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # (view, version, filters) -> (frame, bytes)
+        self._bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, view, version, filters, build, base=None):
+        """The cached result of ``build()`` for this view, version and filter tuple, building it on a miss.
+
+        A result that is ``base`` itself (nothing filtered out) is returned as-is and not cached.
+        """
+        key = (view, version, filters)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        self._drop_stale(view, version)
+        frame = build()
+        if frame is base:
+            return frame
+        size = frame_bytes(frame)
+        if size <= self.max_bytes:
+            self._entries[key] = (frame, size)
+            self._bytes += size
+            self._evict()
+        return frame
+
+    def _drop_stale(self, view, version):
+        """Views built from an older version of the same source can never be hit again."""
+        for key in [key for key in self._entries if key[0] == view and key[1] != version]:
+            self._bytes -= self._entries.pop(key)[1]
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0